@@ -1,6 +1,7 @@
 import os
 
 import django
+from django.core.management import call_command
 
 os.environ.setdefault(
     'DJANGO_SETTINGS_MODULE',
@@ -8,7 +9,7 @@ os.environ.setdefault(
 )
 django.setup()
 
-from crosschain_backend.consts import FULL_ABI
+from crosschain_backend.abi import FULL_ABI
 
 
 if __name__ == "__main__":
@@ -187,10 +188,14 @@ if __name__ == "__main__":
             type=contract_data['type'],
             title=contract_data['title'],
             address=contract_data['address'],
-            abi=contract_data['abi'],
             network=Network.displayed_objects.get(
                 title__iexact=contract_data['network'],
             ),
             hash_of_creation=contract_data['hash_of_creation'],
             blockchain_number=contract_data['blockchain_number'],
+            defaults={
+                'abi': contract_data['abi'],
+            },
         )
+
+    call_command('create_contract_scanners')
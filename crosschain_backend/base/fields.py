@@ -0,0 +1,101 @@
+from django.core.exceptions import EmptyResultSet, ValidationError
+from django.db.models import BinaryField
+from django.db.models.lookups import FieldGetDbPrepValueMixin, Lookup
+from eth_utils import remove_0x_prefix
+
+
+class HexBytesField(BinaryField):
+    """
+    Field which stores hashes and addresses as bytes, and returns them as
+    lowercase hex strings with "0x" prefix.
+
+    Accepts HexBytes, bytes and hex strings with or without "0x" prefix.
+    Empty value is returned as empty string.
+    """
+
+    description = 'Hex string stored as bytes'
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault('editable', True)
+
+        super().__init__(*args, **kwargs)
+
+    @staticmethod
+    def _to_bytes(value) -> bytes:
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return bytes(value)
+
+        try:
+            return bytes.fromhex(remove_0x_prefix(value))
+        except (TypeError, ValueError):
+            raise ValidationError(
+                f'\"{value}\" value must be a hex string or bytes.',
+                code='invalid',
+            )
+
+    @staticmethod
+    def _to_hex(value: bytes) -> str:
+        if not value:
+            return ''
+
+        return f'0x{value.hex()}'
+
+    def get_prep_value(self, value):
+        if value is None:
+            return value
+
+        return self._to_bytes(value)
+
+    def get_default(self):
+        return self.to_python(super().get_default())
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+
+        return self._to_hex(bytes(value))
+
+    def to_python(self, value):
+        if value is None:
+            return value
+
+        return self._to_hex(self._to_bytes(value))
+
+    def pre_save(self, model_instance, add):
+        value = self.to_python(getattr(model_instance, self.attname))
+        setattr(model_instance, self.attname, value)
+
+        return value
+
+    def value_to_string(self, obj):
+        return self.value_from_object(obj) or ''
+
+
+@HexBytesField.register_lookup
+class HexBytesIExact(FieldGetDbPrepValueMixin, Lookup):
+    """
+    Hex strings are converted to bytes, so case-insensitive lookup is the
+    same as the exact one.
+    """
+
+    lookup_name = 'iexact'
+    is_not_hex = False
+
+    def get_prep_lookup(self):
+        try:
+            return super().get_prep_lookup()
+        except ValidationError:
+            # Not hex string doesn't match any value, e.g. search term of
+            # admin which is looked up in every search field
+            self.is_not_hex = True
+
+            return self.rhs
+
+    def as_sql(self, compiler, connection):
+        if self.is_not_hex:
+            raise EmptyResultSet
+
+        lhs_sql, lhs_params = self.process_lhs(compiler, connection)
+        rhs_sql, rhs_params = self.process_rhs(compiler, connection)
+
+        return f'{lhs_sql} = {rhs_sql}', (*lhs_params, *rhs_params)
@@ -31,6 +31,7 @@ class AbstractBaseModel(Model):
     _created_at = DateTimeField(
         auto_now_add=True,
         verbose_name='Created at',
+        db_index=True,
     )
     _updated_at = DateTimeField(
         auto_now=True,
@@ -53,3 +53,14 @@ def bytes_to_base58(string: str):
         return string
 
     return base58.b58encode(Web3.toBytes(hexstr=string)).decode('utf-8')
+
+
+def base58_to_hex(string: str):
+    """
+    Converts base58 to hexstr
+    """
+
+    if string.startswith('0x'):
+        return string
+
+    return Web3.toHex(base58.b58decode(string))
@@ -0,0 +1,46 @@
+from psycopg2 import OperationalError, extensions
+
+
+def _gevent_wait_callback(connection, timeout=None):
+    from gevent.socket import wait_read, wait_write
+
+    while 1:
+        state = connection.poll()
+
+        if state == extensions.POLL_OK:
+            break
+        elif state == extensions.POLL_READ:
+            wait_read(connection.fileno(), timeout=timeout)
+        elif state == extensions.POLL_WRITE:
+            wait_write(connection.fileno(), timeout=timeout)
+        else:
+            raise OperationalError(f'Bad result from poll: {state}')
+
+
+def is_gevent_patched() -> bool:
+    """
+    Returns True if sockets of the process are patched by gevent, e.g. in
+    Celery worker started with "-P gevent".
+    """
+
+    try:
+        from gevent.monkey import is_module_patched
+    except ImportError:
+        return False
+
+    return is_module_patched('socket')
+
+
+def make_psycopg_cooperative() -> bool:
+    """
+    Makes psycopg2 wait for the database through gevent hub, so queries of
+    one greenlet don't block others. Returns False if the process isn't
+    patched by gevent and psycopg2 is left blocking.
+    """
+
+    if not is_gevent_patched():
+        return False
+
+    extensions.set_wait_callback(_gevent_wait_callback)
+
+    return True
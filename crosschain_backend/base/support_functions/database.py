@@ -0,0 +1,33 @@
+from django.db import close_old_connections, connections
+
+# Connections inherited from the parent process. They are kept referenced,
+# because closing them, even by garbage collector, sends termination
+# message through the socket which is still used by the parent process.
+_inherited_connections = []
+
+
+def forget_inherited_connections():
+    """
+    Makes Django open new database connections in the forked process instead
+    of sharing the connections of the parent process.
+    """
+
+    for connection in connections.all():
+        if connection.connection is not None:
+            _inherited_connections.append(connection.connection)
+            connection.connection = None
+
+
+def ensure_usable_connections():
+    """
+    Health check of persistent database connections for long-running
+    processes outside of request and task cycles, e.g. scanners. Closes
+    connections which are older than CONN_MAX_AGE or broken, so they are
+    reopened by the next query.
+    """
+
+    close_old_connections()
+
+    for connection in connections.all():
+        if connection.connection is not None and not connection.is_usable():
+            connection.close()
@@ -1,5 +1,7 @@
 from functools import wraps
 from logging import exception, info
+from multiprocessing import current_process
+from sys import exit
 from time import sleep
 
 from crosschain_backend.consts import UNEXPECTED_ERROR
@@ -7,6 +9,36 @@ from notifications.models import Notifier
 from notifications.services.functions import send_error_notification
 
 
+def _report_error(exception_error: Exception, info_msg: str):
+    """
+    Logs error of process and sends error message to telegram
+    """
+
+    exception(UNEXPECTED_ERROR.format(exception_error))
+    info(info_msg)
+    try:
+        message = exception_error.args[0]
+
+        # Extract message from nested Exception
+        while isinstance(message, Exception):
+            message = message.args[0]
+    except Exception:
+        message = ''
+
+    exc_args = {
+        'message': Notifier.reformat_message(message),
+        'process': current_process().name,
+        'restart time': info_msg,
+    }
+
+    exception_error.args = [exc_args]
+
+    send_error_notification(
+        exception_error=exception_error,
+        tx_hash='',
+    )
+
+
 def auto_restart(function, timeout=15):
     """
     Decorator for blockchain scanner.
@@ -20,30 +52,33 @@ def auto_restart(function, timeout=15):
             try:
                 function(*args)
             except Exception as exception_error:
-                exception(UNEXPECTED_ERROR.format(exception_error))
-                info_msg = f'Restart after {timeout} seconds...'
-                info(info_msg)
-                try:
-                    message = exception_error.args[0]
-
-                    # Extract message from nested Exception
-                    while isinstance(message, Exception):
-                        message = message.args[0]
-                except Exception:
-                    message = ''
-
-                exc_args = {
-                    'message': Notifier.reformat_message(message),
-                    'restart time': info_msg,
-                }
-
-                exception_error.args = [exc_args]
-
-                send_error_notification(
+                _report_error(
                     exception_error=exception_error,
-                    tx_hash='',
+                    info_msg=f'Restart after {timeout} seconds...',
                 )
 
                 sleep(timeout)
 
     return wrapper
+
+
+def exit_on_error(function):
+    """
+    Decorator for blockchain scanner started by supervisor.
+    Sends error message to telegram and exits the process if some error
+    occurred, so supervisor restarts it with backoff.
+    """
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        try:
+            function(*args, **kwargs)
+        except Exception as exception_error:
+            _report_error(
+                exception_error=exception_error,
+                info_msg='Restart by supervisor after backoff...',
+            )
+
+            exit(1)
+
+    return wrapper
@@ -0,0 +1,35 @@
+from typing import Union
+
+SMAPS_ROLLUP_PATH = '/proc/{pid}/smaps_rollup'
+
+
+def get_process_memory(pid: int) -> Union[dict, None]:
+    """
+    Returns RSS, PSS and USS of process in bytes. USS is memory which is
+    freed if the process exits, PSS also includes its proportional part of
+    memory shared with other processes. Returns None if memory can't be
+    read, e.g. on other OS than Linux.
+
+    :param pid: id of process
+    """
+
+    try:
+        with open(SMAPS_ROLLUP_PATH.format(pid=pid)) as smaps_file:
+            lines = smaps_file.readlines()
+    except OSError:
+        return
+
+    values = {}
+
+    for line in lines:
+        key, _, value = line.partition(':')
+        value = value.split()
+
+        if len(value) == 2 and value[1] == 'kB':
+            values[key] = int(value[0]) * 1024
+
+    return {
+        'rss': values.get('Rss', 0),
+        'pss': values.get('Pss', 0),
+        'uss': values.get('Private_Clean', 0) + values.get('Private_Dirty', 0),
+    }
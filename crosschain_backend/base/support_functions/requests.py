@@ -1,14 +1,41 @@
 from logging import exception
-from requests import get as request_get
+from requests import Session
+from requests.adapters import HTTPAdapter
 
+from django.conf import settings
 from rest_framework.status import HTTP_200_OK
 
+from .base import TIMEOUT_REQUEST
+
+HTTP_POOL_SIZE = settings.HTTP_POOL_SIZE
+
+
+def get_pooled_session(pool_size: int = HTTP_POOL_SIZE) -> Session:
+    """
+    Returns requests session which keeps up to pool size connections
+    to each host.
+
+    :param pool_size: count of kept connections to the same host
+    """
+
+    session = Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+
+    return session
+
+
+# Connections to the same hosts are reused by all requests of the process
+session = get_pooled_session()
+
 
 def send_get_request(url, params=None):
     """
     Return HTTP GET decoded JSON response as dict.
     """
-    response = request_get(url, params=params)
+    response = session.get(url, params=params, timeout=TIMEOUT_REQUEST)
 
     if response.status_code != HTTP_200_OK:
         exception(response)
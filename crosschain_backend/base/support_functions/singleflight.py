@@ -0,0 +1,141 @@
+from asyncio import Task, ensure_future, shield
+from functools import wraps
+from threading import Event, Lock
+from typing import Callable, Hashable
+
+
+class _Call:
+    def __init__(self):
+        self.done = Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls of threads. Only one call per key is
+    in flight, other threads wait for it and share its result or error.
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = Lock()
+
+    def do(self, key: Hashable, function: Callable, *args, **kwargs):
+        """
+        Calls function or waits for the call with the same key in flight
+
+        :param key: hashable key of call
+        :param function: function which is called
+        """
+
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+
+            if is_leader:
+                call = self._calls[key] = _Call()
+
+        if not is_leader:
+            call.done.wait()
+
+            if call.error:
+                raise call.error
+
+            return call.result
+
+        try:
+            call.result = function(*args, **kwargs)
+        except BaseException as exception_error:
+            call.error = exception_error
+
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+            call.done.set()
+
+        return call.result
+
+
+class AsyncSingleFlight:
+    """
+    Coalesces concurrent identical calls of coroutines of one event loop.
+    Only one call per key is in flight, other coroutines await it and share
+    its result or error. Cancellation of a waiter doesn't cancel the call.
+    """
+
+    def __init__(self):
+        self._tasks = {}
+
+    def _forget(self, key: Hashable, task: Task):
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+
+    async def do(self, key: Hashable, function: Callable, *args, **kwargs):
+        """
+        Awaits coroutine function or the call with the same key in flight
+
+        :param key: hashable key of call
+        :param function: coroutine function which is awaited
+        """
+
+        task = self._tasks.get(key)
+
+        if task is None:
+            task = self._tasks[key] = ensure_future(function(*args, **kwargs))
+            task.add_done_callback(lambda _: self._forget(key, task))
+
+        return await shield(task)
+
+
+single_flight = SingleFlight()
+
+
+def _freeze(value):
+    """
+    Returns hashable copy of lists and dicts of call arguments
+    """
+
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+
+    if isinstance(value, dict):
+        return tuple(
+            sorted((key, _freeze(item)) for key, item in value.items())
+        )
+
+    return value
+
+
+def singleflight(get_owner_key: Callable = None):
+    """
+    Decorator for methods which coalesces concurrent calls with the same
+    arguments. Lists and dicts of arguments are compared by content, calls
+    with other unhashable arguments aren't coalesced.
+
+    :param get_owner_key: returns key of instance or class which method
+    is called, instance or class itself is used by default
+    """
+
+    def decorator(function):
+        @wraps(function)
+        def wrapped(owner, *args, **kwargs):
+            try:
+                key = (
+                    function.__qualname__,
+                    get_owner_key(owner) if get_owner_key else owner,
+                    _freeze(args),
+                    _freeze(kwargs),
+                )
+
+                hash(key)
+            except TypeError:
+                return function(owner, *args, **kwargs)
+
+            return single_flight.do(key, function, owner, *args, **kwargs)
+
+        return wrapped
+
+    return decorator
@@ -1,13 +1,32 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from django.db import connection
+from django.db.models import QuerySet
 from django.test import TestCase, override_settings
+from fakeredis import FakeRedis
 
-from crosschain_backend.consts import FULL_ABI
+from crosschain_backend.abi import FULL_ABI
 from contracts.models import Contract
+from contracts.services.abi import abi_artifacts
+from contracts.services.cache import contract_cache
 from networks.models import Network
+from networks.services.call_cache import contract_call_cache
+from networks.services.tokens import token_metadata
 
 
 @override_settings(VALIDATOR_PRIVATE_KEY="e7f76474dcedbd059dfa63c0bcf1ea2d93af0927d7363e6df8a726477d15fd06")
 class BaseTestCase(TestCase):
     def setUp(self):
+        contract_cache.client = FakeRedis()
+        contract_call_cache.clear()
+        token_metadata.clear()
+
+        abi_artifacts_dir = TemporaryDirectory()
+        self.addCleanup(abi_artifacts_dir.cleanup)
+        abi_artifacts.directory = Path(abi_artifacts_dir.name)
+        abi_artifacts.clear()
+
         bsc_network = Network.displayed_objects.create(
             title='binance-smart-chain',
             rpc_url_list=[
@@ -41,3 +60,16 @@ class BaseTestCase(TestCase):
             blockchain_number=2,
             abi=FULL_ABI,
         )
+
+    @staticmethod
+    def get_query_plan(queryset: QuerySet) -> str:
+        """
+        Returns query plan of the queryset. Sequential scans are disabled,
+        because they are cheaper than index ones for small test tables.
+        """
+
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute('SET enable_seqscan = off;')
+
+        return queryset.explain()
@@ -1,9 +1,39 @@
 from django.contrib.admin import ModelAdmin, register
 
-from .models import Contract
+from .models import Abi, Contract, ContractScanner
 
 
 # Register your models here.
+@register(Abi)
+class AbiModelAdmin(ModelAdmin):
+    fields = (
+        'hash',
+        'abi',
+        '_is_displayed',
+    )
+    list_display = (
+        'id',
+        'hash',
+        '_created_at',
+        '_is_displayed',
+    )
+    search_fields = (
+        '=id',
+        '=hash',
+    )
+    ordering = (
+        '-_created_at',
+    )
+    empty_value_display = '-empty-'
+
+    def get_readonly_fields(self, request, obj=None):
+        # Contracts refer to ABI by hash of its content
+        if obj:
+            return 'hash', 'abi'
+
+        return 'hash',
+
+
 @register(Contract)
 class ContractModelAdmin(ModelAdmin):
     fields = (
@@ -11,7 +41,7 @@ class ContractModelAdmin(ModelAdmin):
         'type',
         'address',
         'network',
-        'abi',
+        'abi_record',
         'blockchain_number',
         'hash_of_creation',
         '_is_displayed',
@@ -46,4 +76,53 @@ class ContractModelAdmin(ModelAdmin):
     empty_value_display = '-empty-'
     autocomplete_fields = (
         'network',
+        'abi_record',
+    )
+
+
+@register(ContractScanner)
+class ContractScannerModelAdmin(ModelAdmin):
+    fields = (
+        'name',
+        'contract',
+        'start_block',
+        'state',
+        'pid',
+        'restarts_count',
+        'state_changed_at',
+        '_is_displayed',
+    )
+    readonly_fields = (
+        'state',
+        'pid',
+        'restarts_count',
+        'state_changed_at',
+    )
+    list_display = (
+        'id',
+        'name',
+        'contract',
+        'start_block',
+        'state',
+        'pid',
+        'restarts_count',
+        'state_changed_at',
+        '_is_displayed',
+    )
+    list_filter = (
+        'state',
+        'contract__network__title',
+        '_is_displayed',
+    )
+    search_fields = (
+        '=id',
+        'name',
+        'contract__address',
+    )
+    ordering = (
+        'name',
+    )
+    empty_value_display = '-empty-'
+    autocomplete_fields = (
+        'contract',
     )
@@ -0,0 +1,131 @@
+from dataclasses import replace
+from sys import getallocatedblocks
+from time import process_time
+from tracemalloc import get_traced_memory, start, stop
+
+from django.core.management.base import BaseCommand
+from web3.datastructures import AttributeDict
+from web3.types import HexBytes
+
+from contracts.models import Contract
+from contracts.services.records import BridgeParams, ScannedLog
+
+DEFAULT_EVENTS_COUNT = 100_000
+
+
+def _get_synthetic_events(count: int) -> list:
+    return [
+        AttributeDict(
+            {
+                'args': AttributeDict(
+                    {
+                        'RBCAmountIn': 31682537311623909227789 + number,
+                        'amountSpent': 68400000000000000000,
+                    }
+                ),
+                'event': 'TransferCryptoToOtherBlockchainUser',
+                'logIndex': number % 300,
+                'transactionIndex': number % 200,
+                'transactionHash': HexBytes(number.to_bytes(32, 'big')),
+                'address': '0x70e8C8139d1ceF162D5ba3B286380EB5913098c4',
+                'blockHash': HexBytes((number // 100).to_bytes(32, 'big')),
+                'blockNumber': 14536882 + number // 100,
+            }
+        )
+        for number in range(count)
+    ]
+
+
+def _process_with_attribute_dicts(event: AttributeDict):
+    # Conversions of the handler path before typed records
+    event_data = Contract.get_event(event)
+    params = AttributeDict(
+        {
+            'original_txn_hash': event.transactionHash,
+            'blockchain_id': 2,
+            'token_out_min': 0,
+            'second_path': [event.address],
+            'new_address': event.address,
+            'transit_token_amount_in': event.args.RBCAmountIn,
+            'amount_spent': event.args.amountSpent,
+            'swap_to_crypto': False,
+            'swap_exact_for': True,
+            'contract_function': 'swapTokensToOtherBlockchain',
+        }
+    )
+    new_params = dict(params)
+    new_params['transit_token_amount_in'] = int(
+        new_params['transit_token_amount_in'] / 10 ** 12
+    )
+
+    return event_data, AttributeDict(new_params)
+
+
+def _process_with_records(event: AttributeDict):
+    log = ScannedLog.from_web3_log(event)
+    params = BridgeParams(
+        original_txn_hash=log.transaction_hash,
+        blockchain_id=2,
+        token_out_min=0,
+        second_path=(log.address,),
+        new_address=log.address,
+        transit_token_amount_in=log.args['RBCAmountIn'],
+        amount_spent=log.args['amountSpent'],
+        swap_to_crypto=False,
+        swap_exact_for=True,
+        contract_function='swapTokensToOtherBlockchain',
+    )
+
+    return log.to_json(), replace(
+        params,
+        transit_token_amount_in=int(params.transit_token_amount_in / 10 ** 12),
+    )
+
+
+class Command(BaseCommand):
+    help = (
+        'Measures CPU time and memory of processing synthetic events by '
+        'the handler path with AttributeDicts and with typed records.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--events',
+            type=int,
+            default=DEFAULT_EVENTS_COUNT,
+            help='Count of synthetic events.',
+        )
+
+    def _measure(self, name: str, process, events: list):
+        started_at = process_time()
+
+        for event in events:
+            process(event)
+
+        cpu_time = process_time() - started_at
+
+        # Results are kept, so the retained blocks are counted
+        allocated_blocks = getallocatedblocks()
+        start()
+
+        results = [process(event) for event in events]
+
+        _, peak_memory = get_traced_memory()
+        stop()
+
+        retained_blocks = getallocatedblocks() - allocated_blocks
+
+        self.stdout.write(
+            f'{name}: '
+            f'{cpu_time / len(events) * 10 ** 6:.2f} us of CPU per event, '
+            f'{retained_blocks / len(events):.1f} retained blocks per event, '
+            f'{peak_memory / len(events):.0f} peak bytes per event.'
+        )
+
+        del results
+
+    def handle(self, *args, **options):
+        events = _get_synthetic_events(options['events'])
+
+        self._measure('AttributeDict', _process_with_attribute_dicts, events)
+        self._measure('Records', _process_with_records, events)
@@ -0,0 +1,87 @@
+from json import loads
+from os import environ
+from statistics import median
+from subprocess import check_output
+from sys import executable
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+DEFAULT_RUNS_COUNT = 5
+
+SETTINGS_PROFILES = (
+    'crosschain_backend.settings.base',
+    'crosschain_backend.settings.pipeline',
+)
+
+# Started in a new interpreter, so nothing is imported beforehand
+STARTUP_SCRIPT = '''
+from json import dumps
+from resource import RUSAGE_SELF, getrusage
+from sys import modules
+from time import perf_counter
+
+started_at = perf_counter()
+
+import django
+
+django.setup()
+
+import contracts.services.scanners.functions
+import validators.tasks
+
+print(
+    dumps(
+        {
+            'duration': perf_counter() - started_at,
+            'max_rss': getrusage(RUSAGE_SELF).ru_maxrss,
+            'modules': len(modules),
+        }
+    )
+)
+'''
+
+
+class Command(BaseCommand):
+    help = (
+        'Measures startup time and max RSS of scanner and worker process '
+        'with every settings profile.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--profiles',
+            nargs='+',
+            default=SETTINGS_PROFILES,
+            help='Measured settings modules.',
+        )
+        parser.add_argument(
+            '--runs',
+            type=int,
+            default=DEFAULT_RUNS_COUNT,
+            help='Count of started processes for every profile.',
+        )
+
+    def _measure(self, profile: str, runs: int):
+        results = [
+            loads(
+                check_output(
+                    (executable, '-c', STARTUP_SCRIPT),
+                    cwd=settings.BASE_DIR.parent,
+                    env={**environ, 'DJANGO_SETTINGS_MODULE': profile},
+                ).splitlines()[-1]
+            )
+            for _ in range(runs)
+        ]
+
+        self.stdout.write(
+            f'{profile}: '
+            f'{median(result["duration"] for result in results):.3f} s, '
+            f'{median(result["max_rss"] for result in results) / 1024:.1f} '
+            f'MiB of max RSS, '
+            f'{results[0]["modules"]} modules.'
+        )
+
+    def handle(self, *args, **options):
+        for profile in options['profiles']:
+            self._measure(profile, options['runs'])
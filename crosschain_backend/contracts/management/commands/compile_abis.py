@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from contracts.models import Abi
+from contracts.services.abi import CompiledAbi, abi_artifacts, get_abi_hash
+from crosschain_backend.consts import ERC20_DECIMALS_ABI
+
+
+class Command(BaseCommand):
+    help = (
+        'Compiles every distinct ABI of contracts into artifact which is '
+        'loaded by processes instead of parsing ABI again.'
+    )
+
+    def handle(self, *args, **options):
+        abis = {get_abi_hash(ERC20_DECIMALS_ABI): ERC20_DECIMALS_ABI}
+
+        for abi_hash, abi in Abi.objects.values_list('hash', 'abi').iterator():
+            abis.setdefault(abi_hash, abi)
+
+        for abi_hash, abi in abis.items():
+            compiled_abi = CompiledAbi.from_abi(abi)
+            path = abi_artifacts.save(compiled_abi)
+
+            self.stdout.write(
+                f'\"{abi_hash}\": {len(compiled_abi.selectors)} functions, '
+                f'{len(compiled_abi.events)} events, saved to \"{path}\".'
+            )
@@ -0,0 +1,100 @@
+from django.core.management.base import BaseCommand
+
+from contracts.models import Contract, ContractScanner
+
+# Scanners which were started by scanners.py before they were configured
+# in database
+DEFAULT_CONTRACT_SCANNERS = (
+    {
+        'name': 'binance-smart-chain',
+        'network': 'binance-smart-chain',
+        'contract_address': '0x70e8c8139d1cef162d5ba3b286380eb5913098c4',
+        'start_block': 14_931_351,
+    },
+    {
+        'name': 'ethereum',
+        'network': 'ethereum',
+        'contract_address': '0xd8b19613723215ef8cc80fc35a1428f8e8826940',
+        'start_block': 14_132_862,
+    },
+    {
+        'name': 'polygon',
+        'network': 'polygon',
+        'contract_address': '0xec52a30e4bfe2d6b0ba1d0dbf78f265c0a119286',
+        'start_block': 24_497_508,
+    },
+    {
+        'name': 'avalanche',
+        'network': 'avalanche',
+        'contract_address': '0x541ec7c03f330605a2176fcd9c255596a30c00db',
+        'start_block': 10_427_945,
+    },
+    {
+        'name': 'fantom',
+        'network': 'fantom',
+        'contract_address': '0xd23b4da264a756f427e13c72ab6ca5a6c95e4608',
+        'start_block': 29_878_246,
+    },
+    {
+        'name': 'moonriver',
+        'network': 'moonriver',
+        'contract_address': '0xd8b19613723215ef8cc80fc35a1428f8e8826940',
+        'start_block': 1_428_381,
+    },
+    {
+        'name': 'harmony',
+        'network': 'harmony',
+        'contract_address': '0x5681012ccc3ec5bafefac21ce4280ad7fe22bbf2',
+        'start_block': 22_519_691,
+    },
+    {
+        'name': 'arbitrum',
+        'network': 'arbitrum',
+        'contract_address': '0x5f3c8d58a01aad4f875d55e2835d82e12f99723c',
+        'start_block': 5_381_092,
+    },
+    {
+        'name': 'aurora',
+        'network': 'aurora',
+        'contract_address': '0x55be05ecc1c417b16163b000cb71dce8526a5d06',
+        'start_block': 58_819_603,
+    },
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Creates default contract scanners if none are configured. '
+        'Configured scanners are changed only in admin.'
+    )
+
+    def handle(self, *args, **options):
+        if ContractScanner.objects.exists():
+            return
+
+        for scanner_data in DEFAULT_CONTRACT_SCANNERS:
+            contract = Contract.objects \
+                .filter(
+                    address__iexact=scanner_data['contract_address'],
+                    network__title__iexact=scanner_data['network'],
+                ) \
+                .first()
+
+            if not contract:
+                self.stdout.write(
+                    f'Contract \"{scanner_data["contract_address"]}\" in '
+                    f'\"{scanner_data["network"]}\" is not found, scanner '
+                    f'\"{scanner_data["name"]}\" is skipped.'
+                )
+
+                continue
+
+            ContractScanner.objects.create(
+                name=scanner_data['name'],
+                contract=contract,
+                start_block=scanner_data['start_block'],
+            )
+
+        self.stdout.write(
+            f'{ContractScanner.objects.count()} contract scanners are created.'
+        )
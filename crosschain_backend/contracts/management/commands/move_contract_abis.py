@@ -0,0 +1,82 @@
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.db.transaction import atomic
+
+from contracts.models import Abi, Contract
+
+BACKUP_TABLE = 'contract_abis_backup'
+
+
+class Command(BaseCommand):
+    help = (
+        'Moves ABIs of contracts into table of ABIs stored once per content. '
+        'Before migration ABIs are copied from contracts to backup table, '
+        'after migration contracts are linked to ABIs by hash.'
+    )
+
+    def _get_tables(self, cursor) -> list:
+        return connection.introspection.table_names(cursor)
+
+    def _get_columns(self, cursor, table: str) -> set:
+        return {
+            column.name
+            for column in connection.introspection.get_table_description(
+                cursor,
+                table,
+            )
+        }
+
+    def handle(self, *args, **options):
+        contracts_table = Contract._meta.db_table
+
+        with atomic(), connection.cursor() as cursor:
+            tables = self._get_tables(cursor)
+
+            if contracts_table not in tables:
+                return
+
+            columns = self._get_columns(cursor, contracts_table)
+
+            if 'abi' in columns and BACKUP_TABLE not in tables:
+                cursor.execute(
+                    f'CREATE TABLE "{BACKUP_TABLE}" AS'
+                    f' SELECT id, abi FROM "{contracts_table}";'
+                )
+
+                self.stdout.write(
+                    f'ABIs of {cursor.rowcount} contracts are copied to '
+                    f'\"{BACKUP_TABLE}\".'
+                )
+
+                return
+
+            if (
+                'abi_hash' not in columns
+                or BACKUP_TABLE not in tables
+                or Abi._meta.db_table not in tables
+            ):
+                return
+
+            cursor.execute(f'SELECT id, abi FROM "{BACKUP_TABLE}";')
+
+            contract_abis = cursor.fetchall()
+            linked_contracts_count = 0
+
+            for contract_id, abi in contract_abis:
+                abi_record = Abi.get_or_create_abi(abi)
+
+                # Contracts without EVM ABI, e.g. Solana programs, stay
+                # without ABI
+                if abi_record is None:
+                    continue
+
+                linked_contracts_count += Contract.objects \
+                    .filter(id=contract_id) \
+                    .update(abi_record=abi_record)
+
+            cursor.execute(f'DROP TABLE "{BACKUP_TABLE}";')
+
+        self.stdout.write(
+            f'{linked_contracts_count} of {len(contract_abis)} contracts are '
+            f'linked to {Abi.objects.count()} ABIs.'
+        )
@@ -1,42 +1,116 @@
+from json import loads
 from logging import exception
 from typing import Union
 from uuid import UUID
 
 from django.conf import settings
 from django.db.models import (
+    BooleanField,
+    CASCADE,
     CharField,
+    DateTimeField,
     DecimalField,
+    FloatField,
     ForeignKey,
+    OneToOneField,
+    PositiveBigIntegerField,
     PositiveIntegerField,
     PROTECT,
     JSONField,
 )
+from django.utils import timezone
 from django.utils.functional import cached_property
 from web3 import Web3
 from web3.datastructures import AttributeDict
 from web3.types import HexBytes, Wei
 
 from base.models import AbstractBaseModel
+from base.support_functions.singleflight import singleflight
 from crosschain_backend.consts import (
     DEFAULT_CRYPTO_ADDRESS,
     CONTRACT_ERROR,
+    ERC20_DECIMALS_ABI,
     ETH_LIKE_HASH_LENGTH,
     MAX_WEI_DIGITS,
+    NETWORK_NAMES,
 )
 from networks.models import Network, Transaction, CustomRpcProvider
 from networks.services.functions import (
     convert_to_checksum_address_format,
     from_hex,
     convert_to_ethereum_like_address,
+    convert_to_ethereum_like_token_address,
 )
 from networks.types import HASH_LIKE
 from .exceptions import (
     ContractMultipleObjectsReturned,
     ContractNotFound,
 )
+from .services.abi import (
+    CompiledAbi,
+    abi_artifacts,
+    get_abi_hash,
+    parse_abi,
+)
+from .services.cache import shared_cached_property
+
+CONTRACT_STATE_MAX_AGE = settings.CONTRACT_STATE_MAX_AGE
 
 
 # Create your models here.
+class Abi(AbstractBaseModel):
+    """
+    ABI of contracts which is stored once for the same content
+
+    - hash - hash of ABI content
+    - abi - ABI as list
+    """
+
+    hash = CharField(
+        max_length=64,
+        verbose_name='Hash',
+        unique=True,
+    )
+    abi = JSONField(
+        verbose_name='ABI',
+    )
+
+    class Meta:
+        db_table = 'abis'
+
+    def __str__(self) -> str:
+        return f'ABI {self.hash} (id: {self.id})'
+
+    def save(self, *args, **kwargs) -> None:
+        if isinstance(self.abi, str):
+            self.abi = loads(self.abi)
+
+        self.hash = get_abi_hash(self.abi)
+
+        return super().save(*args, **kwargs)
+
+    @classmethod
+    def get_or_create_abi(cls, abi: Union[list, str]) -> Union['Abi', None]:
+        """
+        Returns stored ABI with the same content or stores a new one.
+        Empty ABIs, e.g. of Solana programs, aren't stored.
+
+        :param abi: ABI as list or JSON string
+        """
+
+        abi = parse_abi(abi)
+
+        if abi is None:
+            return
+
+        return cls.objects.get_or_create(
+            hash=get_abi_hash(abi),
+            defaults={
+                'abi': abi,
+            },
+        )[0]
+
+
 class Contract(AbstractBaseModel):
     """
     Contract model which used for work with smart-contracts in project
@@ -45,7 +119,7 @@ class Contract(AbstractBaseModel):
     - type - different types of contract
     - address - contract's address in blockchain
     - network - Network model of contract's blockchain
-    - abi - contract's abi
+    - abi_record - contract's ABI stored once for the same content
     - hash_of_creation - hash of contract's creation transaction
     - blockchain_number - number of contract which set in every other contract
     """
@@ -82,8 +156,15 @@ class Contract(AbstractBaseModel):
         related_name='network_contracts',
         verbose_name='Network',
     )
-    abi = JSONField(
+    # Rows keep only hash of ABI, which is loaded once per process
+    abi_record = ForeignKey(
+        to=Abi,
+        to_field='hash',
+        db_column='abi_hash',
+        on_delete=PROTECT,
+        related_name='abi_contracts',
         verbose_name='ABI',
+        null=True,
     )
     hash_of_creation = CharField(
         max_length=ETH_LIKE_HASH_LENGTH,
@@ -95,9 +176,11 @@ class Contract(AbstractBaseModel):
         default=0,
     )
 
+    # ABI which is stored with contract
+    _new_abi = None
+
     class Meta:
         db_table = 'contracts'
-        ordering = '-_created_at',
 
     def __str__(self) -> str:
         if not self.title:
@@ -132,6 +215,63 @@ class Contract(AbstractBaseModel):
         return provider.get_contract(
             address=address,
             abi=self.abi,
+            abi_hash=self.compiled_abi.abi_hash,
+        )
+
+    def save(self, *args, **kwargs) -> None:
+        if self._new_abi is not None:
+            Abi.get_or_create_abi(self._new_abi)
+            self._new_abi = None
+
+        return super().save(*args, **kwargs)
+
+    @property
+    def abi_hash(self) -> Union[str, None]:
+        return self.abi_record_id
+
+    @property
+    def abi(self) -> Union[list, str, None]:
+        """
+        Returns contract's ABI. It's loaded from artifact or database once
+        per process for all contracts with the same ABI.
+        """
+
+        if self._new_abi is not None:
+            return self._new_abi
+
+        if not self.abi_hash:
+            return
+
+        return self.compiled_abi.abi
+
+    @abi.setter
+    def abi(self, abi: Union[list, str, None]):
+        # Contracts without EVM ABI, e.g. Solana programs, aren't linked
+        self._new_abi = parse_abi(abi)
+        self.abi_record_id = (
+            get_abi_hash(self._new_abi)
+            if self._new_abi is not None
+            else None
+        )
+        self.__dict__.pop('compiled_abi', None)
+
+    @cached_property
+    def compiled_abi(self) -> Union[CompiledAbi, None]:
+        """
+        Returns selectors, topics and types of contract's ABI
+        """
+
+        if self._new_abi is not None:
+            return abi_artifacts.get(self._new_abi)
+
+        if not self.abi_hash:
+            return
+
+        return abi_artifacts.get_by_hash(
+            self.abi_hash,
+            get_abi=lambda: Abi.objects
+            .values_list('abi', flat=True)
+            .get(hash=self.abi_hash),
         )
 
     def contract_function_call(
@@ -302,6 +442,11 @@ class Contract(AbstractBaseModel):
         self,
         blockchain_id: int
     ):
+        state = self.get_state()
+
+        if state and str(blockchain_id) in state.crypto_fees:
+            return state.crypto_fees[str(blockchain_id)]
+
         return self.contract_function_call(
             contract_function_name='blockchainCryptoFee',
             params=(
@@ -315,14 +460,14 @@ class Contract(AbstractBaseModel):
             params=(),
         )
 
-    @cached_property
+    @shared_cached_property
     def is_paused(self) -> bool:
         return self.contract_function_call(
             contract_function_name='paused',
             params=(),
         )
 
-    @cached_property
+    @shared_cached_property
     def block_number_of_creation(self):
         if not self.hash_of_creation:
             return
@@ -342,58 +487,98 @@ class Contract(AbstractBaseModel):
 
     @cached_property
     def last_proccessed_block(self):
-        last_tx = self.network.network_transactions.filter(
-            block_number__gte=0,
-        ).latest('_created_at')
-
-        if not last_tx:
-            return
-
-        return last_tx.block_number
+        return self.network.network_transactions \
+            .order_by('-block_number') \
+            .values_list('block_number', flat=True) \
+            .first()
 
-    @cached_property
+    @shared_cached_property
     def confirmation_block_count(self) -> int:
         return self.contract_function_call(
             contract_function_name='minConfirmationBlocks',
             params=(),
         )
 
+    @shared_cached_property
+    def transit_token_decimals(self) -> Union[int, None]:
+        """
+        Returns decimals of transit token in network of contract. Transit
+        token address is taken from contract state snapshot if it exists.
+        """
+
+        if self.network.title == NETWORK_NAMES.get('solana'):
+            return
+
+        state = self.get_state()
+        transit_token_address = (
+            state.transit_token_addresses.get(str(self.blockchain_id))
+            if state
+            else None
+        ) or HexBytes(
+            self.get_transit_token_address(self.blockchain_id)
+        ).hex()
+
+        rpc_provider = CustomRpcProvider(self.network)
+
+        return rpc_provider.get_contract(
+            address=convert_to_ethereum_like_token_address(
+                token_address=transit_token_address,
+                network_name=self.network.title,
+            ),
+            abi=ERC20_DECIMALS_ABI,
+        ).functions.decimals().call()
+
     @cached_property
     def blockchain_id(self) -> int:
         if self.blockchain_number:
             return self.blockchain_number
         # return self.get_blockchain_number()
 
-    @cached_property
+    @shared_cached_property
     def max_gas_price(self) -> int:
+        state = self.get_state()
+
+        if state:
+            return int(state.max_gas_price)
+
         return self.contract_function_call(
             contract_function_name='maxGasPrice',
             params=(),
         )
 
-    @cached_property
+    @shared_cached_property
     def min_token_amount(self) -> int:
+        state = self.get_state()
+
+        if state:
+            return int(state.min_token_amount)
+
         return self.contract_function_call(
             contract_function_name='minTokenAmount',
             params=(),
         )
 
-    @cached_property
+    @shared_cached_property
     def confirmation_signatures_count(self) -> int:
         return self.contract_function_call(
             contract_function_name='minConfirmationSignatures',
             params=(),
         )
 
-    @cached_property
+    @shared_cached_property
     def router_address(self) -> str:
         return self.contract_function_call(
             contract_function_name='blockchainRouter',
             params=(),
         )
 
-    @cached_property
+    @shared_cached_property
     def fee_amount_of_blockchain(self) -> int:
+        state = self.get_state()
+
+        if state and str(self.blockchain_id) in state.fee_amounts:
+            return state.fee_amounts[str(self.blockchain_id)]
+
         return self.contract_function_call(
             contract_function_name='feeAmountOfBlockchain',
             params=(
@@ -465,6 +650,7 @@ class Contract(AbstractBaseModel):
         return contract
 
     @classmethod
+    @singleflight()
     def get_contract_by_blockchain_id(cls, blockchain_id: int):
         for contract in cls.objects.filter(type=cls.TYPE_CROSSCHAIN_ROUTING):
             if contract.blockchain_id == blockchain_id:
@@ -488,6 +674,18 @@ class Contract(AbstractBaseModel):
 
         return contract.decode_function_input(txn_data_input=txn_data_input)
 
+    def get_state(self):
+        """
+        Returns snapshot of contract state if it was refreshed recently
+        """
+
+        state = ContractState.objects.filter(contract=self).first()
+
+        if not state or state.staleness > CONTRACT_STATE_MAX_AGE:
+            return
+
+        return state
+
     @staticmethod
     def get_event(event: dict):
         event = dict(event)
@@ -506,3 +704,189 @@ class Contract(AbstractBaseModel):
                 event.update({item: item_value})
 
         return event
+
+
+class ContractState(AbstractBaseModel):
+    """
+    ContractState model which stores snapshot of routing contract
+    configuration refreshed by periodic task
+
+    - contract - Contract instance which state is stored
+    - is_paused - is contract paused
+    - max_gas_price - max gas price of contract
+    - min_token_amount - min amount of transit token for swap
+    - fee_amounts - fees of target blockchains by their numbers
+    - crypto_fees - crypto fees of target blockchains by their numbers
+    - transit_token_addresses - transit tokens of blockchains by their numbers
+    - fetch_latency - seconds spent for fetching of the state
+    - fetched_at - time when state was fetched
+    """
+
+    contract = OneToOneField(
+        to=Contract,
+        on_delete=CASCADE,
+        related_name='state',
+        verbose_name='Contract',
+    )
+    is_paused = BooleanField(
+        verbose_name='Is paused',
+        default=False,
+    )
+    max_gas_price = DecimalField(
+        max_digits=MAX_WEI_DIGITS,
+        decimal_places=0,
+        verbose_name='Max gas price',
+        default=0,
+    )
+    min_token_amount = DecimalField(
+        max_digits=MAX_WEI_DIGITS,
+        decimal_places=0,
+        verbose_name='Min token amount',
+        default=0,
+    )
+    fee_amounts = JSONField(
+        verbose_name='Fee amounts of blockchains',
+        default=dict,
+        blank=True,
+    )
+    crypto_fees = JSONField(
+        verbose_name='Crypto fees of blockchains',
+        default=dict,
+        blank=True,
+    )
+    transit_token_addresses = JSONField(
+        verbose_name='Transit token addresses of blockchains',
+        default=dict,
+        blank=True,
+    )
+    fetch_latency = FloatField(
+        verbose_name='Fetch latency',
+        default=0,
+    )
+    fetched_at = DateTimeField(
+        verbose_name='Fetched at',
+        default=timezone.now,
+    )
+
+    class Meta:
+        db_table = 'contract_states'
+
+    def __str__(self) -> str:
+        return f'State of {self.contract} at {self.fetched_at}'
+
+    @property
+    def staleness(self) -> float:
+        """
+        Returns seconds passed since state was fetched
+        """
+
+        return (timezone.now() - self.fetched_at).total_seconds()
+
+
+class ContractScanner(AbstractBaseModel):
+    """
+    ContractScanner model which configures scanner of contract's events.
+    Scanners are started, stopped and restarted by supervisor when rows
+    are changed, hidden rows aren't scanned.
+
+    - name - name of scanner process
+    - contract - Contract instance which events are scanned
+    - start_block - block number from which scanning starts
+    - state - state of scanner process set by supervisor
+    - pid - id of scanner process
+    - restarts_count - count of restarts after crashes in a row
+    - state_changed_at - time when state was set by supervisor
+    """
+
+    STATE_STOPPED = 'stopped'
+    STATE_RUNNING = 'running'
+    STATE_CRASHED = 'crashed'
+
+    STATES = (
+        (STATE_STOPPED, STATE_STOPPED.upper()),
+        (STATE_RUNNING, STATE_RUNNING.upper()),
+        (STATE_CRASHED, STATE_CRASHED.upper()),
+    )
+
+    name = CharField(
+        max_length=255,
+        verbose_name='Name',
+        unique=True,
+    )
+    contract = ForeignKey(
+        to=Contract,
+        on_delete=CASCADE,
+        related_name='contract_scanners',
+        verbose_name='Contract',
+    )
+    start_block = PositiveBigIntegerField(
+        verbose_name='Start block',
+        null=True,
+        blank=True,
+    )
+    state = CharField(
+        max_length=255,
+        verbose_name='State',
+        choices=STATES,
+        default=STATE_STOPPED,
+        editable=False,
+    )
+    pid = PositiveIntegerField(
+        verbose_name='Process id',
+        null=True,
+        editable=False,
+    )
+    restarts_count = PositiveIntegerField(
+        verbose_name='Restarts count',
+        default=0,
+        editable=False,
+    )
+    state_changed_at = DateTimeField(
+        verbose_name='State changed at',
+        null=True,
+        editable=False,
+    )
+
+    class Meta:
+        db_table = 'contract_scanners'
+
+    def __str__(self) -> str:
+        return f'Scanner {self.name} of {self.contract} (id: {self.id})'
+
+    def get_config(self) -> tuple:
+        """
+        Returns values which scanner process is started with. Process is
+        restarted if they are changed.
+        """
+
+        return (
+            self.contract.network.title,
+            self.contract.address,
+            self.start_block,
+        )
+
+    @classmethod
+    def set_state(
+        cls,
+        contract_scanner_id: UUID,
+        state: str,
+        pid: int = None,
+        restarts_count: int = 0,
+    ):
+        """
+        Sets state of scanner process without changing its configuration
+
+        :param contract_scanner_id: id of ContractScanner
+        :param state: one of ContractScanner states
+        :param pid: id of scanner process
+        :param restarts_count: count of restarts after crashes in a row
+        """
+
+        cls.objects \
+            .filter(id=contract_scanner_id) \
+            .update(
+                state=state,
+                pid=pid,
+                restarts_count=restarts_count,
+                state_changed_at=timezone.now(),
+            )
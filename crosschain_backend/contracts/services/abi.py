@@ -0,0 +1,386 @@
+from dataclasses import dataclass
+from hashlib import sha256
+from json import dumps, loads
+from logging import exception
+from os import replace
+from pathlib import Path
+from pickle import HIGHEST_PROTOCOL, dump, load
+from tempfile import NamedTemporaryFile
+from threading import Lock
+from typing import Callable, Mapping, Union
+
+from django.conf import settings
+from eth_utils import event_abi_to_log_topic, function_abi_to_4byte_selector
+from eth_utils.abi import collapse_if_tuple
+from web3._utils.abi import get_abi_input_names, map_abi_data
+from web3._utils.events import (
+    exclude_indexed_event_inputs,
+    get_event_abi_types_for_decoding,
+    get_indexed_event_inputs,
+    normalize_event_input_types,
+)
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+from web3.datastructures import AttributeDict
+from web3.exceptions import LogTopicError, MismatchedABI
+from web3.types import HexBytes
+
+from crosschain_backend.consts import CONTRACT_ERROR
+
+ABI_ARTIFACTS_DIR = settings.ABI_ARTIFACTS_DIR
+
+# Artifacts of other versions are ignored and compiled again
+ABI_ARTIFACT_VERSION = 1
+
+# Tables of ABI are compiled once per content and kept on disk, so processes
+# don't parse ABI JSON and hash signatures of functions and events again.
+
+
+def parse_abi(abi: Union[list, str, None]) -> Union[list, None]:
+    """
+    Returns ABI as list or None if it's empty or isn't a list of EVM
+    contract's ABI, e.g. of Solana program
+
+    :param abi: ABI as list or JSON string
+    """
+
+    if isinstance(abi, str):
+        try:
+            abi = loads(abi)
+        except ValueError:
+            return
+
+    if not isinstance(abi, list) or not abi:
+        return
+
+    return abi
+
+
+def get_abi_hash(abi: Union[list, str]) -> str:
+    """
+    Returns hash of ABI content which doesn't depend on formatting
+    and order of keys
+
+    :param abi: ABI as list or JSON string
+    """
+
+    if isinstance(abi, str):
+        abi = loads(abi)
+
+    return sha256(
+        dumps(abi, sort_keys=True, separators=(',', ':')).encode()
+    ).hexdigest()
+
+
+@dataclass(frozen=True)
+class CompiledEvent:
+    """
+    Topic and eth_abi types of event for decoding its logs
+    """
+
+    __slots__ = (
+        'name',
+        'topic',
+        'anonymous',
+        'topic_names',
+        'topic_types',
+        'data_names',
+        'data_types',
+    )
+
+    name: str
+    topic: bytes
+    anonymous: bool
+    topic_names: tuple
+    topic_types: tuple
+    data_names: tuple
+    data_types: tuple
+
+    def __reduce__(self):
+        # Frozen slotted dataclass can't be unpickled by setattr
+        return (
+            self.__class__,
+            tuple(getattr(self, name) for name in self.__slots__),
+        )
+
+    @classmethod
+    def from_abi(cls, event_abi: Mapping) -> 'CompiledEvent':
+        topic_inputs = get_indexed_event_inputs(event_abi)
+        data_inputs = exclude_indexed_event_inputs(event_abi)
+
+        return cls(
+            name=event_abi['name'],
+            topic=event_abi_to_log_topic(event_abi),
+            anonymous=event_abi.get('anonymous', False),
+            topic_names=tuple(get_abi_input_names({'inputs': topic_inputs})),
+            topic_types=tuple(
+                get_event_abi_types_for_decoding(
+                    normalize_event_input_types(topic_inputs)
+                )
+            ),
+            data_names=tuple(get_abi_input_names({'inputs': data_inputs})),
+            data_types=tuple(
+                get_event_abi_types_for_decoding(
+                    normalize_event_input_types(data_inputs)
+                )
+            ),
+        )
+
+    def decode(self, codec, log: Mapping) -> AttributeDict:
+        """
+        Returns event data of log in the same format as web3 event filters
+
+        :param codec: ABI codec of web3 provider
+        :param log: raw log from eth_getLogs
+        """
+
+        topics = log['topics']
+
+        if not self.anonymous:
+            if not topics:
+                raise MismatchedABI(
+                    'Expected non-anonymous event to have 1 or more topics'
+                )
+
+            if bytes(topics[0]) != self.topic:
+                raise MismatchedABI(
+                    'The event signature did not match the provided ABI'
+                )
+
+            topics = topics[1:]
+
+        if len(topics) != len(self.topic_types):
+            raise LogTopicError(
+                f'Expected {len(self.topic_types)} log topics. '
+                f'Got {len(topics)}'
+            )
+
+        data = log['data']
+
+        if isinstance(data, str):
+            data = HexBytes(data)
+
+        topic_values = map_abi_data(
+            BASE_RETURN_NORMALIZERS,
+            self.topic_types,
+            [
+                codec.decode_single(topic_type, topic)
+                for topic_type, topic in zip(self.topic_types, topics)
+            ],
+        )
+        data_values = map_abi_data(
+            BASE_RETURN_NORMALIZERS,
+            self.data_types,
+            codec.decode_abi(self.data_types, data),
+        )
+
+        return AttributeDict.recursive(
+            {
+                'args': {
+                    **dict(zip(self.topic_names, topic_values)),
+                    **dict(zip(self.data_names, data_values)),
+                },
+                'event': self.name,
+                'logIndex': log['logIndex'],
+                'transactionIndex': log['transactionIndex'],
+                'transactionHash': log['transactionHash'],
+                'address': log['address'],
+                'blockHash': log['blockHash'],
+                'blockNumber': log['blockNumber'],
+            }
+        )
+
+
+@dataclass(frozen=True)
+class CompiledAbi:
+    """
+    Selectors, topics and eth_abi types of contract's ABI. Overloaded
+    functions are represented by their first declaration.
+    """
+
+    __slots__ = (
+        'abi_hash',
+        'abi',
+        'selectors',
+        'functions',
+        'input_types',
+        'output_types',
+        'state_mutabilities',
+        'events',
+    )
+
+    abi_hash: str
+    abi: list
+    selectors: dict
+    functions: dict
+    input_types: dict
+    output_types: dict
+    state_mutabilities: dict
+    events: dict
+
+    def __reduce__(self):
+        return (
+            self.__class__,
+            tuple(getattr(self, name) for name in self.__slots__),
+        )
+
+    @classmethod
+    def from_abi(cls, abi: Union[list, str]) -> 'CompiledAbi':
+        if isinstance(abi, str):
+            abi = loads(abi)
+
+        selectors = {}
+        input_types = {}
+        output_types = {}
+        state_mutabilities = {}
+        events = {}
+
+        for item in abi:
+            item_type = item.get('type', 'function')
+            name = item.get('name')
+
+            if item_type == 'event':
+                events.setdefault(name, CompiledEvent.from_abi(item))
+            elif item_type == 'function' and name not in selectors:
+                selectors[name] = function_abi_to_4byte_selector(item)
+                input_types[name] = tuple(
+                    collapse_if_tuple(item_input)
+                    for item_input in item.get('inputs', ())
+                )
+                output_types[name] = tuple(
+                    collapse_if_tuple(item_output)
+                    for item_output in item.get('outputs', ())
+                )
+                state_mutabilities[name] = item.get('stateMutability')
+
+        return cls(
+            abi_hash=get_abi_hash(abi),
+            abi=abi,
+            selectors=selectors,
+            functions={
+                selector: name for name, selector in selectors.items()
+            },
+            input_types=input_types,
+            output_types=output_types,
+            state_mutabilities=state_mutabilities,
+            events=events,
+        )
+
+
+class AbiArtifacts:
+    """
+    Compiled ABIs of the process which are kept on disk by content hash
+    and shared by all processes.
+
+    :param directory: directory of artifacts files
+    """
+
+    def __init__(self, directory: Union[Path, str]):
+        self.directory = Path(directory)
+        self._compiled = {}
+        self._lock = Lock()
+
+    def _get_path(self, abi_hash: str) -> Path:
+        return self.directory / f'{abi_hash}.v{ABI_ARTIFACT_VERSION}.pickle'
+
+    def _load(self, abi_hash: str):
+        try:
+            with open(self._get_path(abi_hash), 'rb') as artifact_file:
+                return load(artifact_file)
+        except FileNotFoundError:
+            return
+        except Exception as exception_error:
+            exception(
+                CONTRACT_ERROR.format(
+                    f'ABI artifact \"{abi_hash}\" is not loaded: '
+                    f'{exception_error}'
+                )
+            )
+
+    def save(self, compiled_abi: CompiledAbi) -> Path:
+        """
+        Writes compiled ABI to its artifact file. Readers never see partly
+        written file, because it's replaced at once.
+
+        :param compiled_abi: CompiledAbi instance
+        """
+
+        path = self._get_path(compiled_abi.abi_hash)
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        with NamedTemporaryFile(
+            dir=self.directory,
+            suffix='.tmp',
+            delete=False,
+        ) as artifact_file:
+            dump(compiled_abi, artifact_file, protocol=HIGHEST_PROTOCOL)
+
+        replace(artifact_file.name, path)
+
+        return path
+
+    def get_by_hash(self, abi_hash: str, get_abi: Callable) -> CompiledAbi:
+        """
+        Returns compiled ABI from memory or from its artifact file. If there
+        is no artifact, ABI is received by get_abi, compiled and written.
+
+        :param abi_hash: hash of ABI content
+        :param get_abi: function which returns ABI as list or JSON string
+        """
+
+        compiled_abi = self._compiled.get(abi_hash)
+
+        if compiled_abi is not None:
+            return compiled_abi
+
+        with self._lock:
+            compiled_abi = self._compiled.get(abi_hash) or self._load(abi_hash)
+
+            if compiled_abi is None:
+                compiled_abi = CompiledAbi.from_abi(get_abi())
+
+                try:
+                    self.save(compiled_abi)
+                except OSError as exception_error:
+                    exception(CONTRACT_ERROR.format(exception_error))
+
+            self._compiled[abi_hash] = compiled_abi
+
+        return compiled_abi
+
+    def get(self, abi: Union[list, str]) -> CompiledAbi:
+        """
+        Returns compiled ABI by its content
+
+        :param abi: ABI as list or JSON string
+        """
+
+        return self.get_by_hash(get_abi_hash(abi), lambda: abi)
+
+    def preload(self) -> int:
+        """
+        Loads all artifacts of the directory into memory. Returns count of
+        loaded artifacts.
+        """
+
+        for path in self.directory.glob(f'*.v{ABI_ARTIFACT_VERSION}.pickle'):
+            abi_hash = path.name.split('.', 1)[0]
+
+            if abi_hash not in self._compiled:
+                compiled_abi = self._load(abi_hash)
+
+                if compiled_abi is not None:
+                    self._compiled[abi_hash] = compiled_abi
+
+        return len(self._compiled)
+
+    def clear(self):
+        """
+        Forgets compiled ABIs of the process, artifact files are kept
+        """
+
+        with self._lock:
+            self._compiled.clear()
+
+
+abi_artifacts = AbiArtifacts(ABI_ARTIFACTS_DIR)
@@ -0,0 +1,131 @@
+from json import dumps, loads
+from logging import exception
+from typing import Callable
+from uuid import UUID
+
+from django.conf import settings
+from redis import Redis, RedisError
+
+from crosschain_backend.consts import CACHE_ERROR
+
+CONTRACT_CACHE_URL = settings.CONTRACT_CACHE_URL
+CONTRACT_CACHE_TTLS = settings.CONTRACT_CACHE_TTLS
+DEFAULT_CONTRACT_CACHE_TTL = settings.DEFAULT_CONTRACT_CACHE_TTL
+
+DEFAULT_CACHE_SOCKET_TIMEOUT = 1
+
+
+class ContractCache:
+    """
+    Cache of contract read methods results which is shared by all processes
+    through Redis. Values are fetched without cache if Redis isn't available.
+    """
+
+    def __init__(self, url: str):
+        self._url = url
+        self._client = None
+
+    @property
+    def client(self) -> Redis:
+        if self._client is None:
+            self._client = Redis.from_url(
+                self._url,
+                socket_timeout=DEFAULT_CACHE_SOCKET_TIMEOUT,
+                socket_connect_timeout=DEFAULT_CACHE_SOCKET_TIMEOUT,
+            )
+
+        return self._client
+
+    @client.setter
+    def client(self, client: Redis):
+        self._client = client
+
+    @staticmethod
+    def _get_key(contract_id: UUID, attribute: str) -> str:
+        return f'contract:{contract_id}:{attribute}'
+
+    def get_or_set(
+        self,
+        contract_id: UUID,
+        attribute: str,
+        get_value: Callable,
+    ):
+        """
+        Returns cached value of contract attribute. If there is no value
+        in cache, it's received by get_value and cached with TTL of attribute.
+
+        :param contract_id: id of Contract instance
+        :param attribute: name of contract attribute
+        :param get_value: function which returns actual value of attribute
+        """
+
+        key = self._get_key(contract_id, attribute)
+
+        try:
+            cached_value = self.client.get(key)
+        except RedisError as exception_error:
+            exception(CACHE_ERROR.format(exception_error))
+
+            return get_value()
+
+        if cached_value is not None:
+            return loads(cached_value)
+
+        value = get_value()
+
+        try:
+            self.client.set(
+                key,
+                dumps(value),
+                ex=CONTRACT_CACHE_TTLS.get(
+                    attribute,
+                    DEFAULT_CONTRACT_CACHE_TTL,
+                ),
+            )
+        except RedisError as exception_error:
+            exception(CACHE_ERROR.format(exception_error))
+
+        return value
+
+    def invalidate(self, contract_id: UUID, *attributes: str):
+        """
+        Removes cached values of contract attributes
+
+        :param contract_id: id of Contract instance
+        :param attributes: names of contract attributes
+        """
+
+        try:
+            self.client.delete(
+                *(
+                    self._get_key(contract_id, attribute)
+                    for attribute in attributes
+                )
+            )
+        except RedisError as exception_error:
+            exception(CACHE_ERROR.format(exception_error))
+
+
+contract_cache = ContractCache(CONTRACT_CACHE_URL)
+
+
+class shared_cached_property:
+    """
+    Decorator that converts a method of Contract into a property which
+    value is cached in the shared contract cache.
+    """
+
+    def __init__(self, func: Callable):
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __get__(self, instance, cls=None):
+        if instance is None:
+            return self
+
+        return contract_cache.get_or_set(
+            contract_id=instance.id,
+            attribute=self.name,
+            get_value=lambda: self.func(instance),
+        )
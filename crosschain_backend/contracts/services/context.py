@@ -0,0 +1,73 @@
+from django.utils.functional import cached_property
+from web3.datastructures import AttributeDict
+
+from networks.models import CustomRpcProvider, Transaction
+from validators.models import SwapParams
+from ..models import Contract
+from .records import BridgeParams, ScannedLog
+
+
+class EventContext:
+    """
+    Context of one found event which is built by scanner and passed through
+    the handler path, so every fact about event is fetched only once
+
+    :param rpc_provider: custom rpc provider of source network
+    :param contract: Contract object of source network
+    :param event: event data of transaction
+    """
+
+    def __init__(
+        self,
+        rpc_provider: CustomRpcProvider,
+        contract: Contract,
+        event: AttributeDict,
+    ):
+        self.rpc_provider = rpc_provider
+        self.contract = contract
+        self.event = event
+
+    @cached_property
+    def log(self) -> ScannedLog:
+        return ScannedLog.from_web3_log(self.event)
+
+    @cached_property
+    def txn_hash(self) -> str:
+        return self.log.transaction_hash_hex
+
+    @cached_property
+    def event_data(self) -> dict:
+        """
+        Event data which is JSON serializable
+        """
+
+        return self.log.to_json()
+
+    @cached_property
+    def source_transaction(self) -> Transaction:
+        return Transaction.get_transaction(
+            network_id=self.rpc_provider.network.id,
+            txn_hash=self.txn_hash,
+        )
+
+    @cached_property
+    def swap_params(self) -> SwapParams:
+        return SwapParams.get_or_create_swap_params(
+            transaction=self.source_transaction,
+        )
+
+    @cached_property
+    def target_contract(self) -> Contract:
+        return Contract.get_contract_by_blockchain_id(
+            blockchain_id=self.swap_params.target_blockchain_id,
+        )
+
+    @cached_property
+    def params(self) -> BridgeParams:
+        """
+        Params which will be used for trade in target network
+        """
+
+        return self.swap_params.get_trade_params(
+            original_txn_hash=self.log.transaction_hash,
+        )
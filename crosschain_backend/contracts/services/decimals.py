@@ -0,0 +1,176 @@
+from logging import exception
+from threading import Lock
+from time import monotonic
+from typing import Optional
+
+from django.conf import settings
+
+from crosschain_backend.consts import CONTRACT_ERROR, DEFAULT_TOKEN_DECIMALS
+from ..models import Contract
+
+CONTRACT_BLOCKCHAIN_IDS_TOKEN_WITH_SIX_DECIMALS = settings.CONTRACT_BLOCKCHAIN_IDS_TOKEN_WITH_SIX_DECIMALS
+
+SIX_DECIMALS = 6
+# Seconds before blockchains unknown to the registry trigger reload again
+UNKNOWN_PAIR_RETRY_INTERVAL = 5 * 60
+
+
+class TransitTokenDecimalsRegistry:
+    """
+    Registry of transit tokens decimals of routing contracts. Keeps exact
+    integer scale factors for every pair of source and target blockchains,
+    so amount of transit token is scaled by one multiply or floor divide.
+    Pairs which aren't found by reload, e.g. of hidden contracts or of
+    contracts which decimals weren't read, are scaled by fallback decimals
+    until retry interval is passed.
+    """
+
+    def __init__(self):
+        self._scale_factors = {}
+        self._unknown_scale_factors = {}
+        self._lock = Lock()
+
+    @staticmethod
+    def _get_fallback_decimals(blockchain_id: int) -> int:
+        if blockchain_id in CONTRACT_BLOCKCHAIN_IDS_TOKEN_WITH_SIX_DECIMALS:
+            return SIX_DECIMALS
+
+        return DEFAULT_TOKEN_DECIMALS
+
+    def _get_decimals(self, contract: Contract) -> Optional[int]:
+        """
+        Returns decimals of transit token of contract or None if they
+        weren't read, e.g. by RPC error
+        """
+
+        try:
+            decimals = contract.transit_token_decimals
+        except Exception as exception_error:
+            exception(CONTRACT_ERROR.format(exception_error))
+
+            return None
+
+        if decimals is None:
+            return self._get_fallback_decimals(contract.blockchain_id)
+
+        return decimals
+
+    @staticmethod
+    def _get_scale_factor(source_decimals: int, target_decimals: int) -> tuple:
+        difference = target_decimals - source_decimals
+
+        if difference >= 0:
+            return 10 ** difference, 1
+
+        return 1, 10 ** -difference
+
+    def load(self):
+        """
+        Loads decimals of transit tokens of all routing contracts and
+        precomputes scale factors
+        """
+
+        with self._lock:
+            self._load()
+
+    def _load(self):
+        decimals = {}
+
+        for contract in Contract.displayed_objects \
+                .filter(type=Contract.TYPE_CROSSCHAIN_ROUTING) \
+                .select_related('network'):
+            if contract.blockchain_id is None:
+                continue
+
+            contract_decimals = self._get_decimals(contract)
+
+            # Pairs of failed contract are retried as unknown ones
+            if contract_decimals is not None:
+                decimals[contract.blockchain_id] = contract_decimals
+
+        scale_factors = {}
+
+        for source_blockchain_id, source_decimals in decimals.items():
+            for target_blockchain_id, target_decimals in decimals.items():
+                scale_factors[(source_blockchain_id, target_blockchain_id)] = (
+                    self._get_scale_factor(source_decimals, target_decimals)
+                )
+
+        self._scale_factors = scale_factors
+        self._unknown_scale_factors = {}
+
+    def get_scale_factor(
+        self,
+        source_blockchain_id: int,
+        target_blockchain_id: int,
+    ) -> tuple:
+        """
+        Returns (multiplier, divisor) pair for amount of transit token.
+        Registry is reloaded if blockchains are unknown, e.g. contract added.
+
+        :param source_blockchain_id: number of source network
+        :param target_blockchain_id: number of target network
+        """
+
+        key = (source_blockchain_id, target_blockchain_id)
+        scale_factor = self._scale_factors.get(key)
+
+        if scale_factor is not None:
+            return scale_factor
+
+        with self._lock:
+            # Registry could be reloaded by other thread while waiting
+            if key in self._scale_factors:
+                return self._scale_factors[key]
+
+            unknown_scale_factor = self._unknown_scale_factors.get(key)
+
+            if (
+                unknown_scale_factor is not None
+                and unknown_scale_factor[0] > monotonic()
+            ):
+                return unknown_scale_factor[1]
+
+            self._load()
+
+            if key in self._scale_factors:
+                return self._scale_factors[key]
+
+            scale_factor = self._get_scale_factor(
+                source_decimals=self._get_fallback_decimals(
+                    source_blockchain_id
+                ),
+                target_decimals=self._get_fallback_decimals(
+                    target_blockchain_id
+                ),
+            )
+            self._unknown_scale_factors[key] = (
+                monotonic() + UNKNOWN_PAIR_RETRY_INTERVAL,
+                scale_factor,
+            )
+
+            return scale_factor
+
+    def scale(
+        self,
+        amount: int,
+        source_blockchain_id: int,
+        target_blockchain_id: int,
+    ) -> int:
+        """
+        Converts amount of source transit token to amount of target one
+
+        :param amount: amount of transit token in source network
+        :param source_blockchain_id: number of source network
+        :param target_blockchain_id: number of target network
+        """
+
+        multiplier, divisor = self.get_scale_factor(
+            source_blockchain_id=source_blockchain_id,
+            target_blockchain_id=target_blockchain_id,
+        )
+
+        return amount * multiplier // divisor
+
+
+transit_token_decimals = TransitTokenDecimalsRegistry()
@@ -1,13 +1,15 @@
-from logging import info
+from dataclasses import replace
+from logging import exception, info
+from time import monotonic
 from typing import Union
 
 from borsh_construct import U64
 from django.conf import settings
+from django.utils import timezone
 from eth_account.messages import encode_defunct
 from eth_utils import add_0x_prefix, remove_0x_prefix
 from solana.publickey import PublicKey
 from web3 import Web3
-from web3.datastructures import AttributeDict
 from web3.types import (
     HexBytes,
     TxParams,
@@ -16,10 +18,12 @@ from web3.types import (
 
 from crosschain_backend.consts import (
     CONTRACT_ERROR,
+    CONTRACT_INFO,
     NETWORK_NAMES,
     SIGNER_INFO,
 )
-from networks.models import Transaction, CustomRpcProvider
+from networks.models import CustomRpcProvider
+from networks.services.functions import convert_to_checksum_address_format
 from networks.types import HASH_LIKE
 from ..exceptions import (
     ContractDoesNotExistsInOtherBlockChain,
@@ -27,90 +31,10 @@ from ..exceptions import (
     ContractTransactionAlreadyProcessed,
     ContractTransactionAlreadyReverted,
 )
-from ..models import Contract
-
-CONTRACT_BLOCKCHAIN_IDS_TOKEN_WITH_SIX_DECIMALS = settings.CONTRACT_BLOCKCHAIN_IDS_TOKEN_WITH_SIX_DECIMALS
-
-
-def _get_params_to_transfer_to_other_blockchain(
-    rpc_provider: CustomRpcProvider,
-    event: AttributeDict,
-    tx_hash: str = '',
-) -> AttributeDict:
-    """
-    Returns params which will be used for trade in target network
-
-    :param rpc_provider: custom rpc provider of source network
-    :param event: event data of transaction
-    :param tx_hash: hash of the source transaction
-    """
-
-    # AttributeDict(
-    #     {
-    #         'RBCAmountIn': <transit_token_amount_in:int>,
-    #         'amountSpent': <amount_spent:int>,
-    #     }
-    # ),
-    # 'event': <event_name:str>,
-    # 'logIndex': <log_index:int>,
-    # 'transactionIndex': <txn_index:int>,
-    # 'transactionHash': HexBytes(
-    #     <txn_hash:str>
-    # ),
-    # 'address': <user_address:str>,
-    # 'blockHash': HexBytes(
-    #     <block_hash:str>
-    # ),
-    # 'blockNumber': <block_number:int>
-
-    if not isinstance(event, AttributeDict):
-        event['args'] = AttributeDict(event['args'])
-        event = AttributeDict(event)
-
-    original_txn_hash = event.transactionHash
-
-    if tx_hash:
-        original_txn = Transaction.get_transaction(
-            network_id=rpc_provider.network.id,
-            txn_hash=tx_hash,
-        )
-    else:
-        original_txn = Transaction.get_transaction(
-            network_id=rpc_provider.network.id,
-            txn_hash=original_txn_hash,
-        )
-
-    blockchain_id = original_txn.data.get('params')[0]
-    amount_spent = original_txn.event_data \
-        .get('args') \
-        .get('amountSpent')
-
-    transit_token_amount_in = original_txn.event_data \
-        .get('args') \
-        .get('RBCAmountIn')
-    token_out_min = original_txn.data.get('params')[5]
-
-    new_address = original_txn.data.get('params')[6]
-    second_path = original_txn.data.get('params')[3]
-
-    swap_to_crypto = original_txn.data.get('params')[7]
-    swap_exact_for = original_txn.data.get('params')[8]
-    contract_function = original_txn.data.get('params')[-1]
-
-    return AttributeDict(
-        {
-            'original_txn_hash': original_txn_hash,
-            'blockchain_id': blockchain_id,
-            'token_out_min': token_out_min,
-            'second_path': second_path,
-            'new_address': new_address,
-            'transit_token_amount_in': transit_token_amount_in,
-            'amount_spent': amount_spent,
-            'swap_to_crypto': swap_to_crypto,
-            'swap_exact_for': swap_exact_for,
-            'contract_function': contract_function,
-        }
-    )
+from ..models import Contract, ContractState
+from .context import EventContext
+from .decimals import transit_token_decimals
+from .records import BridgeParams
 
 
 def _sign_hash(hash: HASH_LIKE) -> str:
@@ -150,7 +74,8 @@ def _check_contract_is_paused(
     :param hashed_params: hashed params, for logging
     """
 
-    contract_status = contract.is_paused
+    state = contract.get_state()
+    contract_status = state.is_paused if state else contract.is_paused
 
     if not contract_status:
         return True
@@ -214,29 +139,55 @@ def _check_is_processed_transaction(
         )
 
 
-def _transform_params(params: AttributeDict, from_contract: Contract):
+def _transform_params(context: EventContext) -> BridgeParams:
     """
     Transform transit_token_amount_in in params if has different decimals
     in both blockchains
+
+    :param context: context of the found event
     """
 
-    to_contract = Contract.get_contract_by_blockchain_id(
-        blockchain_id=params.blockchain_id,
+    params = context.params
+    transit_token_amount_in = transit_token_decimals.scale(
+        amount=params.transit_token_amount_in,
+        source_blockchain_id=context.contract.blockchain_id,
+        target_blockchain_id=context.target_contract.blockchain_id,
     )
 
-    new_params = dict(params)
+    if transit_token_amount_in == params.transit_token_amount_in:
+        return params
 
-    # TODO: Костыль с пересчетом decimals транзитных токенов.
-    if to_contract.blockchain_id in CONTRACT_BLOCKCHAIN_IDS_TOKEN_WITH_SIX_DECIMALS:
-        new_params['transit_token_amount_in'] = int(
-            new_params['transit_token_amount_in'] / 10 ** 12
-        )
-    elif from_contract.blockchain_id in CONTRACT_BLOCKCHAIN_IDS_TOKEN_WITH_SIX_DECIMALS:
-        new_params['transit_token_amount_in'] = int(
-            new_params['transit_token_amount_in'] * 10 ** 12
-        )
+    return replace(params, transit_token_amount_in=transit_token_amount_in)
+
+
+def get_hash_packed(
+    new_address: str,
+    rbc_amount_in: int,
+    original_txn_hash: HASH_LIKE,
+    blockchain_id: int,
+) -> HexBytes:
+    """
+    Hashes parameters for EVM blockchains in the same way as pure
+    'getHashPacked' method of contract, so RPC call isn't needed
+
+    :param new_address: wallet address in target network
+    :param rbc_amount_in: amount of transit token which will be used in target network
+    :param original_txn_hash: hash of the source transaction
+    :param blockchain_id: number of target network
+    """
 
-    return AttributeDict(new_params)
+    if isinstance(original_txn_hash, str):
+        original_txn_hash = Web3.toBytes(hexstr=original_txn_hash)
+
+    return Web3.solidityKeccak(
+        ['address', 'uint256', 'bytes32', 'uint256'],
+        [
+            convert_to_checksum_address_format(new_address),
+            rbc_amount_in,
+            original_txn_hash,
+            blockchain_id,
+        ]
+    )
 
 
 def get_hash_packed_solana(
@@ -275,6 +226,7 @@ def _get_signature(
     blockchain_id: int,
     new_address: str,
     transit_token_amount_in: Union[int, Wei],
+    contract: Contract = None,
 ) -> str:
     """
     Returns signature of hashed params
@@ -283,6 +235,7 @@ def _get_signature(
     :param blockchain_id: number of target network
     :param new_address: wallet address in target network
     :param transit_token_amount_in: amount of transit token which will be used in target network
+    :param contract: Contract object of target network if it's already found
     """
 
     if not all((transit_token_amount_in,)):
@@ -291,7 +244,8 @@ def _get_signature(
             'not be equal by 0.'
         )
 
-    contract = Contract.get_contract_by_blockchain_id(blockchain_id)
+    if not contract:
+        contract = Contract.get_contract_by_blockchain_id(blockchain_id)
 
     if contract.network.title == NETWORK_NAMES.get('solana'):
         hashed_params = get_hash_packed_solana(
@@ -301,11 +255,11 @@ def _get_signature(
             blockchain_id=blockchain_id,
         )
     else:
-        hashed_params = contract.get_hash_packed(
-            new_address,
-            transit_token_amount_in,
-            original_txn_hash,
-            blockchain_id,
+        hashed_params = get_hash_packed(
+            new_address=new_address,
+            rbc_amount_in=transit_token_amount_in,
+            original_txn_hash=original_txn_hash,
+            blockchain_id=blockchain_id,
         )
 
     return remove_0x_prefix(
@@ -313,3 +267,101 @@ def _get_signature(
             hash=hashed_params,
         )
     )
+
+
+def refresh_contract_state(contract: Contract, blockchain_ids: list):
+    """
+    Fetches configuration of routing contract with one batch request
+    and saves it as snapshot of contract state
+
+    :param contract: Contract instance which state is refreshed
+    :param blockchain_ids: numbers of blockchains which fees are fetched
+    """
+
+    calls = [
+        ('paused', ()),
+        ('maxGasPrice', ()),
+        ('minTokenAmount', ()),
+    ]
+
+    for blockchain_id in blockchain_ids:
+        calls.extend(
+            (
+                ('feeAmountOfBlockchain', (blockchain_id,)),
+                ('blockchainCryptoFee', (blockchain_id,)),
+                ('RubicAddresses', (blockchain_id,)),
+            )
+        )
+
+    fetch_started_at = monotonic()
+
+    results = CustomRpcProvider(contract.network).batch_contract_function_call(
+        contract=contract,
+        calls=calls,
+    )
+
+    fetch_latency = monotonic() - fetch_started_at
+    is_paused, max_gas_price, min_token_amount = results[:3]
+    blockchain_results = [results[i:i + 3] for i in range(3, len(results), 3)]
+
+    ContractState.objects.update_or_create(
+        contract=contract,
+        defaults={
+            'is_paused': is_paused,
+            'max_gas_price': max_gas_price,
+            'min_token_amount': min_token_amount,
+            'fee_amounts': {
+                blockchain_id: fee_amount
+                for blockchain_id, (fee_amount, _, _) in zip(
+                    blockchain_ids, blockchain_results,
+                )
+            },
+            'crypto_fees': {
+                blockchain_id: crypto_fee
+                for blockchain_id, (_, crypto_fee, _) in zip(
+                    blockchain_ids, blockchain_results,
+                )
+            },
+            'transit_token_addresses': {
+                blockchain_id: HexBytes(transit_token_address).hex()
+                for blockchain_id, (_, _, transit_token_address) in zip(
+                    blockchain_ids, blockchain_results,
+                )
+            },
+            'fetch_latency': fetch_latency,
+            'fetched_at': timezone.now(),
+        },
+    )
+
+    info(
+        CONTRACT_INFO.format(
+            f'State of the \"{contract.address}\" contract address was '
+            f'refreshed in {fetch_latency:.3f} seconds.'
+        )
+    )
+
+
+def refresh_contract_states():
+    """
+    Refreshes snapshots of states of all routing contracts
+    """
+
+    contracts = [
+        contract
+        for contract in Contract.displayed_objects
+        .filter(type=Contract.TYPE_CROSSCHAIN_ROUTING)
+        .select_related('network')
+        if contract.network.title != NETWORK_NAMES.get('solana')
+    ]
+    blockchain_ids = sorted(
+        {contract.blockchain_id for contract in contracts} - {None}
+    )
+
+    for contract in contracts:
+        try:
+            refresh_contract_state(
+                contract=contract,
+                blockchain_ids=blockchain_ids,
+            )
+        except Exception as exception_error:
+            exception(CONTRACT_ERROR.format(exception_error))
@@ -0,0 +1,130 @@
+from dataclasses import dataclass
+from typing import Mapping, Optional
+
+from eth_utils import remove_0x_prefix
+
+# Records are created for every found event, so they are immutable and
+# slotted, and keep hashes as raw bytes. Hashes are converted to hex strings
+# only for DB, HTTP and logs.
+
+
+def _to_bytes(value) -> bytes:
+    if isinstance(value, bytes):
+        return bytes(value)
+
+    return bytes.fromhex(remove_0x_prefix(value))
+
+
+def _to_hex(value: bytes) -> str:
+    return f'0x{value.hex()}'
+
+
+@dataclass(frozen=True)
+class ScannedLog:
+    """
+    Event log of contract found by scanner
+    """
+
+    __slots__ = (
+        'event',
+        'args',
+        'address',
+        'transaction_hash',
+        'transaction_index',
+        'log_index',
+        'block_hash',
+        'block_number',
+    )
+
+    event: str
+    args: Mapping
+    address: str
+    transaction_hash: bytes
+    transaction_index: int
+    log_index: int
+    block_hash: bytes
+    block_number: int
+
+    @classmethod
+    def from_web3_log(cls, log: Mapping) -> 'ScannedLog':
+        """
+        Creates record from web3 event log or its serialized data
+
+        :param log: web3 event log
+        """
+
+        return cls(
+            event=log['event'],
+            args=log['args'],
+            address=log['address'],
+            transaction_hash=_to_bytes(log['transactionHash']),
+            transaction_index=log['transactionIndex'],
+            log_index=log['logIndex'],
+            block_hash=_to_bytes(log['blockHash']),
+            block_number=log['blockNumber'],
+        )
+
+    @property
+    def transaction_hash_hex(self) -> str:
+        return _to_hex(self.transaction_hash)
+
+    def to_json(self) -> dict:
+        """
+        Returns event data in the same format as Contract.get_event
+        """
+
+        return {
+            'args': dict(self.args),
+            'event': self.event,
+            'logIndex': self.log_index,
+            'transactionIndex': self.transaction_index,
+            'transactionHash': self.transaction_hash_hex,
+            'address': self.address,
+            'blockHash': _to_hex(self.block_hash),
+            'blockNumber': self.block_number,
+        }
+
+
+@dataclass(frozen=True)
+class BridgeParams:
+    """
+    Params of swap which will be used for trade in target network
+    """
+
+    __slots__ = (
+        'original_txn_hash',
+        'blockchain_id',
+        'token_out_min',
+        'second_path',
+        'new_address',
+        'transit_token_amount_in',
+        'amount_spent',
+        'swap_to_crypto',
+        'swap_exact_for',
+        'contract_function',
+    )
+
+    original_txn_hash: bytes
+    blockchain_id: int
+    token_out_min: int
+    second_path: tuple
+    new_address: str
+    transit_token_amount_in: int
+    amount_spent: int
+    swap_to_crypto: bool
+    swap_exact_for: Optional[bool]
+    contract_function: str
+
+    def to_json(self) -> dict:
+        return {
+            'original_txn_hash': _to_hex(self.original_txn_hash),
+            'blockchain_id': self.blockchain_id,
+            'token_out_min': self.token_out_min,
+            'second_path': list(self.second_path),
+            'new_address': self.new_address,
+            'transit_token_amount_in': self.transit_token_amount_in,
+            'amount_spent': self.amount_spent,
+            'swap_to_crypto': self.swap_to_crypto,
+            'swap_exact_for': self.swap_exact_for,
+            'contract_function': self.contract_function,
+        }
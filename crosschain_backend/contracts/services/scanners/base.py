@@ -1,13 +1,20 @@
+from gc import enable
 from multiprocessing import Process
 from logging import info
+from signal import SIG_DFL, SIGTERM, signal
 from time import sleep
 from typing import Union
 
 from django.conf import settings
 
-from base.support_functions.decorators import auto_restart
+from base.support_functions.database import (
+    ensure_usable_connections,
+    forget_inherited_connections,
+)
+from base.support_functions.decorators import exit_on_error
 from crosschain_backend.consts import SCANNER_INFO
 from networks.models import CustomRpcProvider
+from ..context import EventContext
 from ...models import Contract
 
 
@@ -27,6 +34,8 @@ class Scanner(Process):
     :param events: list of events which need to check
     :param event_handlers: method for every type of event
     :param start_block: block number from which start scanning
+    :param bulk_event_handlers: method for every type of event which
+    handles all found events of this type at once
     """
 
     def __init__(
@@ -37,6 +46,7 @@ class Scanner(Process):
         events: Union[list, tuple],
         event_handlers: dict,
         start_block: int = None,
+        bulk_event_handlers: dict = None,
     ):
         super().__init__(name=name,)
         self._network = network
@@ -44,16 +54,22 @@ class Scanner(Process):
         self._events = events
         self._event_handlers = event_handlers
         self._start_block = start_block
+        self._bulk_event_handlers = bulk_event_handlers or {}
+
+    def get_contract(self) -> Contract:
+        return Contract.objects \
+            .select_related('network') \
+            .get(
+                address__iexact=self._contract,
+                network__title__iexact=self._network,
+            )
 
-    @auto_restart
+    @exit_on_error
     def scan(self):
         info(f'Contract address: \"{self._contract}\".')
         info(f'Network title: \"{self._network}\".')
 
-        contract = Contract.objects.get(
-            address__iexact=self._contract,
-            network__title__iexact=self._network
-        )
+        contract = self.get_contract()
 
         custom_rpc_provider = CustomRpcProvider(contract.network)
 
@@ -74,6 +90,8 @@ class Scanner(Process):
         )
 
         while 1:
+            ensure_usable_connections()
+
             custom_rpc_provider.url_number = 0
 
             current_block_number = custom_rpc_provider.get_current_block_number()
@@ -137,11 +155,24 @@ class Scanner(Process):
                 if not events:
                     continue
 
-                for _, event in enumerate(events):
-                    self._event_handlers.get(event_name)(
+                bulk_event_handler = self._bulk_event_handlers.get(event_name)
+
+                if bulk_event_handler:
+                    bulk_event_handler(
                         custom_rpc_provider,
                         contract,
-                        event,
+                        events,
+                    )
+
+                    continue
+
+                for _, event in enumerate(events):
+                    self._event_handlers.get(event_name)(
+                        EventContext(
+                            rpc_provider=custom_rpc_provider,
+                            contract=contract,
+                            event=event,
+                        )
                     )
 
                 continue
@@ -151,4 +182,10 @@ class Scanner(Process):
             sleep(timeout)
 
     def run(self):
+        # Garbage collection is disabled by supervisor before fork
+        enable()
+        # Handler of supervisor is inherited by fork
+        signal(SIGTERM, SIG_DFL)
+        forget_inherited_connections()
+
         self.scan()
@@ -1,7 +1,5 @@
-from multiprocessing import Pool
-
 from .base import Scanner
-from .handlers import VALIDATOR_HANDLERS
+from .handlers import BULK_HANDLERS, VALIDATOR_HANDLERS
 
 
 def get_scanner(
@@ -25,35 +23,12 @@ def get_scanner(
         events=(
             'TransferTokensToOtherBlockchainUser',
             'TransferCryptoToOtherBlockchainUser',
+            'TransferFromOtherBlockchain',
+            'userRefunded',
+            'Paused',
+            'Unpaused',
         ),
         event_handlers=VALIDATOR_HANDLERS,
         start_block=start_block,
+        bulk_event_handlers=BULK_HANDLERS,
     )
-
-
-def start_scanners(scanners: dict):
-    """
-    Starts scanner instances in proccess pool.
-
-    ---
-
-    :scanners: dict
-    {
-        '<scanner_name aka network_title>': {
-            'network': '<network_title>',
-            'contract_address': 'contract_address',
-            'start_block': int,
-        },
-        ...
-    }
-    """
-    with Pool(processes=len(scanners)) as pool:
-        for scanner, value in scanners.items():
-            scanner_instance = get_scanner(
-                name=f'{scanner}-scanner',
-                network_title=value.get('network'),
-                contract_address=value.get('contract_address'),
-                start_block=value.get('start_block'),
-            )
-
-            pool.apply_async(scanner_instance.start())
@@ -1,8 +1,5 @@
 from logging import exception, info
 
-from django.conf import settings
-from web3.datastructures import AttributeDict
-
 from crosschain_backend.consts import (
     SCANNER_INFO,
     TRADE_ERROR,
@@ -13,75 +10,71 @@ from notifications.services.functions import (
     send_error_notification,
 )
 from validators.models import ValidatorSwap
-from ..functions import (
-    _get_signature,
-    _get_params_to_transfer_to_other_blockchain,
-    _transform_params,
-)
+from validators.services.archive import is_swap_archived
+from ..cache import contract_cache
+from ..context import EventContext
+from ..functions import _get_signature, _transform_params
 from ...exceptions import (
     ContractTransactionAlreadyProcessed,
     ContractTransactionAlreadyReverted,
 )
 from ...models import Contract
 
-CONTRACT_BLOCKCHAIN_IDS_TOKEN_WITH_SIX_DECIMALS = settings.CONTRACT_BLOCKCHAIN_IDS_TOKEN_WITH_SIX_DECIMALS
 
-
-def create_signature_transfer_tokens_handler(
-    rpc_provider: CustomRpcProvider,
-    contract: Contract,
-    event: AttributeDict,
-):
+def create_signature_transfer_tokens_handler(context: EventContext):
     """
     Creates validator swap with signed signature which will be send to relayer
 
-    :param rpc_provider: custom rpc provider of source network
-    :param contract: Contract object of source network
-    :param event: event data of transaction
+    :param context: context of the found event
     """
 
+    # Transactions of archived swaps are deleted, so they aren't fetched
+    # and created again when scanner replays old blocks
+    if is_swap_archived(
+        network_id=context.rpc_provider.network.id,
+        txn_hash=context.txn_hash,
+    ):
+        info(f'Swap of hash \"{context.txn_hash}\" is archived. Skiped...')
+
+        return
+
     validator_swap = ValidatorSwap.create_swap(
-        rpc_provider,
-        contract,
-        event.transactionHash,
-        event,
+        rpc_provider=context.rpc_provider,
+        contract=context.contract,
+        txn_hash=context.txn_hash,
+        event=context.event,
+        source_transaction=context.source_transaction,
+        event_data=context.event_data,
     )
 
     if validator_swap.signature:
         info(
-            f"Signature for hash \"{event.transactionHash}\" already in DB. "
+            f"Signature for hash \"{context.txn_hash}\" already in DB. "
             f"Skiped..."
         )
 
         return
 
-    params = _get_params_to_transfer_to_other_blockchain(
-        rpc_provider=rpc_provider,
-        event=event,
+    info(
+        SCANNER_INFO.format(
+            f'\nSOURCE PARAMS: \"{context.params.to_json()}\".'
+        )
     )
 
-    info(SCANNER_INFO.format(f'\nSOURCE PARAMS: \"{params}\".'))
-
-    if (
-        contract.blockchain_id in CONTRACT_BLOCKCHAIN_IDS_TOKEN_WITH_SIX_DECIMALS and
-        params.blockchain_id not in CONTRACT_BLOCKCHAIN_IDS_TOKEN_WITH_SIX_DECIMALS
-    ) or (
-        contract.blockchain_id not in CONTRACT_BLOCKCHAIN_IDS_TOKEN_WITH_SIX_DECIMALS and
-        params.blockchain_id in CONTRACT_BLOCKCHAIN_IDS_TOKEN_WITH_SIX_DECIMALS
-    ):
-        params = _transform_params(params=params, from_contract=contract)
+    params = _transform_params(context)
 
-    info(SCANNER_INFO.format(f'\nUPDATED PARAMS: \"{params}\".'))
+    info(SCANNER_INFO.format(f'\nUPDATED PARAMS: \"{params.to_json()}\".'))
 
     try:
-        validator_swap.signature = _get_signature(
-            params.original_txn_hash,
-            params.blockchain_id,
-            params.new_address,
-            params.transit_token_amount_in,
+        validator_swap.set_signature(
+            _get_signature(
+                params.original_txn_hash,
+                params.blockchain_id,
+                params.new_address,
+                params.transit_token_amount_in,
+                contract=context.target_contract,
+            )
         )
-        validator_swap.status = ValidatorSwap.STATUS_SIGNATURE_CREATED
-        validator_swap.save(update_fields=('signature', 'status',))
     except (
         ContractTransactionAlreadyProcessed,
         ContractTransactionAlreadyReverted,
@@ -92,13 +85,129 @@ def create_signature_transfer_tokens_handler(
 
         send_error_notification(
             exception_error=exception_error,
-            tx_hash=params.original_txn_hash,
+            tx_hash=context.txn_hash,
         )
 
         return
 
 
+def _update_swaps_status_handler(
+    contract: Contract,
+    events: list,
+    status: str,
+):
+    """
+    Sets status of the swaps which were completed in target network
+
+    :param contract: Contract object of target network
+    :param events: completion events of the target network contract
+    :param status: new status of the found swaps
+    """
+
+    updated_swaps_count = ValidatorSwap.update_swaps_status(
+        original_txn_hashes=[
+            event.args.originalTxHash
+            for event in events
+        ],
+        status=status,
+    )
+
+    info(
+        SCANNER_INFO.format(
+            f'\"{updated_swaps_count}\" swaps were marked as \"{status}\" '
+            f'by \"{len(events)}\" events of the \"{contract.address}\" '
+            'contract address.'
+        )
+    )
+
+
+def complete_swaps_handler(
+    rpc_provider: CustomRpcProvider,
+    contract: Contract,
+    events: list,
+):
+    """
+    Marks swaps as successful by transfers in target network
+
+    :param rpc_provider: custom rpc provider of target network
+    :param contract: Contract object of target network
+    :param events: 'TransferFromOtherBlockchain' events
+    """
+
+    _update_swaps_status_handler(
+        contract=contract,
+        events=events,
+        status=ValidatorSwap.STATUS_SUCCESS,
+    )
+
+
+def revert_swaps_handler(
+    rpc_provider: CustomRpcProvider,
+    contract: Contract,
+    events: list,
+):
+    """
+    Marks swaps as reverted by refunds in target network
+
+    :param rpc_provider: custom rpc provider of target network
+    :param contract: Contract object of target network
+    :param events: 'userRefunded' events
+    """
+
+    _update_swaps_status_handler(
+        contract=contract,
+        events=events,
+        status=ValidatorSwap.STATUS_REVERTED,
+    )
+
+
+def invalidate_contract_cache_handler(
+    rpc_provider: CustomRpcProvider,
+    contract: Contract,
+    events: list,
+):
+    """
+    Removes cached values of contract which were changed by admin events,
+    so all processes fetch the actual ones
+
+    :param rpc_provider: custom rpc provider of contract network
+    :param contract: Contract object which events were found
+    :param events: admin events of the contract with the same name
+    """
+
+    attributes = CONTRACT_CACHE_INVALIDATING_EVENTS.get(events[0].event, ())
+
+    contract_cache.invalidate(contract.id, *attributes)
+
+    info(
+        SCANNER_INFO.format(
+            f'Cached {attributes} of the \"{contract.address}\" contract '
+            f'address were invalidated by \"{events[0].event}\" event.'
+        )
+    )
+
+
+# Contract attributes which are changed by admin events
+CONTRACT_CACHE_INVALIDATING_EVENTS = {
+    'Paused': ('is_paused',),
+    'Unpaused': ('is_paused',),
+}
+
 VALIDATOR_HANDLERS = {
     'TransferTokensToOtherBlockchainUser': create_signature_transfer_tokens_handler,
     'TransferCryptoToOtherBlockchainUser': create_signature_transfer_tokens_handler,
 }
+
+# Handlers which receive all events found in the block range at once
+COMPLETION_HANDLERS = {
+    'TransferFromOtherBlockchain': complete_swaps_handler,
+    'userRefunded': revert_swaps_handler,
+}
+
+BULK_HANDLERS = {
+    **COMPLETION_HANDLERS,
+    **{
+        event_name: invalidate_contract_cache_handler
+        for event_name in CONTRACT_CACHE_INVALIDATING_EVENTS
+    },
+}
@@ -0,0 +1,444 @@
+from gc import collect, disable, enable, freeze, unfreeze
+from logging import exception, info
+from signal import SIGTERM, signal
+from sys import exit
+from time import monotonic, sleep
+from typing import Union
+
+from django.conf import settings
+
+from base.support_functions.database import ensure_usable_connections
+from base.support_functions.memory import get_process_memory
+from crosschain_backend.consts import (
+    CONTRACT_ERROR,
+    ERC20_DECIMALS_ABI,
+    SCANNER_INFO,
+)
+from networks.services.clients import rpc_clients
+from ..abi import abi_artifacts
+from ...models import ContractScanner
+from .base import Scanner
+from .functions import get_scanner
+
+SCANNER_MEMORY_REPORT_INTERVAL = settings.SCANNER_MEMORY_REPORT_INTERVAL
+SCANNER_RELOAD_INTERVAL = settings.SCANNER_RELOAD_INTERVAL
+
+# Seconds between checks of scanner processes
+SUPERVISOR_TIMEOUT = 5
+# Seconds before restart of crashed scanner, they are doubled by every
+# crash in a row up to max
+SCANNER_RESTART_BACKOFF = 15
+SCANNER_RESTART_MAX_BACKOFF = 10 * 60
+# Seconds for which stopped scanner may finish before it's killed
+SCANNER_STOP_TIMEOUT = 10
+
+MEBIBYTE = 2 ** 20
+
+
+class ScannerWorker:
+    """
+    Scanner process of ContractScanner row with its restart state
+
+    :param contract_scanner: ContractScanner instance
+    """
+
+    def __init__(self, contract_scanner: ContractScanner):
+        self.id = contract_scanner.id
+        self.name = contract_scanner.name
+        self.config = contract_scanner.get_config()
+        self.process = None
+        self.started_at = None
+        self.restart_at = None
+        self.restarts_count = 0
+
+    def create_scanner(self) -> Scanner:
+        network_title, contract_address, start_block = self.config
+
+        return get_scanner(
+            name=f'{self.name}-scanner',
+            network_title=network_title,
+            contract_address=contract_address,
+            start_block=start_block,
+        )
+
+    def is_alive(self) -> bool:
+        return self.process is not None and self.process.is_alive()
+
+
+class ScannerSupervisor:
+    """
+    Starts, stops and restarts scanner processes by ContractScanner rows.
+
+    Processes are forked after warm up of the supervisor, so compiled
+    ABIs, web3 clients and contract objects are shared with scanners by
+    copy-on-write instead of built by every scanner. Crashed scanners are
+    restarted one at a time with backoff, so a failing chain doesn't stall
+    the others.
+
+    :param memory_report_interval: seconds between memory reports
+    :param reload_interval: seconds between reloads of ContractScanner rows
+    """
+
+    def __init__(
+        self,
+        memory_report_interval: int = SCANNER_MEMORY_REPORT_INTERVAL,
+        reload_interval: int = SCANNER_RELOAD_INTERVAL,
+    ):
+        self.memory_report_interval = memory_report_interval
+        self.reload_interval = reload_interval
+        self.workers = {}
+
+    @staticmethod
+    def get_contract_scanners() -> dict:
+        """
+        Returns displayed ContractScanner instances by their ids
+        """
+
+        return {
+            contract_scanner.id: contract_scanner
+            for contract_scanner in ContractScanner.displayed_objects
+            .select_related('contract__network')
+        }
+
+    def warm_up(self, contract_scanners: list) -> int:
+        """
+        Loads compiled ABIs and builds RPC clients and contract objects of
+        scanned contracts. Returns count of built contract objects. Rows which can't be warmed
+        up are skipped, their scanners build objects by themselves.
+
+        :param contract_scanners: ContractScanner instances
+        """
+
+        abi_artifacts.preload()
+        abi_artifacts.get(ERC20_DECIMALS_ABI)
+
+        contracts_count = 0
+
+        for contract_scanner in contract_scanners:
+            contract = contract_scanner.contract
+
+            try:
+                for rpc_url in contract.network.rpc_url_list:
+                    rpc_clients.get_contract(
+                        rpc_url=rpc_url,
+                        address=contract.address,
+                        abi=contract.abi,
+                        abi_hash=contract.abi_hash,
+                    )
+
+                    contracts_count += 1
+            except Exception as exception_error:
+                exception(
+                    CONTRACT_ERROR.format(
+                        f'\"{contract_scanner.name}\" scanner isn\'t warmed '
+                        f'up: {exception_error}.'
+                    )
+                )
+
+        return contracts_count
+
+    def _set_state(self, worker: ScannerWorker, state: str):
+        try:
+            ContractScanner.set_state(
+                contract_scanner_id=worker.id,
+                state=state,
+                pid=worker.process.pid if worker.is_alive() else None,
+                restarts_count=worker.restarts_count,
+            )
+        except Exception as exception_error:
+            exception(CONTRACT_ERROR.format(exception_error))
+
+    def start_worker(self, worker: ScannerWorker):
+        """
+        Forks scanner process of worker. Objects of the supervisor are
+        moved to permanent generation before fork, so garbage collection
+        of scanner doesn't write to their pages. Scanner which can't be
+        started is restarted after backoff like crashed one.
+
+        :param worker: ScannerWorker instance
+        """
+
+        worker.started_at = monotonic()
+        worker.restart_at = None
+
+        try:
+            # Scanner opens its own database connections after fork
+            worker.process = worker.create_scanner()
+
+            collect()
+            freeze()
+
+            worker.process.start()
+        except Exception as exception_error:
+            worker.process = None
+
+            exception(
+                CONTRACT_ERROR.format(
+                    f'\"{worker.name}\" scanner isn\'t started: '
+                    f'{exception_error}.'
+                )
+            )
+
+            return
+        finally:
+            # Garbage of the supervisor itself is still collected
+            unfreeze()
+
+        info(
+            SCANNER_INFO.format(
+                f'\"{worker.name}\" scanner is started '
+                f'(pid: {worker.process.pid}).'
+            )
+        )
+
+        self._set_state(worker, ContractScanner.STATE_RUNNING)
+
+    def stop_worker(self, worker: ScannerWorker):
+        """
+        Terminates scanner process of worker and kills it if it isn't
+        finished in time
+
+        :param worker: ScannerWorker instance
+        """
+
+        if worker.is_alive():
+            worker.process.terminate()
+            worker.process.join(SCANNER_STOP_TIMEOUT)
+
+            if worker.process.is_alive():
+                worker.process.kill()
+                worker.process.join()
+
+        info(SCANNER_INFO.format(f'\"{worker.name}\" scanner is stopped.'))
+
+        self._set_state(worker, ContractScanner.STATE_STOPPED)
+
+    def stop_workers(self):
+        for worker in self.workers.values():
+            self.stop_worker(worker)
+
+    def sync_workers(self, contract_scanners: dict):
+        """
+        Stops scanners of removed and hidden rows, restarts scanners of
+        changed rows and starts scanners of new rows. Other scanners keep
+        working.
+
+        :param contract_scanners: ContractScanner instances by their ids
+        """
+
+        for worker_id, worker in list(self.workers.items()):
+            contract_scanner = contract_scanners.get(worker_id)
+
+            if (
+                contract_scanner is None
+                or contract_scanner.name != worker.name
+                or contract_scanner.get_config() != worker.config
+            ):
+                self.stop_worker(worker)
+
+                del self.workers[worker_id]
+
+        new_contract_scanners = [
+            contract_scanner
+            for contract_scanner_id, contract_scanner
+            in contract_scanners.items()
+            if contract_scanner_id not in self.workers
+        ]
+
+        if not new_contract_scanners:
+            return
+
+        # Freed objects leave holes in memory pages which are copied by
+        # the first write of any scanner
+        disable()
+
+        try:
+            contracts_count = self.warm_up(new_contract_scanners)
+        finally:
+            enable()
+
+        info(
+            SCANNER_INFO.format(
+                f'{contracts_count} contract objects are built before fork.'
+            )
+        )
+
+        for contract_scanner in new_contract_scanners:
+            worker = ScannerWorker(contract_scanner)
+            self.workers[worker.id] = worker
+
+            self.start_worker(worker)
+
+    @staticmethod
+    def get_restart_backoff(restarts_count: int) -> int:
+        """
+        Returns seconds before restart of scanner which is crashed
+        restarts_count times in a row
+
+        :param restarts_count: count of crashes in a row
+        """
+
+        return min(
+            SCANNER_RESTART_BACKOFF * 2 ** (restarts_count - 1),
+            SCANNER_RESTART_MAX_BACKOFF,
+        )
+
+    def check_workers(self) -> Union[ScannerWorker, None]:
+        """
+        Schedules restart of crashed scanners and restarts one of them
+        which backoff is passed. Returns restarted worker.
+        """
+
+        now = monotonic()
+
+        for worker in self.workers.values():
+            if worker.is_alive():
+                # Scanner which works long enough isn't crashing in a row
+                if (
+                    worker.restarts_count
+                    and now - worker.started_at >= SCANNER_RESTART_MAX_BACKOFF
+                ):
+                    worker.restarts_count = 0
+
+                    self._set_state(worker, ContractScanner.STATE_RUNNING)
+
+                continue
+
+            if worker.restart_at is not None:
+                continue
+
+            worker.restarts_count += 1
+            worker.restart_at = now + self.get_restart_backoff(
+                worker.restarts_count
+            )
+
+            info(
+                SCANNER_INFO.format(
+                    f'\"{worker.name}\" scanner is crashed with '
+                    f'{worker.process.exitcode if worker.process else None} '
+                    f'exit code, restart after '
+                    f'{worker.restart_at - now:.0f} seconds.'
+                )
+            )
+
+            self._set_state(worker, ContractScanner.STATE_CRASHED)
+
+        crashed_workers = [
+            worker
+            for worker in self.workers.values()
+            if worker.restart_at is not None and worker.restart_at <= now
+        ]
+
+        if not crashed_workers:
+            return
+
+        worker = min(crashed_workers, key=lambda worker: worker.restart_at)
+
+        self.start_worker(worker)
+
+        return worker
+
+    def get_states(self) -> dict:
+        """
+        Returns state, pid and restarts count of scanners by their names
+        """
+
+        return {
+            worker.name: {
+                'state': (
+                    ContractScanner.STATE_RUNNING
+                    if worker.is_alive()
+                    else ContractScanner.STATE_CRASHED
+                ),
+                'pid': worker.process.pid if worker.is_alive() else None,
+                'restarts_count': worker.restarts_count,
+            }
+            for worker in self.workers.values()
+        }
+
+    def get_memory_report(self) -> dict:
+        """
+        Returns pid, RSS, PSS and USS in bytes of alive scanners by their
+        names
+        """
+
+        memory_report = {}
+
+        for worker in self.workers.values():
+            if not worker.is_alive():
+                continue
+
+            memory = get_process_memory(worker.process.pid)
+
+            if memory is not None:
+                memory_report[worker.name] = {
+                    'pid': worker.process.pid,
+                    **memory,
+                }
+
+        return memory_report
+
+    def report_memory(self):
+        memory_report = self.get_memory_report()
+
+        if not memory_report:
+            return
+
+        lines = [
+            f'\"{name}\" (pid: {memory["pid"]}): '
+            f'USS {memory["uss"] / MEBIBYTE:.1f} MiB, '
+            f'PSS {memory["pss"] / MEBIBYTE:.1f} MiB, '
+            f'RSS {memory["rss"] / MEBIBYTE:.1f} MiB.'
+            for name, memory in memory_report.items()
+        ]
+        total_uss = sum(memory['uss'] for memory in memory_report.values())
+        total_pss = sum(memory['pss'] for memory in memory_report.values())
+
+        lines.append(
+            f'Total of scanners: USS {total_uss / MEBIBYTE:.1f} MiB, '
+            f'PSS {total_pss / MEBIBYTE:.1f} MiB.'
+        )
+
+        info(SCANNER_INFO.format('\n'.join(lines)))
+
+    def run(self):
+        """
+        Keeps scanners in sync with ContractScanner rows until the
+        supervisor is stopped
+        """
+
+        # Scanners are stopped with the supervisor
+        signal(SIGTERM, lambda *args: exit(0))
+
+        reload_at = 0
+        report_at = monotonic() + self.memory_report_interval
+
+        try:
+            while 1:
+                if monotonic() >= reload_at:
+                    try:
+                        ensure_usable_connections()
+
+                        self.sync_workers(self.get_contract_scanners())
+                    except Exception as exception_error:
+                        # Scanners keep working while rows can't be read
+                        exception(CONTRACT_ERROR.format(exception_error))
+
+                    reload_at = monotonic() + self.reload_interval
+
+                self.check_workers()
+
+                if monotonic() >= report_at:
+                    self.report_memory()
+
+                    info(
+                        SCANNER_INFO.format(
+                            f'States of scanners: {self.get_states()}.'
+                        )
+                    )
+
+                    report_at = monotonic() + self.memory_report_interval
+
+                sleep(SUPERVISOR_TIMEOUT)
+        finally:
+            self.stop_workers()
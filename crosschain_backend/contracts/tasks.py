@@ -0,0 +1,16 @@
+from logging import exception
+
+from crosschain_backend.celery import app as celery_app
+from .services.functions import refresh_contract_states
+
+
+@celery_app.task
+def refresh_contract_states_task():
+    """
+    Refreshes snapshots of states of routing contracts
+    """
+
+    try:
+        refresh_contract_states()
+    except Exception as exception_error:
+        exception(exception_error)
@@ -1,11 +1,49 @@
+from datetime import timedelta
+from io import StringIO
+from multiprocessing import Process
+from os import getpid
+from time import monotonic, sleep
+from unittest.mock import PropertyMock, patch
+
+from django.core.management import call_command
+from django.db import connection
+from eth_abi import encode_abi
+from web3 import Web3
+from web3._utils.events import get_event_data
 from web3.datastructures import AttributeDict
 
+from base.support_functions.memory import get_process_memory
 from base.tests import BaseTestCase
-from contracts.services.functions import _get_signature
-from contracts.services.scanners.handlers import create_signature_transfer_tokens_handler
-from networks.models import CustomRpcProvider, Network
+from crosschain_backend.abi import FULL_ABI
+from contracts.management.commands.move_contract_abis import BACKUP_TABLE
+from contracts.services.abi import AbiArtifacts, abi_artifacts
+from contracts.services.functions import _get_signature, get_hash_packed
+from contracts.services.context import EventContext
+from contracts.services.decimals import (
+    UNKNOWN_PAIR_RETRY_INTERVAL,
+    TransitTokenDecimalsRegistry,
+)
+from contracts.services.records import ScannedLog
+from contracts.services.scanners.handlers import (
+    create_signature_transfer_tokens_handler,
+    invalidate_contract_cache_handler,
+)
+from contracts.services.scanners.base import Scanner
+from contracts.services.scanners.functions import get_scanner
+from contracts.services.scanners.supervisor import (
+    ScannerSupervisor,
+    ScannerWorker,
+)
+from networks.models import CustomRpcProvider, Network, Transaction
+from networks.services.clients import rpc_clients
 from validators.models import ValidatorSwap
-from .models import Contract
+from .models import (
+    CONTRACT_STATE_MAX_AGE,
+    Abi,
+    Contract,
+    ContractScanner,
+    ContractState,
+)
 
 
 class ContractTestCase(BaseTestCase):
@@ -54,6 +92,63 @@ class ContractTestCase(BaseTestCase):
             'get_hash_packed method returned incorrect hash',
         )
 
+    def test_get_hash_packed(self):
+        self.assertEqual(
+            get_hash_packed(
+                new_address=self.wallet_address,
+                rbc_amount_in=self.token_amount,
+                original_txn_hash=self.transaction_hash,
+                blockchain_id=self.blockchain_id,
+            ).hex(),
+            f'0x{self.hash_packed}',
+            "get_hash_packed function returned hash which differs from contract's",
+        )
+
+    def test_contract_state_staleness(self):
+        contract = Contract.get_contract_by_blockchain_id(1)
+        state = ContractState.objects.create(
+            contract=contract,
+            is_paused=False,
+            max_gas_price=0,
+            min_token_amount=0,
+        )
+
+        fresh_state = contract.get_state()
+
+        state.fetched_at -= timedelta(seconds=CONTRACT_STATE_MAX_AGE + 1)
+        state.save()
+        contract.refresh_from_db()
+
+        self.assertEqual(
+            (fresh_state, contract.get_state()),
+            (state, None),
+            'get_state method returned stale snapshot of contract state',
+        )
+
+    def test_contract_state_values(self):
+        contract = Contract.get_contract_by_blockchain_id(1)
+        ContractState.objects.create(
+            contract=contract,
+            max_gas_price=200,
+            min_token_amount=10,
+            fee_amounts={str(contract.blockchain_id): 3000},
+            crypto_fees={'2': 40},
+        )
+
+        with patch.object(Contract, 'contract_function_call') as call:
+            values = (
+                contract.max_gas_price,
+                contract.min_token_amount,
+                contract.fee_amount_of_blockchain,
+                contract.get_blockchain_crypto_fee(2),
+            )
+
+        self.assertEqual(
+            (values, call.called),
+            ((200, 10, 3000, 40), False),
+            'contract values are requested while state snapshot is fresh',
+        )
+
     def test_get_signature(self):
         self.assertEqual(
             _get_signature(
@@ -75,9 +170,11 @@ class ContractTestCase(BaseTestCase):
         contract = Contract.get_contract_by_blockchain_id(1)
 
         create_signature_transfer_tokens_handler(
-            rpc_provider=rpc_provider,
-            contract=contract,
-            event=self.event_data,
+            EventContext(
+                rpc_provider=rpc_provider,
+                contract=contract,
+                event=self.event_data,
+            )
         )
 
         validator_swap = ValidatorSwap.displayed_objects.get(
@@ -88,3 +185,590 @@ class ContractTestCase(BaseTestCase):
             validator_swap.signature,
             self.signature,
         )
+
+    def test_scanned_log(self):
+        scanned_log = ScannedLog.from_web3_log(self.event_data)
+
+        self.assertEqual(
+            (
+                scanned_log.transaction_hash,
+                scanned_log.to_json(),
+            ),
+            (
+                bytes.fromhex(self.transaction_hash[2:]),
+                Contract.get_event(self.event_data),
+            ),
+            "scanned log isn't converted to the same event data",
+        )
+
+    def test_event_context(self):
+        contract = Contract.get_contract_by_blockchain_id(1)
+        Transaction.objects.create(
+            network=contract.network,
+            hash=self.transaction_hash,
+            data={
+                'params': [
+                    self.blockchain_id,
+                    0,
+                    [],
+                    [self.wallet_address],
+                    0,
+                    0,
+                    self.wallet_address,
+                    False,
+                    True,
+                    'swapTokensToOtherBlockchain',
+                ],
+            },
+            event_data=Contract.get_event(self.event_data),
+        )
+        context = EventContext(
+            rpc_provider=CustomRpcProvider(contract.network),
+            contract=contract,
+            event=self.event_data,
+        )
+
+        context.params
+        context.target_contract
+
+        with self.assertNumQueries(0):
+            facts = (
+                context.source_transaction.hash,
+                context.params.transit_token_amount_in,
+                context.target_contract.blockchain_id,
+            )
+
+        self.assertEqual(
+            facts,
+            (
+                self.transaction_hash,
+                self.event_data.args.RBCAmountIn,
+                self.blockchain_id,
+            ),
+            "event context doesn't keep facts about event",
+        )
+
+    def test_transit_token_decimals_scale(self):
+        registry = TransitTokenDecimalsRegistry()
+        amount = 12345678901234567890123456789
+
+        with patch.object(
+            Contract,
+            'transit_token_decimals',
+            new_callable=PropertyMock,
+            return_value=None,
+        ):
+            scaled_amounts = (
+                registry.scale(amount, 1, 2),
+                registry.scale(amount // 10 ** 12, 2, 1),
+                registry.scale(amount, 1, 1),
+            )
+
+        self.assertEqual(
+            scaled_amounts,
+            (
+                amount // 10 ** 12,
+                amount // 10 ** 12 * 10 ** 12,
+                amount,
+            ),
+            "transit token amount isn't scaled exactly by decimals",
+        )
+
+    def test_transit_token_decimals_unknown_pair(self):
+        registry = TransitTokenDecimalsRegistry()
+        amount = 12345678901234567890123456789
+
+        with patch.object(
+            Contract,
+            'transit_token_decimals',
+            new_callable=PropertyMock,
+            return_value=None,
+        ), patch.object(
+            registry,
+            '_load',
+            wraps=registry._load,
+        ) as load:
+            scaled_amounts = (
+                registry.scale(amount, 999, 2),
+                registry.scale(amount, 999, 2),
+            )
+
+        self.assertEqual(
+            (scaled_amounts, load.call_count),
+            ((amount // 10 ** 12, amount // 10 ** 12), 1),
+            'registry is reloaded by every amount of unknown blockchains',
+        )
+
+    def test_transit_token_decimals_failed_read(self):
+        registry = TransitTokenDecimalsRegistry()
+        amount = 12345678901234567890123456789
+
+        with patch.object(
+            Contract,
+            'transit_token_decimals',
+            new_callable=PropertyMock,
+            side_effect=ValueError,
+        ):
+            failed_scaled_amount = registry.scale(amount, 1, 2)
+
+        is_failed_pair_known = (1, 2) in registry._scale_factors
+
+        with patch.object(
+            Contract,
+            'transit_token_decimals',
+            new_callable=PropertyMock,
+            return_value=None,
+        ), patch(
+            'contracts.services.decimals.monotonic',
+            return_value=monotonic() + UNKNOWN_PAIR_RETRY_INTERVAL + 1,
+        ), patch.object(
+            registry,
+            '_load',
+            wraps=registry._load,
+        ) as load:
+            scaled_amount = registry.scale(amount, 1, 2)
+
+        self.assertEqual(
+            (
+                failed_scaled_amount,
+                is_failed_pair_known,
+                scaled_amount,
+                load.call_count,
+                (1, 2) in registry._scale_factors,
+            ),
+            (amount // 10 ** 12, False, amount // 10 ** 12, 1, True),
+            "decimals aren't read again after failed read",
+        )
+
+    def test_compiled_abi(self):
+        contract = Contract.objects.first()
+        compiled_abi = contract.compiled_abi
+        codec = Web3().codec
+        address = '0x70e8C8139d1ceF162D5ba3B286380EB5913098c4'
+        logs = (
+            (
+                'RoleGranted',
+                [
+                    b'\x01' * 32,
+                    b'\x00' * 12 + bytes.fromhex(address[2:]),
+                    b'\x00' * 12 + b'\x02' * 20,
+                ],
+                b'',
+            ),
+            (
+                'TransferFromOtherBlockchain',
+                [],
+                encode_abi(
+                    ['address', 'uint256', 'uint256', 'bytes32'],
+                    [address, 10 ** 18, 10 ** 17, b'\x03' * 32],
+                ),
+            ),
+        )
+        decoded_logs = []
+
+        for event_name, topics, data in logs:
+            compiled_event = compiled_abi.events[event_name]
+            log = {
+                'topics': [compiled_event.topic, *topics],
+                'data': data,
+                'logIndex': 1,
+                'transactionIndex': 2,
+                'transactionHash': b'\x04' * 32,
+                'address': address,
+                'blockHash': b'\x05' * 32,
+                'blockNumber': 100,
+            }
+            event_abi = next(
+                item
+                for item in compiled_abi.abi
+                if item.get('name') == event_name
+            )
+
+            decoded_logs.append(
+                (
+                    compiled_event.decode(codec, log),
+                    get_event_data(codec, event_abi, log),
+                )
+            )
+
+        # Artifact is loaded from disk by other processes
+        other_process_artifacts = AbiArtifacts(abi_artifacts.directory)
+
+        self.assertEqual(
+            (
+                [web3_log for _, web3_log in decoded_logs],
+                compiled_abi.functions[compiled_abi.selectors['paused']],
+                compiled_abi.output_types['paused'],
+                other_process_artifacts.preload(),
+                other_process_artifacts.get_by_hash(
+                    compiled_abi.abi_hash,
+                    get_abi=list,
+                ),
+            ),
+            (
+                [log for log, _ in decoded_logs],
+                'paused',
+                ('bool',),
+                1,
+                compiled_abi,
+            ),
+            "compiled ABI doesn't decode logs like web3 or isn't stored",
+        )
+
+    def test_contract_abi(self):
+        contract_ids = Contract.objects.values_list('id', flat=True)
+        contracts = Contract.objects.filter(id__in=contract_ids)
+
+        # Contract rows don't contain ABI, it's loaded once per process
+        with self.assertNumQueries(3):
+            abis = [contract.abi for contract in contracts]
+            contracts = list(Contract.objects.filter(id__in=contract_ids))
+
+        # Other processes load compiled ABI from its artifact
+        abi_artifacts.clear()
+
+        with self.assertNumQueries(0):
+            artifact_abis = [contract.abi for contract in contracts]
+
+        self.assertEqual(
+            (
+                Abi.objects.count(),
+                len(contracts),
+                len({contract.abi_hash for contract in contracts}),
+                abis[0] == abis[1] == Abi.objects.get().abi,
+                artifact_abis == abis,
+            ),
+            (
+                1,
+                2,
+                1,
+                True,
+                True,
+            ),
+            "ABI isn't stored once or is loaded more than once",
+        )
+
+    def test_move_contract_abis(self):
+        contract = Contract.get_contract_by_blockchain_id(1)
+        solana_contract = Contract.objects.create(
+            title='SOLANA_PROD',
+            type=Contract.TYPE_CROSSCHAIN_ROUTING,
+            address='r2TGRLHRtQ2Uj1CR7TCBYKgRxJi5M8FRjcqZnyQzYDB',
+            network=contract.network,
+            blockchain_number=8,
+            abi='',
+        )
+        abi_hash = contract.abi_hash
+
+        # ABIs are copied to backup table before migration
+        Contract.objects.update(abi_record=None)
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'CREATE TABLE "{BACKUP_TABLE}" AS SELECT id, \'\' AS abi'
+                f' FROM "{Contract._meta.db_table}";'
+            )
+            cursor.execute(
+                f'UPDATE "{BACKUP_TABLE}" SET abi = %s WHERE id = %s;',
+                (
+                    FULL_ABI,
+                    Contract._meta.pk.get_db_prep_value(contract.id, connection),
+                ),
+            )
+
+        call_command('move_contract_abis', stdout=StringIO())
+
+        solana_contract = Contract.objects.get(id=solana_contract.id)
+
+        self.assertEqual(
+            (
+                Contract.objects.get(id=contract.id).abi_hash,
+                solana_contract.abi_hash,
+                solana_contract.abi,
+                solana_contract.compiled_abi,
+                BACKUP_TABLE in connection.introspection.table_names(),
+            ),
+            (
+                abi_hash,
+                None,
+                None,
+                None,
+                False,
+            ),
+            "contracts with empty ABI aren't left without ABI",
+        )
+
+    def test_scanner_supervisor(self):
+        self.addCleanup(rpc_clients.reset)
+
+        contract = Contract.get_contract_by_blockchain_id(2)
+        supervisor = ScannerSupervisor()
+
+        contracts_count = supervisor.warm_up(
+            [
+                ContractScanner.objects.create(
+                    name='ethereum',
+                    contract=contract,
+                ),
+                ContractScanner.objects.create(
+                    name='ethereum-archive',
+                    contract=contract,
+                    start_block=100,
+                ),
+            ]
+        )
+
+        rpc_url = contract.network.rpc_url_list[0]
+        client = rpc_clients.get_web3(rpc_url)
+        session = rpc_clients.get_session(rpc_url)
+        web3_contract = contract.load_contract()
+
+        # Forked scanner keeps built objects, but doesn't share sockets
+        rpc_clients.reset_sessions()
+
+        memory = get_process_memory(getpid())
+
+        self.assertEqual(
+            (
+                contracts_count,
+                rpc_clients.get_web3(rpc_url) is client,
+                rpc_clients.get_session(rpc_url) is session,
+                client.provider._session is rpc_clients.get_session(rpc_url),
+                contract.load_contract() is web3_contract,
+                0 < memory['uss'] <= memory['pss'] <= memory['rss'],
+                supervisor.get_memory_report(),
+            ),
+            (
+                6,
+                True,
+                False,
+                True,
+                True,
+                True,
+                {},
+            ),
+            "scanned contracts aren't built before fork or sessions are "
+            "shared with scanners",
+        )
+
+    def test_scanner_supervisor_sync(self):
+        ContractScanner.objects.create(
+            name='binance-smart-chain',
+            contract=Contract.get_contract_by_blockchain_id(1),
+        )
+        ContractScanner.objects.create(
+            name='ethereum',
+            contract=Contract.get_contract_by_blockchain_id(2),
+        )
+
+        def create_scanner(worker):
+            # Scanner of binance-smart-chain crashes at once
+            return Process(
+                target=sleep,
+                args=(0 if worker.name == 'binance-smart-chain' else 60,),
+            )
+
+        supervisor = ScannerSupervisor()
+
+        with patch.object(
+            ScannerWorker,
+            'create_scanner',
+            create_scanner,
+        ):
+            self.addCleanup(supervisor.stop_workers)
+            self.addCleanup(rpc_clients.reset)
+
+            supervisor.sync_workers(supervisor.get_contract_scanners())
+
+            workers = {
+                worker.name: worker for worker in supervisor.workers.values()
+            }
+            crashing_worker = workers['binance-smart-chain']
+            ethereum_process = workers['ethereum'].process
+
+            crashing_worker.process.join()
+
+            # Crashed scanner is restarted only after backoff
+            restarted_workers = [supervisor.check_workers()]
+            crashed_state = ContractScanner.objects \
+                .values_list('state', 'restarts_count') \
+                .get(name='binance-smart-chain')
+
+            crashing_worker.restart_at = monotonic()
+
+            restarted_workers.append(supervisor.check_workers())
+
+            # Only scanner of changed row is restarted
+            ContractScanner.objects \
+                .filter(name='ethereum') \
+                .update(start_block=100)
+            crashing_process = crashing_worker.process
+
+            supervisor.sync_workers(supervisor.get_contract_scanners())
+
+            restarted_processes = [
+                ethereum_process.is_alive(),
+                crashing_worker.process is crashing_process,
+            ]
+
+            ContractScanner.objects \
+                .filter(name='binance-smart-chain') \
+                .update(_is_displayed=False)
+
+            supervisor.sync_workers(supervisor.get_contract_scanners())
+
+        ethereum_state = supervisor.get_states()['ethereum']
+
+        self.assertEqual(
+            (
+                restarted_workers,
+                crashed_state,
+                restarted_processes,
+                [
+                    worker.config
+                    for worker in supervisor.workers.values()
+                ],
+                {
+                    key: value
+                    for key, value in ethereum_state.items()
+                    if key != 'pid'
+                },
+                list(
+                    ContractScanner.objects
+                    .order_by('name')
+                    .values_list('name', 'state')
+                ),
+                [
+                    supervisor.get_restart_backoff(restarts_count)
+                    for restarts_count in (1, 2, 10)
+                ],
+            ),
+            (
+                [None, crashing_worker],
+                (ContractScanner.STATE_CRASHED, 1),
+                [False, True],
+                [
+                    (
+                        'ethereum',
+                        '0xD8b19613723215EF8CC80fC35A1428f8E8826940',
+                        100,
+                    ),
+                ],
+                {'state': ContractScanner.STATE_RUNNING, 'restarts_count': 0},
+                [
+                    ('binance-smart-chain', ContractScanner.STATE_STOPPED),
+                    ('ethereum', ContractScanner.STATE_RUNNING),
+                ],
+                [15, 30, 600],
+            ),
+            "scanners aren't synced with rows or crashed scanner isn't "
+            "restarted with backoff",
+        )
+
+    def test_scanner_supervisor_broken_row(self):
+        contract = Contract.get_contract_by_blockchain_id(2)
+        ContractScanner.objects.create(
+            name='ethereum',
+            contract=contract,
+        )
+        ContractScanner.objects.create(
+            name='solana',
+            contract=Contract.objects.create(
+                title='SOLANA_PROD',
+                type=Contract.TYPE_CROSSCHAIN_ROUTING,
+                address='r2TGRLHRtQ2Uj1CR7TCBYKgRxJi5M8FRjcqZnyQzYDB',
+                network=contract.network,
+                blockchain_number=8,
+                abi='',
+            ),
+        )
+
+        def create_scanner(worker):
+            if worker.name == 'solana':
+                raise ValueError('Network of scanner is unknown.')
+
+            return Process(target=sleep, args=(60,))
+
+        supervisor = ScannerSupervisor()
+
+        with patch.object(
+            ScannerWorker,
+            'create_scanner',
+            create_scanner,
+        ):
+            self.addCleanup(supervisor.stop_workers)
+            self.addCleanup(rpc_clients.reset)
+
+            supervisor.sync_workers(supervisor.get_contract_scanners())
+            supervisor.check_workers()
+
+        # Scanner exits on error, so supervisor sees its crash
+        scanner = get_scanner(
+            name='ethereum-scanner',
+            network_title=contract.network.title,
+            contract_address=contract.address,
+        )
+
+        with patch.object(
+            Scanner,
+            'get_contract',
+            side_effect=ValueError('Contract is unknown.'),
+        ), patch(
+            'base.support_functions.decorators.send_error_notification',
+        ), self.assertRaises(SystemExit) as scanner_exit:
+            scanner.scan()
+
+        self.assertEqual(
+            (
+                {
+                    name: (state['state'], state['restarts_count'])
+                    for name, state in supervisor.get_states().items()
+                },
+                list(
+                    ContractScanner.objects
+                    .order_by('name')
+                    .values_list('name', 'state')
+                ),
+                scanner_exit.exception.code,
+            ),
+            (
+                {
+                    'ethereum': (ContractScanner.STATE_RUNNING, 0),
+                    'solana': (ContractScanner.STATE_CRASHED, 1),
+                },
+                [
+                    ('ethereum', ContractScanner.STATE_RUNNING),
+                    ('solana', ContractScanner.STATE_CRASHED),
+                ],
+                1,
+            ),
+            "broken row blocks other scanners or crash of scanner isn't "
+            "seen by supervisor",
+        )
+
+    def test_contract_cache(self):
+        contract = Contract.get_contract_by_blockchain_id(1)
+
+        with patch.object(
+            Contract,
+            'contract_function_call',
+            side_effect=(False, True),
+        ) as contract_function_call:
+            is_paused_values = [
+                Contract.objects.get(id=contract.id).is_paused,
+                Contract.objects.get(id=contract.id).is_paused,
+            ]
+
+            invalidate_contract_cache_handler(
+                rpc_provider=None,
+                contract=contract,
+                events=[AttributeDict({'event': 'Paused'})],
+            )
+
+            is_paused_values.append(contract.is_paused)
+
+        self.assertEqual(
+            (is_paused_values, contract_function_call.call_count),
+            ([False, False, True], 2),
+            "contract cache isn't shared or isn't invalidated by event",
+        )
@@ -0,0 +1,3 @@
+# ABI of Rubic cross-chain routing contracts. It is kept apart from consts,
+# which are imported by every process, and used only to add contracts.
+FULL_ABI = '[{"name": "swapTokensToOtherBlockchainInch", "type": "function", "inputs": [{"name": "params", "type": "tuple", "components": [{"name": "blockchain", "type": "uint256", "internalType": "uint256"}, {"name": "srcAmount", "type": "uint256", "internalType": "uint256"}, {"name": "srcToken", "type": "address", "internalType": "address"}, {"name": "secondPath", "type": "bytes32[]", "internalType": "bytes32[]"}, {"name": "minTransitOut", "type": "uint256", "internalType": "uint256"}, {"name": "tokenOutMin", "type": "uint256", "internalType": "uint256"}, {"name": "newAddress", "type": "bytes32", "internalType": "bytes32"}, {"name": "swapToCrypto", "type": "bool", "internalType": "bool"}, {"name": "data", "type": "bytes", "internalType": "bytes"}, {"name": "signature", "type": "string", "internalType": "string"}], "internalType": "struct ISwapContractInch.swapToParams"}], "outputs": [], "payable": true, "stateMutability": "payable"}, {"name": "swapCryptoToOtherBlockchainInch", "type": "function", "inputs": [{"name": "params", "type": "tuple", "components": [{"name": "blockchain", "type": "uint256", "internalType": "uint256"}, {"name": "srcAmount", "type": "uint256", "internalType": "uint256"}, {"name": "srcToken", "type": "address", "internalType": "address"}, {"name": "secondPath", "type": "bytes32[]", "internalType": "bytes32[]"}, {"name": "minTransitOut", "type": "uint256", "internalType": "uint256"}, {"name": "tokenOutMin", "type": "uint256", "internalType": "uint256"}, {"name": "newAddress", "type": "bytes32", "internalType": "bytes32"}, {"name": "swapToCrypto", "type": "bool", "internalType": "bool"}, {"name": "data", "type": "bytes", "internalType": "bytes"}, {"name": "signature", "type": "string", "internalType": "string"}], "internalType": "struct ISwapContractInch.swapToParams"}], "outputs": [], "payable": true, "stateMutability": "payable"}, {"name": "swapTokensToUserWithFeeInch", "type": "function", "inputs": [{"name": "params", "type": "tuple", "components": [{"name": "user", "type": "address", "internalType": "address"}, {"name": "dstToken", "type": "address", "internalType": "address"}, {"name": "amountWithFee", "type": "uint256", "internalType": "uint256"}, {"name": "amountOutMin", "type": "uint256", "internalType": "uint256"}, {"name": "originalTxHash", "type": "bytes32", "internalType": "bytes32"}, {"name": "concatSignatures", "type": "bytes", "internalType": "bytes"}, {"name": "data", "type": "bytes", "internalType": "bytes"}], "internalType": "struct ISwapContractInch.swapFromParams"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "swapCryptoToUserWithFeeInch", "type": "function", "inputs": [{"name": "params", "type": "tuple", "components": [{"name": "user", "type": "address", "internalType": "address"}, {"name": "dstToken", "type": "address", "internalType": "address"}, {"name": "amountWithFee", "type": "uint256", "internalType": "uint256"}, {"name": "amountOutMin", "type": "uint256", "internalType": "uint256"}, {"name": "originalTxHash", "type": "bytes32", "internalType": "bytes32"}, {"name": "concatSignatures", "type": "bytes", "internalType": "bytes"}, {"name": "data", "type": "bytes", "internalType": "bytes"}], "internalType": "struct ISwapContractInch.swapFromParams"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "swapTokensToOtherBlockchainALGB", "type": "function", "inputs": [{"name": "params", "type": "tuple", "components": [{"name": "blockchain", "type": "uint256", "internalType": "uint256"}, {"name": "tokenInAmount", "type": "uint256", "internalType": "uint256"}, {"name": "firstPath", "type": "bytes", "internalType": "bytes"}, {"name": "secondPath", "type": "bytes32[]", "internalType": "bytes32[]"}, {"name": "exactRBCtokenOut", "type": "uint256", "internalType": "uint256"}, {"name": "tokenOutMin", "type": "uint256", "internalType": "uint256"}, {"name": "newAddress", "type": "bytes32", "internalType": "bytes32"}, {"name": "swapToCrypto", "type": "bool", "internalType": "bool"}, {"name": "swapExactFor", "type": "bool", "internalType": "bool"}, {"name": "signature", "type": "string", "internalType": "string"}], "internalType": "struct ISwapContractV3.swapToParams"}], "outputs": [], "stateMutability": "payable"}, {"name": "swapCryptoToOtherBlockchainALGB", "type": "function", "inputs": [{"name": "params", "type": "tuple", "components": [{"name": "blockchain", "type": "uint256", "internalType": "uint256"}, {"name": "tokenInAmount", "type": "uint256", "internalType": "uint256"}, {"name": "firstPath", "type": "bytes", "internalType": "bytes"}, {"name": "secondPath", "type": "bytes32[]", "internalType": "bytes32[]"}, {"name": "exactRBCtokenOut", "type": "uint256", "internalType": "uint256"}, {"name": "tokenOutMin", "type": "uint256", "internalType": "uint256"}, {"name": "newAddress", "type": "bytes32", "internalType": "bytes32"}, {"name": "swapToCrypto", "type": "bool", "internalType": "bool"}, {"name": "swapExactFor", "type": "bool", "internalType": "bool"}, {"name": "signature", "type": "string", "internalType": "string"}], "internalType": "struct ISwapContractV3.swapToParams"}], "outputs": [], "stateMutability": "payable"}, {"name": "swapTokensToUserWithFeeALGB", "type": "function", "inputs": [{"name": "params", "type": "tuple", "components": [{"name": "user", "type": "address", "internalType": "address"}, {"name": "amountWithFee", "type": "uint256", "internalType": "uint256"}, {"name": "amountOutMin", "type": "uint256", "internalType": "uint256"}, {"name": "path", "type": "bytes", "internalType": "bytes"}, {"name": "originalTxHash", "type": "bytes32", "internalType": "bytes32"}, {"name": "concatSignatures", "type": "bytes", "internalType": "bytes"}], "internalType": "struct ISwapContractV3.swapFromParams"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "swapCryptoToUserWithFeeALGB", "type": "function", "inputs": [{"name": "params", "type": "tuple", "components": [{"name": "user", "type": "address", "internalType": "address"}, {"name": "amountWithFee", "type": "uint256", "internalType": "uint256"}, {"name": "amountOutMin", "type": "uint256", "internalType": "uint256"}, {"name": "path", "type": "bytes", "internalType": "bytes"}, {"name": "originalTxHash", "type": "bytes32", "internalType": "bytes32"}, {"name": "concatSignatures", "type": "bytes", "internalType": "bytes"}], "internalType": "struct ISwapContractV3.swapFromParams"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "refundTokensToUserALGB", "type": "function", "inputs": [{"name": "params", "type": "tuple", "components": [{"name": "user", "type": "address", "internalType": "address"}, {"name": "amountWithFee", "type": "uint256", "internalType": "uint256"}, {"name": "amountOutMin", "type": "uint256", "internalType": "uint256"}, {"name": "path", "type": "bytes", "internalType": "bytes"}, {"name": "originalTxHash", "type": "bytes32", "internalType": "bytes32"}, {"name": "concatSignatures", "type": "bytes", "internalType": "bytes"}], "internalType": "struct ISwapContractV3.swapFromParams"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "refundCryptoToUserALGB", "type": "function", "inputs": [{"name": "params", "type": "tuple", "components": [{"name": "user", "type": "address", "internalType": "address"}, {"name": "amountWithFee", "type": "uint256", "internalType": "uint256"}, {"name": "amountOutMin", "type": "uint256", "internalType": "uint256"}, {"name": "path", "type": "bytes", "internalType": "bytes"}, {"name": "originalTxHash", "type": "bytes32", "internalType": "bytes32"}, {"name": "concatSignatures", "type": "bytes", "internalType": "bytes"}], "internalType": "struct ISwapContractV3.swapFromParams"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "swapTokensToOtherBlockchainV3", "type": "function", "inputs": [{"name": "params", "type": "tuple", "components": [{"name": "blockchain", "type": "uint256", "internalType": "uint256"}, {"name": "tokenInAmount", "type": "uint256", "internalType": "uint256"}, {"name": "firstPath", "type": "bytes", "internalType": "bytes"}, {"name": "secondPath", "type": "bytes32[]", "internalType": "bytes32[]"}, {"name": "exactRBCtokenOut", "type": "uint256", "internalType": "uint256"}, {"name": "tokenOutMin", "type": "uint256", "internalType": "uint256"}, {"name": "newAddress", "type": "bytes32", "internalType": "bytes32"}, {"name": "swapToCrypto", "type": "bool", "internalType": "bool"}, {"name": "swapExactFor", "type": "bool", "internalType": "bool"}, {"name": "signature", "type": "string", "internalType": "string"}], "internalType": "struct ISwapContractV3.swapToParams"}], "outputs": [], "stateMutability": "payable"}, {"name": "swapCryptoToOtherBlockchainV3", "type": "function", "inputs": [{"name": "params", "type": "tuple", "components": [{"name": "blockchain", "type": "uint256", "internalType": "uint256"}, {"name": "tokenInAmount", "type": "uint256", "internalType": "uint256"}, {"name": "firstPath", "type": "bytes", "internalType": "bytes"}, {"name": "secondPath", "type": "bytes32[]", "internalType": "bytes32[]"}, {"name": "exactRBCtokenOut", "type": "uint256", "internalType": "uint256"}, {"name": "tokenOutMin", "type": "uint256", "internalType": "uint256"}, {"name": "newAddress", "type": "bytes32", "internalType": "bytes32"}, {"name": "swapToCrypto", "type": "bool", "internalType": "bool"}, {"name": "swapExactFor", "type": "bool", "internalType": "bool"}, {"name": "signature", "type": "string", "internalType": "string"}], "internalType": "struct ISwapContractV3.swapToParams"}], "outputs": [], "stateMutability": "payable"}, {"name": "swapTokensToUserWithFeeV3", "type": "function", "inputs": [{"name": "params", "type": "tuple", "components": [{"name": "user", "type": "address", "internalType": "address"}, {"name": "amountWithFee", "type": "uint256", "internalType": "uint256"}, {"name": "amountOutMin", "type": "uint256", "internalType": "uint256"}, {"name": "path", "type": "bytes", "internalType": "bytes"}, {"name": "originalTxHash", "type": "bytes32", "internalType": "bytes32"}, {"name": "concatSignatures", "type": "bytes", "internalType": "bytes"}], "internalType": "struct ISwapContractV3.swapFromParams"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "swapCryptoToUserWithFeeV3", "type": "function", "inputs": [{"name": "params", "type": "tuple", "components": [{"name": "user", "type": "address", "internalType": "address"}, {"name": "amountWithFee", "type": "uint256", "internalType": "uint256"}, {"name": "amountOutMin", "type": "uint256", "internalType": "uint256"}, {"name": "path", "type": "bytes", "internalType": "bytes"}, {"name": "originalTxHash", "type": "bytes32", "internalType": "bytes32"}, {"name": "concatSignatures", "type": "bytes", "internalType": "bytes"}], "internalType": "struct ISwapContractV3.swapFromParams"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "refundTokensToUserV3", "type": "function", "inputs": [{"name": "params", "type": "tuple", "components": [{"name": "user", "type": "address", "internalType": "address"}, {"name": "amountWithFee", "type": "uint256", "internalType": "uint256"}, {"name": "amountOutMin", "type": "uint256", "internalType": "uint256"}, {"name": "path", "type": "bytes", "internalType": "bytes"}, {"name": "originalTxHash", "type": "bytes32", "internalType": "bytes32"}, {"name": "concatSignatures", "type": "bytes", "internalType": "bytes"}], "internalType": "struct ISwapContractV3.swapFromParams"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "refundCryptoToUserV3", "type": "function", "inputs": [{"name": "params", "type": "tuple", "components": [{"name": "user", "type": "address", "internalType": "address"}, {"name": "amountWithFee", "type": "uint256", "internalType": "uint256"}, {"name": "amountOutMin", "type": "uint256", "internalType": "uint256"}, {"name": "path", "type": "bytes", "internalType": "bytes"}, {"name": "originalTxHash", "type": "bytes32", "internalType": "bytes32"}, {"name": "concatSignatures", "type": "bytes", "internalType": "bytes"}], "internalType": "struct ISwapContractV3.swapFromParams"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "swapTokensToOtherBlockchain", "type": "function", "inputs": [{"name": "params", "type": "tuple", "components": [{"name": "blockchain", "type": "uint256", "internalType": "uint256"}, {"name": "tokenInAmount", "type": "uint256", "internalType": "uint256"}, {"name": "firstPath", "type": "address[]", "internalType": "address[]"}, {"name": "secondPath", "type": "bytes32[]", "internalType": "bytes32[]"}, {"name": "exactRBCtokenOut", "type": "uint256", "internalType": "uint256"}, {"name": "tokenOutMin", "type": "uint256", "internalType": "uint256"}, {"name": "newAddress", "type": "bytes32", "internalType": "bytes32"}, {"name": "swapToCrypto", "type": "bool", "internalType": "bool"}, {"name": "swapExactFor", "type": "bool", "internalType": "bool"}, {"name": "withFee", "type": "bool", "internalType": "bool"}, {"name": "signature", "type": "string", "internalType": "string"}], "internalType": "struct ISwapContract.swapToParams"}], "outputs": [], "stateMutability": "payable"}, {"name": "swapCryptoToOtherBlockchain", "type": "function", "inputs": [{"name": "params", "type": "tuple", "components": [{"name": "blockchain", "type": "uint256", "internalType": "uint256"}, {"name": "tokenInAmount", "type": "uint256", "internalType": "uint256"}, {"name": "firstPath", "type": "address[]", "internalType": "address[]"}, {"name": "secondPath", "type": "bytes32[]", "internalType": "bytes32[]"}, {"name": "exactRBCtokenOut", "type": "uint256", "internalType": "uint256"}, {"name": "tokenOutMin", "type": "uint256", "internalType": "uint256"}, {"name": "newAddress", "type": "bytes32", "internalType": "bytes32"}, {"name": "swapToCrypto", "type": "bool", "internalType": "bool"}, {"name": "swapExactFor", "type": "bool", "internalType": "bool"}, {"name": "withFee", "type": "bool", "internalType": "bool"}, {"name": "signature", "type": "string", "internalType": "string"}], "internalType": "struct ISwapContract.swapToParams"}], "outputs": [], "stateMutability": "payable"}, {"name": "swapTokensToUserWithFee", "type": "function", "inputs": [{"name": "params", "type": "tuple", "components": [{"name": "user", "type": "address", "internalType": "address"}, {"name": "amountWithFee", "type": "uint256", "internalType": "uint256"}, {"name": "amountOutMin", "type": "uint256", "internalType": "uint256"}, {"name": "path", "type": "address[]", "internalType": "address[]"}, {"name": "originalTxHash", "type": "bytes32", "internalType": "bytes32"}, {"name": "concatSignatures", "type": "bytes", "internalType": "bytes"}], "internalType": "struct ISwapContract.swapFromParams"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "swapCryptoToUserWithFee", "type": "function", "inputs": [{"name": "params", "type": "tuple", "components": [{"name": "user", "type": "address", "internalType": "address"}, {"name": "amountWithFee", "type": "uint256", "internalType": "uint256"}, {"name": "amountOutMin", "type": "uint256", "internalType": "uint256"}, {"name": "path", "type": "address[]", "internalType": "address[]"}, {"name": "originalTxHash", "type": "bytes32", "internalType": "bytes32"}, {"name": "concatSignatures", "type": "bytes", "internalType": "bytes"}], "internalType": "struct ISwapContract.swapFromParams"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "refundTokensToUser", "type": "function", "inputs": [{"name": "params", "type": "tuple", "components": [{"name": "user", "type": "address", "internalType": "address"}, {"name": "amountWithFee", "type": "uint256", "internalType": "uint256"}, {"name": "amountOutMin", "type": "uint256", "internalType": "uint256"}, {"name": "path", "type": "address[]", "internalType": "address[]"}, {"name": "originalTxHash", "type": "bytes32", "internalType": "bytes32"}, {"name": "concatSignatures", "type": "bytes", "internalType": "bytes"}], "internalType": "struct ISwapContract.swapFromParams"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "refundCryptoToUser", "type": "function", "inputs": [{"name": "params", "type": "tuple", "components": [{"name": "user", "type": "address", "internalType": "address"}, {"name": "amountWithFee", "type": "uint256", "internalType": "uint256"}, {"name": "amountOutMin", "type": "uint256", "internalType": "uint256"}, {"name": "path", "type": "address[]", "internalType": "address[]"}, {"name": "originalTxHash", "type": "bytes32", "internalType": "bytes32"}, {"name": "concatSignatures", "type": "bytes", "internalType": "bytes"}], "internalType": "struct ISwapContract.swapFromParams"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "swapTokensToOtherBlockchain1", "type": "function", "inputs": [{"name": "params", "type": "tuple", "components": [{"name": "blockchain", "type": "uint256", "internalType": "uint256"}, {"name": "tokenInAmount", "type": "uint256", "internalType": "uint256"}, {"name": "firstPath", "type": "address[]", "internalType": "address[]"}, {"name": "secondPath", "type": "bytes32[]", "internalType": "bytes32[]"}, {"name": "exactRBCtokenOut", "type": "uint256", "internalType": "uint256"}, {"name": "tokenOutMin", "type": "uint256", "internalType": "uint256"}, {"name": "newAddress", "type": "bytes32", "internalType": "bytes32"}, {"name": "swapToCrypto", "type": "bool", "internalType": "bool"}, {"name": "swapExactFor", "type": "bool", "internalType": "bool"}, {"name": "withFee", "type": "bool", "internalType": "bool"}, {"name": "signature", "type": "string", "internalType": "string"}], "internalType": "struct ISwapContract.swapToParams"}], "outputs": [], "stateMutability": "payable"}, {"name": "swapCryptoToOtherBlockchain1", "type": "function", "inputs": [{"name": "params", "type": "tuple", "components": [{"name": "blockchain", "type": "uint256", "internalType": "uint256"}, {"name": "tokenInAmount", "type": "uint256", "internalType": "uint256"}, {"name": "firstPath", "type": "address[]", "internalType": "address[]"}, {"name": "secondPath", "type": "bytes32[]", "internalType": "bytes32[]"}, {"name": "exactRBCtokenOut", "type": "uint256", "internalType": "uint256"}, {"name": "tokenOutMin", "type": "uint256", "internalType": "uint256"}, {"name": "newAddress", "type": "bytes32", "internalType": "bytes32"}, {"name": "swapToCrypto", "type": "bool", "internalType": "bool"}, {"name": "swapExactFor", "type": "bool", "internalType": "bool"}, {"name": "withFee", "type": "bool", "internalType": "bool"}, {"name": "signature", "type": "string", "internalType": "string"}], "internalType": "struct ISwapContract.swapToParams"}], "outputs": [], "stateMutability": "payable"}, {"name": "swapTokensToUserWithFee1", "type": "function", "inputs": [{"name": "params", "type": "tuple", "components": [{"name": "user", "type": "address", "internalType": "address"}, {"name": "amountWithFee", "type": "uint256", "internalType": "uint256"}, {"name": "amountOutMin", "type": "uint256", "internalType": "uint256"}, {"name": "path", "type": "address[]", "internalType": "address[]"}, {"name": "originalTxHash", "type": "bytes32", "internalType": "bytes32"}, {"name": "concatSignatures", "type": "bytes", "internalType": "bytes"}], "internalType": "struct ISwapContract.swapFromParams"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "swapCryptoToUserWithFee1", "type": "function", "inputs": [{"name": "params", "type": "tuple", "components": [{"name": "user", "type": "address", "internalType": "address"}, {"name": "amountWithFee", "type": "uint256", "internalType": "uint256"}, {"name": "amountOutMin", "type": "uint256", "internalType": "uint256"}, {"name": "path", "type": "address[]", "internalType": "address[]"}, {"name": "originalTxHash", "type": "bytes32", "internalType": "bytes32"}, {"name": "concatSignatures", "type": "bytes", "internalType": "bytes"}], "internalType": "struct ISwapContract.swapFromParams"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "refundTokensToUser1", "type": "function", "inputs": [{"name": "params", "type": "tuple", "components": [{"name": "user", "type": "address", "internalType": "address"}, {"name": "amountWithFee", "type": "uint256", "internalType": "uint256"}, {"name": "amountOutMin", "type": "uint256", "internalType": "uint256"}, {"name": "path", "type": "address[]", "internalType": "address[]"}, {"name": "originalTxHash", "type": "bytes32", "internalType": "bytes32"}, {"name": "concatSignatures", "type": "bytes", "internalType": "bytes"}], "internalType": "struct ISwapContract.swapFromParams"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "refundCryptoToUser1", "type": "function", "inputs": [{"name": "params", "type": "tuple", "components": [{"name": "user", "type": "address", "internalType": "address"}, {"name": "amountWithFee", "type": "uint256", "internalType": "uint256"}, {"name": "amountOutMin", "type": "uint256", "internalType": "uint256"}, {"name": "path", "type": "address[]", "internalType": "address[]"}, {"name": "originalTxHash", "type": "bytes32", "internalType": "bytes32"}, {"name": "concatSignatures", "type": "bytes", "internalType": "bytes"}], "internalType": "struct ISwapContract.swapFromParams"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "swapTokensToOtherBlockchain2", "type": "function", "inputs": [{"name": "params", "type": "tuple", "components": [{"name": "blockchain", "type": "uint256", "internalType": "uint256"}, {"name": "tokenInAmount", "type": "uint256", "internalType": "uint256"}, {"name": "firstPath", "type": "address[]", "internalType": "address[]"}, {"name": "secondPath", "type": "bytes32[]", "internalType": "bytes32[]"}, {"name": "exactRBCtokenOut", "type": "uint256", "internalType": "uint256"}, {"name": "tokenOutMin", "type": "uint256", "internalType": "uint256"}, {"name": "newAddress", "type": "bytes32", "internalType": "bytes32"}, {"name": "swapToCrypto", "type": "bool", "internalType": "bool"}, {"name": "swapExactFor", "type": "bool", "internalType": "bool"}, {"name": "withFee", "type": "bool", "internalType": "bool"}, {"name": "signature", "type": "string", "internalType": "string"}], "internalType": "struct ISwapContract.swapToParams"}], "outputs": [], "stateMutability": "payable"}, {"name": "swapCryptoToOtherBlockchain2", "type": "function", "inputs": [{"name": "params", "type": "tuple", "components": [{"name": "blockchain", "type": "uint256", "internalType": "uint256"}, {"name": "tokenInAmount", "type": "uint256", "internalType": "uint256"}, {"name": "firstPath", "type": "address[]", "internalType": "address[]"}, {"name": "secondPath", "type": "bytes32[]", "internalType": "bytes32[]"}, {"name": "exactRBCtokenOut", "type": "uint256", "internalType": "uint256"}, {"name": "tokenOutMin", "type": "uint256", "internalType": "uint256"}, {"name": "newAddress", "type": "bytes32", "internalType": "bytes32"}, {"name": "swapToCrypto", "type": "bool", "internalType": "bool"}, {"name": "swapExactFor", "type": "bool", "internalType": "bool"}, {"name": "withFee", "type": "bool", "internalType": "bool"}, {"name": "signature", "type": "string", "internalType": "string"}], "internalType": "struct ISwapContract.swapToParams"}], "outputs": [], "stateMutability": "payable"}, {"name": "swapTokensToUserWithFee2", "type": "function", "inputs": [{"name": "params", "type": "tuple", "components": [{"name": "user", "type": "address", "internalType": "address"}, {"name": "amountWithFee", "type": "uint256", "internalType": "uint256"}, {"name": "amountOutMin", "type": "uint256", "internalType": "uint256"}, {"name": "path", "type": "address[]", "internalType": "address[]"}, {"name": "originalTxHash", "type": "bytes32", "internalType": "bytes32"}, {"name": "concatSignatures", "type": "bytes", "internalType": "bytes"}], "internalType": "struct ISwapContract.swapFromParams"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "swapCryptoToUserWithFee2", "type": "function", "inputs": [{"name": "params", "type": "tuple", "components": [{"name": "user", "type": "address", "internalType": "address"}, {"name": "amountWithFee", "type": "uint256", "internalType": "uint256"}, {"name": "amountOutMin", "type": "uint256", "internalType": "uint256"}, {"name": "path", "type": "address[]", "internalType": "address[]"}, {"name": "originalTxHash", "type": "bytes32", "internalType": "bytes32"}, {"name": "concatSignatures", "type": "bytes", "internalType": "bytes"}], "internalType": "struct ISwapContract.swapFromParams"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "refundTokensToUser2", "type": "function", "inputs": [{"name": "params", "type": "tuple", "components": [{"name": "user", "type": "address", "internalType": "address"}, {"name": "amountWithFee", "type": "uint256", "internalType": "uint256"}, {"name": "amountOutMin", "type": "uint256", "internalType": "uint256"}, {"name": "path", "type": "address[]", "internalType": "address[]"}, {"name": "originalTxHash", "type": "bytes32", "internalType": "bytes32"}, {"name": "concatSignatures", "type": "bytes", "internalType": "bytes"}], "internalType": "struct ISwapContract.swapFromParams"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "refundCryptoToUser2", "type": "function", "inputs": [{"name": "params", "type": "tuple", "components": [{"name": "user", "type": "address", "internalType": "address"}, {"name": "amountWithFee", "type": "uint256", "internalType": "uint256"}, {"name": "amountOutMin", "type": "uint256", "internalType": "uint256"}, {"name": "path", "type": "address[]", "internalType": "address[]"}, {"name": "originalTxHash", "type": "bytes32", "internalType": "bytes32"}, {"name": "concatSignatures", "type": "bytes", "internalType": "bytes"}], "internalType": "struct ISwapContract.swapFromParams"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "swapTokensToOtherBlockchainAVAX", "type": "function", "inputs": [{"name": "params", "type": "tuple", "components": [{"name": "blockchain", "type": "uint256", "internalType": "uint256"}, {"name": "tokenInAmount", "type": "uint256", "internalType": "uint256"}, {"name": "firstPath", "type": "address[]", "internalType": "address[]"}, {"name": "secondPath", "type": "bytes32[]", "internalType": "bytes32[]"}, {"name": "exactRBCtokenOut", "type": "uint256", "internalType": "uint256"}, {"name": "tokenOutMin", "type": "uint256", "internalType": "uint256"}, {"name": "newAddress", "type": "bytes32", "internalType": "bytes32"}, {"name": "swapToCrypto", "type": "bool", "internalType": "bool"}, {"name": "swapExactFor", "type": "bool", "internalType": "bool"}, {"name": "withFee", "type": "bool", "internalType": "bool"}, {"name": "signature", "type": "string", "internalType": "string"}], "internalType": "struct ISwapContract.swapToParams"}], "outputs": [], "stateMutability": "payable"}, {"name": "swapCryptoToOtherBlockchainAVAX", "type": "function", "inputs": [{"name": "params", "type": "tuple", "components": [{"name": "blockchain", "type": "uint256", "internalType": "uint256"}, {"name": "tokenInAmount", "type": "uint256", "internalType": "uint256"}, {"name": "firstPath", "type": "address[]", "internalType": "address[]"}, {"name": "secondPath", "type": "bytes32[]", "internalType": "bytes32[]"}, {"name": "exactRBCtokenOut", "type": "uint256", "internalType": "uint256"}, {"name": "tokenOutMin", "type": "uint256", "internalType": "uint256"}, {"name": "newAddress", "type": "bytes32", "internalType": "bytes32"}, {"name": "swapToCrypto", "type": "bool", "internalType": "bool"}, {"name": "swapExactFor", "type": "bool", "internalType": "bool"}, {"name": "withFee", "type": "bool", "internalType": "bool"}, {"name": "signature", "type": "string", "internalType": "string"}], "internalType": "struct ISwapContract.swapToParams"}], "outputs": [], "stateMutability": "payable"}, {"name": "swapTokensToUserWithFeeAVAX", "type": "function", "inputs": [{"name": "params", "type": "tuple", "components": [{"name": "user", "type": "address", "internalType": "address"}, {"name": "amountWithFee", "type": "uint256", "internalType": "uint256"}, {"name": "amountOutMin", "type": "uint256", "internalType": "uint256"}, {"name": "path", "type": "address[]", "internalType": "address[]"}, {"name": "originalTxHash", "type": "bytes32", "internalType": "bytes32"}, {"name": "concatSignatures", "type": "bytes", "internalType": "bytes"}], "internalType": "struct ISwapContract.swapFromParams"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "swapCryptoToUserWithFeeAVAX", "type": "function", "inputs": [{"name": "params", "type": "tuple", "components": [{"name": "user", "type": "address", "internalType": "address"}, {"name": "amountWithFee", "type": "uint256", "internalType": "uint256"}, {"name": "amountOutMin", "type": "uint256", "internalType": "uint256"}, {"name": "path", "type": "address[]", "internalType": "address[]"}, {"name": "originalTxHash", "type": "bytes32", "internalType": "bytes32"}, {"name": "concatSignatures", "type": "bytes", "internalType": "bytes"}], "internalType": "struct ISwapContract.swapFromParams"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "refundTokensToUserAVAX", "type": "function", "inputs": [{"name": "params", "type": "tuple", "components": [{"name": "user", "type": "address", "internalType": "address"}, {"name": "amountWithFee", "type": "uint256", "internalType": "uint256"}, {"name": "amountOutMin", "type": "uint256", "internalType": "uint256"}, {"name": "path", "type": "address[]", "internalType": "address[]"}, {"name": "originalTxHash", "type": "bytes32", "internalType": "bytes32"}, {"name": "concatSignatures", "type": "bytes", "internalType": "bytes"}], "internalType": "struct ISwapContract.swapFromParams"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "refundCryptoToUserAVAX", "type": "function", "inputs": [{"name": "params", "type": "tuple", "components": [{"name": "user", "type": "address", "internalType": "address"}, {"name": "amountWithFee", "type": "uint256", "internalType": "uint256"}, {"name": "amountOutMin", "type": "uint256", "internalType": "uint256"}, {"name": "path", "type": "address[]", "internalType": "address[]"}, {"name": "originalTxHash", "type": "bytes32", "internalType": "bytes32"}, {"name": "concatSignatures", "type": "bytes", "internalType": "bytes"}], "internalType": "struct ISwapContract.swapFromParams"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "swapTokensToOtherBlockchainAVAX1", "type": "function", "inputs": [{"name": "params", "type": "tuple", "components": [{"name": "blockchain", "type": "uint256", "internalType": "uint256"}, {"name": "tokenInAmount", "type": "uint256", "internalType": "uint256"}, {"name": "firstPath", "type": "address[]", "internalType": "address[]"}, {"name": "secondPath", "type": "bytes32[]", "internalType": "bytes32[]"}, {"name": "exactRBCtokenOut", "type": "uint256", "internalType": "uint256"}, {"name": "tokenOutMin", "type": "uint256", "internalType": "uint256"}, {"name": "newAddress", "type": "bytes32", "internalType": "bytes32"}, {"name": "swapToCrypto", "type": "bool", "internalType": "bool"}, {"name": "swapExactFor", "type": "bool", "internalType": "bool"}, {"name": "withFee", "type": "bool", "internalType": "bool"}, {"name": "signature", "type": "string", "internalType": "string"}], "internalType": "struct ISwapContract.swapToParams"}], "outputs": [], "stateMutability": "payable"}, {"name": "swapCryptoToOtherBlockchainAVAX1", "type": "function", "inputs": [{"name": "params", "type": "tuple", "components": [{"name": "blockchain", "type": "uint256", "internalType": "uint256"}, {"name": "tokenInAmount", "type": "uint256", "internalType": "uint256"}, {"name": "firstPath", "type": "address[]", "internalType": "address[]"}, {"name": "secondPath", "type": "bytes32[]", "internalType": "bytes32[]"}, {"name": "exactRBCtokenOut", "type": "uint256", "internalType": "uint256"}, {"name": "tokenOutMin", "type": "uint256", "internalType": "uint256"}, {"name": "newAddress", "type": "bytes32", "internalType": "bytes32"}, {"name": "swapToCrypto", "type": "bool", "internalType": "bool"}, {"name": "swapExactFor", "type": "bool", "internalType": "bool"}, {"name": "withFee", "type": "bool", "internalType": "bool"}, {"name": "signature", "type": "string", "internalType": "string"}], "internalType": "struct ISwapContract.swapToParams"}], "outputs": [], "stateMutability": "payable"}, {"name": "swapTokensToUserWithFeeAVAX1", "type": "function", "inputs": [{"name": "params", "type": "tuple", "components": [{"name": "user", "type": "address", "internalType": "address"}, {"name": "amountWithFee", "type": "uint256", "internalType": "uint256"}, {"name": "amountOutMin", "type": "uint256", "internalType": "uint256"}, {"name": "path", "type": "address[]", "internalType": "address[]"}, {"name": "originalTxHash", "type": "bytes32", "internalType": "bytes32"}, {"name": "concatSignatures", "type": "bytes", "internalType": "bytes"}], "internalType": "struct ISwapContract.swapFromParams"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "swapCryptoToUserWithFeeAVAX1", "type": "function", "inputs": [{"name": "params", "type": "tuple", "components": [{"name": "user", "type": "address", "internalType": "address"}, {"name": "amountWithFee", "type": "uint256", "internalType": "uint256"}, {"name": "amountOutMin", "type": "uint256", "internalType": "uint256"}, {"name": "path", "type": "address[]", "internalType": "address[]"}, {"name": "originalTxHash", "type": "bytes32", "internalType": "bytes32"}, {"name": "concatSignatures", "type": "bytes", "internalType": "bytes"}], "internalType": "struct ISwapContract.swapFromParams"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "refundTokensToUserAVAX1", "type": "function", "inputs": [{"name": "params", "type": "tuple", "components": [{"name": "user", "type": "address", "internalType": "address"}, {"name": "amountWithFee", "type": "uint256", "internalType": "uint256"}, {"name": "amountOutMin", "type": "uint256", "internalType": "uint256"}, {"name": "path", "type": "address[]", "internalType": "address[]"}, {"name": "originalTxHash", "type": "bytes32", "internalType": "bytes32"}, {"name": "concatSignatures", "type": "bytes", "internalType": "bytes"}], "internalType": "struct ISwapContract.swapFromParams"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "refundCryptoToUserAVAX1", "type": "function", "inputs": [{"name": "params", "type": "tuple", "components": [{"name": "user", "type": "address", "internalType": "address"}, {"name": "amountWithFee", "type": "uint256", "internalType": "uint256"}, {"name": "amountOutMin", "type": "uint256", "internalType": "uint256"}, {"name": "path", "type": "address[]", "internalType": "address[]"}, {"name": "originalTxHash", "type": "bytes32", "internalType": "bytes32"}, {"name": "concatSignatures", "type": "bytes", "internalType": "bytes"}], "internalType": "struct ISwapContract.swapFromParams"}], "outputs": [], "stateMutability": "nonpayable"}, {"type": "constructor", "inputs": [{"name": "_numOfThisBlockchain", "type": "uint128", "internalType": "uint128"}, {"name": "_numsOfOtherBlockchains", "type": "uint128[]", "internalType": "uint128[]"}, {"name": "tokenLimits", "type": "uint256[]", "internalType": "uint256[]"}, {"name": "_maxGasPrice", "type": "uint256", "internalType": "uint256"}, {"name": "_minConfirmationBlocks", "type": "uint256", "internalType": "uint256"}, {"name": "_refundSlippage", "type": "uint256", "internalType": "uint256"}, {"name": "_RubicAddresses", "type": "bytes32[]", "internalType": "bytes32[]"}], "stateMutability": "nonpayable"}, {"name": "Paused", "type": "event", "inputs": [{"name": "account", "type": "address", "indexed": false, "internalType": "address"}], "anonymous": false}, {"name": "RoleAdminChanged", "type": "event", "inputs": [{"name": "role", "type": "bytes32", "indexed": true, "internalType": "bytes32"}, {"name": "previousAdminRole", "type": "bytes32", "indexed": true, "internalType": "bytes32"}, {"name": "newAdminRole", "type": "bytes32", "indexed": true, "internalType": "bytes32"}], "anonymous": false}, {"name": "RoleGranted", "type": "event", "inputs": [{"name": "role", "type": "bytes32", "indexed": true, "internalType": "bytes32"}, {"name": "account", "type": "address", "indexed": true, "internalType": "address"}, {"name": "sender", "type": "address", "indexed": true, "internalType": "address"}], "anonymous": false}, {"name": "RoleRevoked", "type": "event", "inputs": [{"name": "role", "type": "bytes32", "indexed": true, "internalType": "bytes32"}, {"name": "account", "type": "address", "indexed": true, "internalType": "address"}, {"name": "sender", "type": "address", "indexed": true, "internalType": "address"}], "anonymous": false}, {"name": "Unpaused", "type": "event", "inputs": [{"name": "account", "type": "address", "indexed": false, "internalType": "address"}], "anonymous": false}, {"type": "fallback", "stateMutability": "payable"}, {"name": "DEFAULT_ADMIN_ROLE", "type": "function", "inputs": [], "outputs": [{"name": "", "type": "bytes32", "internalType": "bytes32"}], "stateMutability": "view"}, {"name": "MANAGER_ROLE", "type": "function", "inputs": [], "outputs": [{"name": "", "type": "bytes32", "internalType": "bytes32"}], "stateMutability": "view"}, {"name": "OWNER_ROLE", "type": "function", "inputs": [], "outputs": [{"name": "", "type": "bytes32", "internalType": "bytes32"}], "stateMutability": "view"}, {"name": "RELAYER_ROLE", "type": "function", "inputs": [], "outputs": [{"name": "", "type": "bytes32", "internalType": "bytes32"}], "stateMutability": "view"}, {"name": "RubicAddresses", "type": "function", "inputs": [{"name": "", "type": "uint256", "internalType": "uint256"}], "outputs": [{"name": "", "type": "bytes32", "internalType": "bytes32"}], "stateMutability": "view"}, {"name": "SIGNATURE_LENGTH", "type": "function", "inputs": [], "outputs": [{"name": "", "type": "uint256", "internalType": "uint256"}], "stateMutability": "view"}, {"name": "VALIDATOR_ROLE", "type": "function", "inputs": [], "outputs": [{"name": "", "type": "bytes32", "internalType": "bytes32"}], "stateMutability": "view"}, {"name": "accTokenFee", "type": "function", "inputs": [], "outputs": [{"name": "", "type": "uint256", "internalType": "uint256"}], "stateMutability": "view"}, {"name": "addOtherBlockchain", "type": "function", "inputs": [{"name": "numOfOtherBlockchain", "type": "uint128", "internalType": "uint128"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "approveTokenToRouter", "type": "function", "inputs": [{"name": "_token", "type": "address", "internalType": "contract IERC20"}, {"name": "_router", "type": "address", "internalType": "address"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "blockchainCryptoFee", "type": "function", "inputs": [{"name": "", "type": "uint256", "internalType": "uint256"}], "outputs": [{"name": "", "type": "uint256", "internalType": "uint256"}], "stateMutability": "view"}, {"name": "blockchainRouter", "type": "function", "inputs": [], "outputs": [{"name": "", "type": "address", "internalType": "address"}], "stateMutability": "view"}, {"name": "changeOtherBlockchain", "type": "function", "inputs": [{"name": "oldNumOfOtherBlockchain", "type": "uint128", "internalType": "uint128"}, {"name": "newNumOfOtherBlockchain", "type": "uint128", "internalType": "uint128"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "changeTxStatus", "type": "function", "inputs": [{"name": "originalTxHash", "type": "bytes32", "internalType": "bytes32"}, {"name": "statusCode", "type": "uint256", "internalType": "uint256"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "collectCryptoFee", "type": "function", "inputs": [{"name": "toAddress", "type": "address", "internalType": "address"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "collectTokenFee", "type": "function", "inputs": [], "outputs": [], "stateMutability": "nonpayable"}, {"name": "continueExecution", "type": "function", "inputs": [], "outputs": [], "stateMutability": "nonpayable"}, {"name": "ecOffsetRecover", "type": "function", "inputs": [{"name": "hash", "type": "bytes32", "internalType": "bytes32"}, {"name": "signature", "type": "bytes", "internalType": "bytes"}, {"name": "offset", "type": "uint256", "internalType": "uint256"}], "outputs": [{"name": "", "type": "address", "internalType": "address"}], "stateMutability": "pure"}, {"name": "existingOtherBlockchain", "type": "function", "inputs": [{"name": "", "type": "uint256", "internalType": "uint256"}], "outputs": [{"name": "", "type": "bool", "internalType": "bool"}], "stateMutability": "view"}, {"name": "feeAmountOfBlockchain", "type": "function", "inputs": [{"name": "", "type": "uint256", "internalType": "uint256"}], "outputs": [{"name": "", "type": "uint256", "internalType": "uint256"}], "stateMutability": "view"}, {"name": "getHashPacked", "type": "function", "inputs": [{"name": "user", "type": "address", "internalType": "address"}, {"name": "amountWithFee", "type": "uint256", "internalType": "uint256"}, {"name": "originalTxHash", "type": "bytes32", "internalType": "bytes32"}, {"name": "blockchainNum", "type": "uint256", "internalType": "uint256"}], "outputs": [{"name": "", "type": "bytes32", "internalType": "bytes32"}], "stateMutability": "pure"}, {"name": "getOtherBlockchainAvailableByNum", "type": "function", "inputs": [{"name": "blockchain", "type": "uint256", "internalType": "uint256"}], "outputs": [{"name": "", "type": "bool", "internalType": "bool"}], "stateMutability": "view"}, {"name": "getRoleAdmin", "type": "function", "inputs": [{"name": "role", "type": "bytes32", "internalType": "bytes32"}], "outputs": [{"name": "", "type": "bytes32", "internalType": "bytes32"}], "stateMutability": "view"}, {"name": "grantRole", "type": "function", "inputs": [{"name": "role", "type": "bytes32", "internalType": "bytes32"}, {"name": "account", "type": "address", "internalType": "address"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "hasRole", "type": "function", "inputs": [{"name": "role", "type": "bytes32", "internalType": "bytes32"}, {"name": "account", "type": "address", "internalType": "address"}], "outputs": [{"name": "", "type": "bool", "internalType": "bool"}], "stateMutability": "view"}, {"name": "isManager", "type": "function", "inputs": [{"name": "account", "type": "address", "internalType": "address"}], "outputs": [{"name": "", "type": "bool", "internalType": "bool"}], "stateMutability": "view"}, {"name": "isOwner", "type": "function", "inputs": [{"name": "account", "type": "address", "internalType": "address"}], "outputs": [{"name": "", "type": "bool", "internalType": "bool"}], "stateMutability": "view"}, {"name": "isRelayer", "type": "function", "inputs": [{"name": "account", "type": "address", "internalType": "address"}], "outputs": [{"name": "", "type": "bool", "internalType": "bool"}], "stateMutability": "view"}, {"name": "isValidator", "type": "function", "inputs": [{"name": "account", "type": "address", "internalType": "address"}], "outputs": [{"name": "", "type": "bool", "internalType": "bool"}], "stateMutability": "view"}, {"name": "maxGasPrice", "type": "function", "inputs": [], "outputs": [{"name": "", "type": "uint256", "internalType": "uint256"}], "stateMutability": "view"}, {"name": "maxTokenAmount", "type": "function", "inputs": [], "outputs": [{"name": "", "type": "uint256", "internalType": "uint256"}], "stateMutability": "view"}, {"name": "minConfirmationBlocks", "type": "function", "inputs": [], "outputs": [{"name": "", "type": "uint256", "internalType": "uint256"}], "stateMutability": "view"}, {"name": "minConfirmationSignatures", "type": "function", "inputs": [], "outputs": [{"name": "", "type": "uint256", "internalType": "uint256"}], "stateMutability": "view"}, {"name": "minTokenAmount", "type": "function", "inputs": [], "outputs": [{"name": "", "type": "uint256", "internalType": "uint256"}], "stateMutability": "view"}, {"name": "numOfThisBlockchain", "type": "function", "inputs": [], "outputs": [{"name": "", "type": "uint128", "internalType": "uint128"}], "stateMutability": "view"}, {"name": "pauseExecution", "type": "function", "inputs": [], "outputs": [], "stateMutability": "nonpayable"}, {"name": "paused", "type": "function", "inputs": [], "outputs": [{"name": "", "type": "bool", "internalType": "bool"}], "stateMutability": "view"}, {"name": "poolBalancing", "type": "function", "inputs": [{"name": "amount", "type": "uint256", "internalType": "uint256"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "processedTransactions", "type": "function", "inputs": [{"name": "", "type": "bytes32", "internalType": "bytes32"}], "outputs": [{"name": "", "type": "uint256", "internalType": "uint256"}], "stateMutability": "view"}, {"name": "refundSlippage", "type": "function", "inputs": [], "outputs": [{"name": "", "type": "uint256", "internalType": "uint256"}], "stateMutability": "view"}, {"name": "removeOtherBlockchain", "type": "function", "inputs": [{"name": "numOfOtherBlockchain", "type": "uint128", "internalType": "uint128"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "renounceRole", "type": "function", "inputs": [{"name": "role", "type": "bytes32", "internalType": "bytes32"}, {"name": "account", "type": "address", "internalType": "address"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "revokeRole", "type": "function", "inputs": [{"name": "role", "type": "bytes32", "internalType": "bytes32"}, {"name": "account", "type": "address", "internalType": "address"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "setCryptoFeeOfBlockchain", "type": "function", "inputs": [{"name": "_blockchainNum", "type": "uint128", "internalType": "uint128"}, {"name": "feeAmount", "type": "uint256", "internalType": "uint256"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "setFeeAmountOfBlockchain", "type": "function", "inputs": [{"name": "_blockchainNum", "type": "uint128", "internalType": "uint128"}, {"name": "feeAmount", "type": "uint256", "internalType": "uint256"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "setMaxGasPrice", "type": "function", "inputs": [{"name": "_maxGasPrice", "type": "uint256", "internalType": "uint256"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "setMaxTokenAmount", "type": "function", "inputs": [{"name": "_maxTokenAmount", "type": "uint256", "internalType": "uint256"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "setMinConfirmationBlocks", "type": "function", "inputs": [{"name": "_minConfirmationBlocks", "type": "uint256", "internalType": "uint256"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "setMinConfirmationSignatures", "type": "function", "inputs": [{"name": "_minConfirmationSignatures", "type": "uint256", "internalType": "uint256"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "setMinTokenAmount", "type": "function", "inputs": [{"name": "_minTokenAmount", "type": "uint256", "internalType": "uint256"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "setRefundSlippage", "type": "function", "inputs": [{"name": "_refundSlippage", "type": "uint256", "internalType": "uint256"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "setRubicAddressOfBlockchain", "type": "function", "inputs": [{"name": "_blockchainNum", "type": "uint128", "internalType": "uint128"}, {"name": "_RubicAddress", "type": "bytes32", "internalType": "bytes32"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "supportsInterface", "type": "function", "inputs": [{"name": "interfaceId", "type": "bytes4", "internalType": "bytes4"}], "outputs": [{"name": "", "type": "bool", "internalType": "bool"}], "stateMutability": "view"}, {"name": "toEthSignedMessageHash", "type": "function", "inputs": [{"name": "hash", "type": "bytes32", "internalType": "bytes32"}], "outputs": [{"name": "", "type": "bytes32", "internalType": "bytes32"}], "stateMutability": "pure"}, {"name": "transferOwnerAndSetManager", "type": "function", "inputs": [{"name": "newOwner", "type": "address", "internalType": "address"}, {"name": "newManager", "type": "address", "internalType": "address"}], "outputs": [], "stateMutability": "nonpayable"}, {"type": "receive", "stateMutability": "payable"}, {"name": "getInfoAboutSig", "type": "function", "inputs": [{"name": "sig", "type": "bytes4", "internalType": "bytes4"}, {"name": "slot", "type": "bytes32", "internalType": "bytes32"}], "outputs": [{"name": "implementationAddress", "type": "address", "internalType": "address"}, {"name": "router", "type": "address", "internalType": "address"}], "stateMutability": "view"}, {"name": "addInstance", "type": "function", "inputs": [{"name": "sig", "type": "bytes4", "internalType": "bytes4"}, {"name": "_address", "type": "address", "internalType": "address"}, {"name": "_router", "type": "address", "internalType": "address"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "setRouter", "type": "function", "inputs": [{"name": "sig", "type": "bytes4", "internalType": "bytes4"}, {"name": "_router", "type": "address", "internalType": "address"}], "outputs": [], "stateMutability": "nonpayable"}, {"name": "Paused", "type": "event", "inputs": [{"name": "account", "type": "address", "indexed": false, "internalType": "address"}], "anonymous": false}, {"name": "RoleAdminChanged", "type": "event", "inputs": [{"name": "role", "type": "bytes32", "indexed": true, "internalType": "bytes32"}, {"name": "previousAdminRole", "type": "bytes32", "indexed": true, "internalType": "bytes32"}, {"name": "newAdminRole", "type": "bytes32", "indexed": true, "internalType": "bytes32"}], "anonymous": false}, {"name": "RoleGranted", "type": "event", "inputs": [{"name": "role", "type": "bytes32", "indexed": true, "internalType": "bytes32"}, {"name": "account", "type": "address", "indexed": true, "internalType": "address"}, {"name": "sender", "type": "address", "indexed": true, "internalType": "address"}], "anonymous": false}, {"name": "RoleRevoked", "type": "event", "inputs": [{"name": "role", "type": "bytes32", "indexed": true, "internalType": "bytes32"}, {"name": "account", "type": "address", "indexed": true, "internalType": "address"}, {"name": "sender", "type": "address", "indexed": true, "internalType": "address"}], "anonymous": false}, {"name": "TransferCryptoToOtherBlockchainUser", "type": "event", "inputs": [{"name": "RBCAmountIn", "type": "uint256", "indexed": false, "internalType": "uint256"}, {"name": "amountSpent", "type": "uint256", "indexed": false, "internalType": "uint256"}], "anonymous": false}, {"name": "TransferFromOtherBlockchain", "type": "event", "inputs": [{"name": "user", "type": "address", "indexed": false, "internalType": "address"}, {"name": "amount", "type": "uint256", "indexed": false, "internalType": "uint256"}, {"name": "amountWithoutFee", "type": "uint256", "indexed": false, "internalType": "uint256"}, {"name": "originalTxHash", "type": "bytes32", "indexed": false, "internalType": "bytes32"}], "anonymous": false}, {"name": "TransferTokensToOtherBlockchainUser", "type": "event", "inputs": [{"name": "RBCAmountIn", "type": "uint256", "indexed": false, "internalType": "uint256"}, {"name": "amountSpent", "type": "uint256", "indexed": false, "internalType": "uint256"}], "anonymous": false}, {"name": "Unpaused", "type": "event", "inputs": [{"name": "account", "type": "address", "indexed": false, "internalType": "address"}], "anonymous": false}, {"name": "userRefunded", "type": "event", "inputs": [{"name": "user", "type": "address", "indexed": false, "internalType": "address"}, {"name": "amount", "type": "uint256", "indexed": false, "internalType": "uint256"}, {"name": "amountWithoutFee", "type": "uint256", "indexed": false, "internalType": "uint256"}, {"name": "originalTxHash", "type": "bytes32", "indexed": false, "internalType": "bytes32"}], "anonymous": false}]'
@@ -16,4 +16,18 @@ environ.setdefault(
     'crosschain_backend.settings.base',
 )
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+from validators.streams import (  # noqa: E402
+    SIGNATURE_STREAM_PATH,
+    signature_stream_application,
+)
+
+
+async def application(scope, receive, send):
+    # Django views can't stream asynchronously, so the signature stream is
+    # served by the plain ASGI application
+    if scope['type'] == 'http' and scope['path'] == SIGNATURE_STREAM_PATH:
+        return await signature_stream_application(scope, receive, send)
+
+    return await django_application(scope, receive, send)
@@ -1,6 +1,7 @@
 from os import environ
 
 from celery import Celery
+from celery.signals import worker_init
 from django.conf import settings
 
 # Set the default Django settings module for the 'celery' program.
@@ -25,3 +26,19 @@ app.config_from_object(
 
 # Load task modules from all registered Django app configs.
 app.autodiscover_tasks()
+
+
+@worker_init.connect
+def setup_cooperative_database(**kwargs):
+    """
+    Greenlets of gevent pool share one thread, so blocking psycopg2 calls
+    are switched to the gevent hub. Each greenlet has its own Django
+    connection, which is closed after the task, because greenlets can't
+    reuse connections of each other.
+    """
+
+    from base.support_functions.cooperative import make_psycopg_cooperative
+
+    if make_psycopg_cooperative():
+        for database in settings.DATABASES.values():
+            database['CONN_MAX_AGE'] = 0
@@ -98,6 +98,11 @@ DATABASES = {
         'PASSWORD': environ.get('DATABASE_ORIGIN_PASS'),
         'HOST': environ.get('DATABASE_HOST'),
         'PORT': environ.get('DATABASE_PORT'),
+        # ASGI backend runs sync views in threads of its executor, which
+        # don't close persistent connections, so they are closed after
+        # every request. Scanners and workers keep them by the pipeline
+        # settings.
+        'CONN_MAX_AGE': 0,
     }
 }
 
@@ -219,6 +224,52 @@ BROKER_PORT = environ.get('BROKER_PORT')
 BROKER_URL = f'redis://{BROKER_HOST}:{BROKER_PORT}/0'
 BROKER_TRANSPORT_OPTIONS = {'visibility_timeout': 3600, }
 
+# CONTRACT CACHE
+CONTRACT_CACHE_URL = f'redis://{BROKER_SERVICE_NAME}:{BROKER_PORT}/1'
+# Seconds for which results of contract read methods are cached,
+# None means forever
+CONTRACT_CACHE_TTLS = {
+    'is_paused': 60,
+    'block_number_of_creation': None,
+    'confirmation_block_count': 3600,
+    'max_gas_price': 300,
+    'min_token_amount': 300,
+    'confirmation_signatures_count': 3600,
+    'router_address': 3600,
+    'fee_amount_of_blockchain': 300,
+    'transit_token_decimals': None,
+}
+DEFAULT_CONTRACT_CACHE_TTL = 60
+
+# CONTRACT CALL CACHE
+# Count of contract read methods results cached in memory of process
+CONTRACT_CALL_CACHE_SIZE = 4096
+# Seconds for which results of view methods at the latest block are cached,
+# results of other view methods are cached only for an exact block number
+CONTRACT_CALL_CACHE_TTLS = {
+    'numOfThisBlockchain': 3600,
+    'RubicAddresses': 300,
+    'existingOtherBlockchain': 300,
+    'getOtherBlockchainAvailableByNum': 300,
+}
+
+# ABI ARTIFACTS
+# Directory of compiled contracts ABIs shared by all processes
+ABI_ARTIFACTS_DIR = environ.get(
+    'ABI_ARTIFACTS_DIR',
+    BASE_DIR.parent / 'abi_artifacts',
+)
+# Count of web3 contract objects kept by process
+CONTRACT_INSTANCE_CACHE_SIZE = 256
+
+# NOTIFICATIONS
+# Seconds for which identical errors are coalesced into one digest
+NOTIFICATION_DIGEST_WINDOW = 60
+# Max count of digests which are sent at once
+NOTIFICATION_BUCKET_CAPACITY = 20
+# Count of digests per second which can be sent after the burst
+NOTIFICATION_BUCKET_REFILL_RATE = 10 / 60
+
 # CELERY
 CELERY_DATA_FORMAT = 'json'
 CELERY_BROKER_URL = f'redis://{BROKER_SERVICE_NAME}:{BROKER_PORT}/0'
@@ -232,7 +283,7 @@ CELERY_QUEUE_HIGH_NAME = 'high'
 CELERY_QUEUE_MIDDLE_NAME = 'middle'
 CELERY_QUEUE_LOW_NAME = 'low'
 
-CELERY_QUEUES = (
+CELERY_TASK_QUEUES = (
     Queue(
         CELERY_QUEUE_HIGH_NAME,
         Exchange(CELERY_QUEUE_HIGH_NAME),
@@ -249,13 +300,36 @@ CELERY_QUEUES = (
         routing_key=CELERY_QUEUE_LOW_NAME
     ),
 )
-CELERY_DEFAULT_QUEUE = CELERY_QUEUE_MIDDLE_NAME
-CELERY_DEFAULT_EXCHANGE = CELERY_QUEUE_MIDDLE_NAME
-CELERY_DEFAULT_ROUTING_KEY = CELERY_QUEUE_MIDDLE_NAME
-CELERY_ROUTES = {
-    'notifications.tasks.send_error_notification_task': {
+CELERY_TASK_DEFAULT_QUEUE = CELERY_QUEUE_MIDDLE_NAME
+CELERY_TASK_DEFAULT_EXCHANGE = CELERY_QUEUE_MIDDLE_NAME
+CELERY_TASK_DEFAULT_ROUTING_KEY = CELERY_QUEUE_MIDDLE_NAME
+# Signature delivery doesn't wait for sweeps and notifications, every queue
+# is consumed by its own worker
+CELERY_TASK_ROUTES = {
+    # HIGH
+    'validators.tasks.process_swap_task': {
+        'queue': CELERY_QUEUE_HIGH_NAME,
+    },
+    # MIDDLE
+    'validators.tasks.reconcile_swaps_task': {
         'queue': CELERY_QUEUE_MIDDLE_NAME,
     },
+    'contracts.tasks.refresh_contract_states_task': {
+        'queue': CELERY_QUEUE_MIDDLE_NAME,
+    },
+    # LOW
+    'validators.tasks.update_swaps_task': {
+        'queue': CELERY_QUEUE_LOW_NAME,
+    },
+    'validators.tasks.archive_swaps_task': {
+        'queue': CELERY_QUEUE_LOW_NAME,
+    },
+    'notifications.tasks.send_error_notification_task': {
+        'queue': CELERY_QUEUE_LOW_NAME,
+    },
+    'notifications.tasks.send_error_digests_task': {
+        'queue': CELERY_QUEUE_LOW_NAME,
+    },
 }
 
 CELERY_BEAT_SCHEDULE = {
@@ -264,13 +338,44 @@ CELERY_BEAT_SCHEDULE = {
         'task': 'validators.tasks.update_swaps_task',
         'schedule': timedelta(seconds=60),
     },
+    # CHECK PENDING SWAPS IN TARGET CONTRACTS
+    'reconcile_swaps_task': {
+        'task': 'validators.tasks.reconcile_swaps_task',
+        'schedule': timedelta(minutes=10),
+    },
+    # REFRESH SNAPSHOTS OF ROUTING CONTRACTS
+    'refresh_contract_states_task': {
+        'task': 'contracts.tasks.refresh_contract_states_task',
+        'schedule': timedelta(seconds=30),
+    },
+    # SEND DIGESTS OF ERROR NOTIFICATIONS
+    'send_error_digests_task': {
+        'task': 'notifications.tasks.send_error_digests_task',
+        'schedule': timedelta(seconds=NOTIFICATION_DIGEST_WINDOW),
+    },
+    # MOVE FINISHED SWAPS TO ARCHIVE
+    'archive_swaps_task': {
+        'task': 'validators.tasks.archive_swaps_task',
+        'schedule': timedelta(hours=1),
+    },
 }
 
-CELERYD_HIJACK_ROOT_LOGGER = False
-CELERYD_LOG_COLOR = True
-
-CELERYD_PREFETCH_MULTIPLIER = 1
-CELERYD_CONCURRENCY = int(environ.get('CELERY_CONCURRENCY', 1))
+CELERY_WORKER_HIJACK_ROOT_LOGGER = False
+CELERY_WORKER_LOG_COLOR = True
+
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1
+CELERY_WORKER_CONCURRENCY = int(environ.get('CELERY_CONCURRENCY', 1))
+
+# IO WORKER
+# Tasks mostly wait for RPC nodes, relayer and database, so worker can run
+# them by greenlets of gevent pool. Pool has to be chosen by "-P gevent"
+# option of worker, which entrypoint passes if the mode is enabled.
+GEVENT_SUPPORT = bool(int(environ.get('GEVENT_SUPPORT', 0)))
+# Count of connections kept to the same host by HTTP sessions of process,
+# with gevent pool it should be close to concurrency of worker
+HTTP_POOL_SIZE = int(
+    environ.get('HTTP_POOL_SIZE', 30 if GEVENT_SUPPORT else 10)
+)
 
 # DRF_SPECTACULAR
 SPECTACULAR_SETTINGS = {
@@ -293,21 +398,24 @@ ALLOWED_HOSTS = (
     '*',
 )
 
-INSTALLED_APPS.append('debug_toolbar')
-
 INTERNAL_IPS = (
     '127.0.0.1',
     '0.0.0.0',
 )
 
-MIDDLEWARE.append('debug_toolbar.middleware.DebugToolbarMiddleware')
+# Toolbar is shown only in debug mode, see urls
+if DEBUG:
+    INSTALLED_APPS.append('debug_toolbar')
+    MIDDLEWARE.append('debug_toolbar.middleware.DebugToolbarMiddleware')
 
 # FOR VALIDATOR WORK
 VALIDATOR_ADDRESS = str(environ.get('VALIDATOR_ADDRESS'))
 VALIDATOR_NAME = str(environ.get('VALIDATOR_NAME'))
 VALIDATOR_PRIVATE_KEY = str(environ.get('VALIDATOR_PRIVATE_KEY'))
-PRIVATE_PASSWORD_FOR_SIGNATURE_API = str(
-    environ.get('PRIVATE_PASSWORD_FOR_SIGNATURE_API')
+# Signature API is closed if password isn't set
+PRIVATE_PASSWORD_FOR_SIGNATURE_API = environ.get(
+    'PRIVATE_PASSWORD_FOR_SIGNATURE_API',
+    '',
 )
 
 # OTHER
@@ -315,6 +423,12 @@ BLOCK_RANGE = int(environ.get('BLOCK_RANGE'))
 MIN_CONFIRMATION_BLOCK_COUNT = int(environ.get('MIN_CONFIRMATION_BLOCK_COUNT'))
 DEFAULT_SCANNER_TIMEOUT = int(environ.get('DEFAULT_SCANNER_TIMEOUT'))
 DEFAULT_SCANNER_TIMEOUT_FAST = int(environ.get('DEFAULT_SCANNER_TIMEOUT_FAST'))
+# Seconds between reports of USS and PSS of scanner processes
+SCANNER_MEMORY_REPORT_INTERVAL = int(
+    environ.get('SCANNER_MEMORY_REPORT_INTERVAL', 10 * 60)
+)
+# Seconds between reloads of scanners configuration by their supervisor
+SCANNER_RELOAD_INTERVAL = int(environ.get('SCANNER_RELOAD_INTERVAL', 30))
 
 MAIN_BACKEND = str(environ.get('MAIN_BACKEND'))
 RELAYER_URL = str(environ.get('RELAYER_URL'))
@@ -322,7 +436,16 @@ TOKEN_API = (
     f'{MAIN_BACKEND}/api/tokens/'
     '?address={address}&network={network_title}'
 )
-
+TOKEN_LIST_API = f'{MAIN_BACKEND}/api/tokens/' + '?network={network_title}'
+# Count of tokens which metadata is cached in memory of process
+TOKEN_METADATA_CACHE_SIZE = 10000
+# Seconds for which metadata of tokens is cached
+TOKEN_METADATA_CACHE_TTL = 24 * 60 * 60
+# Seconds for which tokens unknown by main backend are cached
+TOKEN_METADATA_NEGATIVE_CACHE_TTL = 5 * 60
+
+# Used only for contracts which transit token decimals can't be read,
+# e.g. Solana contract
 CONTRACT_BLOCKCHAIN_IDS_TOKEN_WITH_SIX_DECIMALS = (2, 3, 4, 5, 6, 7, 8, 10, 11)
 
 EXCLUDED_BLOCKCHAIN_IDS_FOR_SELECT = (
@@ -330,5 +453,28 @@ EXCLUDED_BLOCKCHAIN_IDS_FOR_SELECT = (
     8,  # SOLANA
 )
 
+# Count of swaps checked in target contract with one batch request
+RECONCILIATION_CHUNK_SIZE = int(environ.get('RECONCILIATION_CHUNK_SIZE', 300))
+
+# CONTRACT STATE
+# Seconds after which snapshot of contract state isn't used
+CONTRACT_STATE_MAX_AGE = int(environ.get('CONTRACT_STATE_MAX_AGE', 120))
+
+# ARCHIVE
+# Finished swaps older than that are moved to the archive
+ARCHIVE_SWAPS_AFTER_DAYS = int(environ.get('ARCHIVE_SWAPS_AFTER_DAYS', 30))
+ARCHIVE_BATCH_SIZE = 1000
+ARCHIVE_PARTITION_MONTHS_AHEAD = 3
+
+# SIGNATURE FEED API
+SIGNATURE_FEED_PAGE_SIZE = 500
+SIGNATURE_FEED_LONG_POLL_TIMEOUT = 25
+SIGNATURE_FEED_POLL_INTERVAL = 1
+
+# SIGNATURE STREAM
+SIGNATURE_STREAM_CHANNEL = 'validator_signatures'
+SIGNATURE_STREAM_QUEUE_SIZE = 1000
+SIGNATURE_STREAM_KEEPALIVE_INTERVAL = 15
+
 # TELEGRAM BOT
 TELEGRAM_BACKEND_URL = environ.get('TELEGRAM_BACKEND_URL')
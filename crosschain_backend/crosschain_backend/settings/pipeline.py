@@ -0,0 +1,39 @@
+"""
+Django settings of scanners and Celery processes.
+
+They don't serve HTTP requests, so only applications of models used by the
+pipeline are loaded, without admin, API and debug extensions. Celery beat
+keeps the base settings, because its scheduler is stored by
+django_celery_beat.
+"""
+from os import environ
+
+from .base import *  # noqa: F401, F403
+
+INSTALLED_APPS = [
+    'django.contrib.auth',
+    'django.contrib.contenttypes',
+
+    # APPS
+    'contracts',
+    'networks',
+    'notifications',
+    'users',
+    'validators',
+    ###
+]
+
+MIDDLEWARE = []
+
+TEMPLATES = []
+
+# URLs are served only by backend
+ROOT_URLCONF = None
+
+# Seconds for which process keeps connection open between tasks and
+# scanner iterations. Every process of scanners and workers keeps own
+# connection, so their total count has to be under max_connections of
+# Postgres, see .env.example.
+DATABASES['default']['CONN_MAX_AGE'] = int(  # noqa: F405
+    environ.get('DATABASE_CONN_MAX_AGE', 600)
+)
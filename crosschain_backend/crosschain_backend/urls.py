@@ -19,6 +19,7 @@ from django.urls import path, include
 
 urlpatterns = [
     path('admin/', admin.site.urls),
+    path('api/validators/', include('validators.urls')),
 ]
 
 if settings.DEBUG and settings.BACKEND_SETTINGS_MODE != 'production':
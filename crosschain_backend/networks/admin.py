@@ -77,9 +77,9 @@ class TransactionModelAdmin(ModelAdmin):
     )
     search_fields = (
         '=id',
-        'hash',
-        'sender',
-        'receiver',
+        '=hash',
+        '=sender',
+        '=receiver',
     )
     ordering = (
         '-_created_at',
@@ -0,0 +1,94 @@
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.db.transaction import atomic
+
+from networks.models import Transaction
+
+HEX_COLUMNS = (
+    'hash',
+    'block_hash',
+    'sender',
+    'receiver',
+    'sign_r',
+    'sign_s',
+)
+INTEGER_COLUMNS = (
+    'sign_v',
+)
+
+# Hex string without "0x" prefix padded to even length
+HEX_VALUE_SQL = (
+    "lpad("
+    "regexp_replace({column}, '^0x', ''), "
+    "length(regexp_replace({column}, '^0x', '')) "
+    "+ length(regexp_replace({column}, '^0x', '')) % 2, "
+    "'0'"
+    ")"
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Converts hex string columns of transactions to bytea before '
+        'migration. Already converted columns are skipped.'
+    )
+
+    def _get_column_types(self, cursor, table: str) -> dict:
+        cursor.execute(
+            'SELECT column_name, data_type FROM information_schema.columns'
+            ' WHERE table_name = %s;',
+            (table,),
+        )
+
+        return dict(cursor.fetchall())
+
+    def _drop_like_indexes(self, cursor, table: str, column: str):
+        """
+        Drops indexes with varchar_pattern_ops which Django creates for
+        indexed char columns, because bytea doesn't support them.
+        """
+
+        cursor.execute(
+            'SELECT indexname FROM pg_indexes'
+            ' WHERE tablename = %s AND indexname LIKE %s;',
+            (table, f'{table}\\_{column}\\_%\\_like'),
+        )
+
+        for index_name, in cursor.fetchall():
+            cursor.execute(f'DROP INDEX IF EXISTS "{index_name}";')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            return
+
+        table = Transaction._meta.db_table
+
+        with atomic(), connection.cursor() as cursor:
+            column_types = self._get_column_types(cursor, table)
+
+            for column in HEX_COLUMNS:
+                if column_types.get(column) != 'character varying':
+                    continue
+
+                self._drop_like_indexes(cursor, table, column)
+
+                hex_value_sql = HEX_VALUE_SQL.format(column=f'"{column}"')
+
+                cursor.execute(
+                    f'ALTER TABLE "{table}" ALTER COLUMN "{column}"'
+                    f' TYPE bytea USING decode({hex_value_sql}, \'hex\');'
+                )
+
+                self.stdout.write(f'"{table}.{column}" converted to bytea.')
+
+            for column in INTEGER_COLUMNS:
+                if column_types.get(column) != 'character varying':
+                    continue
+
+                cursor.execute(
+                    f'ALTER TABLE "{table}" ALTER COLUMN "{column}"'
+                    f' TYPE bigint USING'
+                    f' COALESCE(NULLIF("{column}", \'\'), \'0\')::bigint;'
+                )
+
+                self.stdout.write(f'"{table}.{column}" converted to bigint.')
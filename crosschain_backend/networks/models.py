@@ -6,19 +6,24 @@ from django.db.models import (
     CharField,
     DecimalField,
     ForeignKey,
+    Index,
     JSONField,
+    PositiveBigIntegerField,
     PositiveIntegerField,
     PROTECT,
 )
 from django.db.utils import IntegrityError
 from eth_utils import add_0x_prefix
-from web3 import Web3, HTTPProvider
+from eth_utils.abi import collapse_if_tuple
+from web3 import Web3
 from web3.datastructures import AttributeDict
 from web3.types import HexBytes
 
+from base.fields import HexBytesField
 from base.models import AbstractBaseModel
+from base.support_functions.singleflight import singleflight
+from base.support_functions.base import base58_to_hex
 from crosschain_backend.consts import (
-    ETH_LIKE_HASH_LENGTH,
     MAX_WEI_DIGITS,
     NETWORK_ERROR,
     NETWORK_NAMES,
@@ -35,13 +40,17 @@ from .exceptions import (
     ProviderNotConnected,
     TransactionError,
 )
+from .services.call_cache import contract_call_cache
+from .services.clients import rpc_clients
 from .services.functions import (
     convert_to_checksum_address_format,
+    from_hex,
     reset_connection,
 )
 
 DEFAULT_POLL_LATENCY = 1
 DEFAULT_TXN_TIMEOUT = 120
+DEFAULT_BATCH_REQUEST_TIMEOUT = 30
 
 
 class Network(AbstractBaseModel):
@@ -65,7 +74,6 @@ class Network(AbstractBaseModel):
 
     class Meta:
         db_table = 'networks'
-        ordering = '-_created_at',
 
     def __str__(self) -> str:
         return f'{self.title} (id: {self.id})'
@@ -86,7 +94,7 @@ class Network(AbstractBaseModel):
                 )
             )
 
-            provider = Web3(HTTPProvider(rpc_url))
+            provider = rpc_clients.get_web3(rpc_url)
 
             if provider.isConnected():
                 info(
@@ -124,7 +132,7 @@ class Network(AbstractBaseModel):
             )
         )
 
-        provider = Web3(HTTPProvider(rpc_url))
+        provider = rpc_clients.get_web3(rpc_url)
 
         if provider.isConnected():
             info(
@@ -165,6 +173,10 @@ class Network(AbstractBaseModel):
         return provider.eth.gasPrice
 
 
+def _get_rpc_provider_key(custom_rpc_provider) -> UUID:
+    return custom_rpc_provider.network.id
+
+
 class CustomRpcProvider:
     """
     That's class wraps methods of web3 rpc provider and switches to the
@@ -181,17 +193,36 @@ class CustomRpcProvider:
 
         return rpc_provider
 
+    @singleflight(_get_rpc_provider_key)
     @reset_connection
     def get_current_block_number(self):
         return self.rpc_provider.eth.get_block_number()
 
     @reset_connection
-    def get_contract(self, address: str, abi: str):
-        return self.rpc_provider.eth.contract(
-            address=convert_to_checksum_address_format(address),
+    def get_contract(self, address: str, abi: str, abi_hash: str = None):
+        """
+        Returns web3 contract object. Objects of ABIs with known hash are
+        shared by the process.
+
+        :param address: address of contract
+        :param abi: contract's ABI
+        :param abi_hash: hash of ABI content
+        """
+
+        if abi_hash is None:
+            return self.rpc_provider.eth.contract(
+                address=convert_to_checksum_address_format(address),
+                abi=abi,
+            )
+
+        return rpc_clients.get_contract(
+            rpc_url=self.network.rpc_url_list[self.url_number],
+            address=address,
             abi=abi,
+            abi_hash=abi_hash,
         )
 
+    @singleflight(_get_rpc_provider_key)
     @reset_connection
     def get_transaction(
             self,
@@ -199,6 +230,7 @@ class CustomRpcProvider:
     ):
         return self.rpc_provider.eth.getTransaction(txn_hash)
 
+    @singleflight(_get_rpc_provider_key)
     @reset_connection
     def get_transaction_receipt(
             self,
@@ -238,20 +270,33 @@ class CustomRpcProvider:
 
     @reset_connection
     def get_logs(self, contract, event_name, from_block, to_block):
-        web3_contract_instance = contract.load_contract(
-            provider=self,
-        )
+        """
+        Returns decoded logs of contract's event. Topic and types of event
+        are taken from compiled ABI of contract.
 
-        event = getattr(
-            web3_contract_instance.events,
-            event_name,
-        )
+        :param contract: Contract instance
+        :param event_name: name of contract's event
+        :param from_block: first scanned block number
+        :param to_block: last scanned block number
+        """
 
-        return event().getLogs(
-            fromBlock=from_block,
-            toBlock=to_block,
+        compiled_event = contract.compiled_abi.events[event_name]
+        rpc_provider = self.rpc_provider
+
+        logs = rpc_provider.eth.get_logs(
+            {
+                'address': convert_to_checksum_address_format(
+                    contract.address
+                ),
+                'fromBlock': from_block,
+                'toBlock': to_block,
+                'topics': [from_hex(compiled_event.topic)],
+            }
         )
 
+        return [compiled_event.decode(rpc_provider.codec, log) for log in logs]
+
+    @singleflight(_get_rpc_provider_key)
     @reset_connection
     def contract_function_call(
         self,
@@ -259,18 +304,155 @@ class CustomRpcProvider:
         contract_function_name: str,
         params: tuple,
         contract_address: str = None,
+        block_identifier='latest',
     ):
+        """
+        Calls contract's read method. Results of pure and view methods
+        are memoized by contract address, calldata and block.
+
+        :param contract: Contract instance which abi will be used
+        :param contract_function_name: name of contract's read method
+        :param params: params of contract's read method
+        :param contract_address: address of contract if differs from Contract's
+        :param block_identifier: block number or tag at which method is called
+        """
+
         if not contract_address:
             contract_address = contract.address
 
-        contract_function = contract.load_contract(
+        web3_contract_instance = contract.load_contract(
             address=contract_address,
             provider=self,
-        ).get_function_by_name(contract_function_name)(
+        )
+        contract_function = web3_contract_instance.get_function_by_name(
+            contract_function_name
+        )(
             *params
         )
 
-        return contract_function.call()
+        ttl = contract_call_cache.get_ttl(
+            contract_function_name=contract_function_name,
+            state_mutability=contract_function.abi.get('stateMutability'),
+            block_identifier=block_identifier,
+        )
+
+        if ttl == 0:
+            return contract_function.call(block_identifier=block_identifier)
+
+        return contract_call_cache.get_or_call(
+            key=(
+                self.network.id,
+                web3_contract_instance.address,
+                web3_contract_instance.encodeABI(
+                    fn_name=contract_function_name,
+                    args=params,
+                ),
+                block_identifier,
+            ),
+            ttl=ttl,
+            call=lambda: contract_function.call(
+                block_identifier=block_identifier,
+            ),
+        )
+
+    @singleflight(_get_rpc_provider_key)
+    @reset_connection
+    def batch_contract_function_call(
+        self,
+        contract,
+        calls: list,
+        contract_address: str = None,
+    ) -> list:
+        """
+        Calls contract's read methods with one JSON-RPC batch request.
+        Returns results in the same order as calls.
+
+        :param contract: Contract instance which abi will be used
+        :param calls: list of (contract_function_name, params) pairs
+        :param contract_address: address of contract if differs from Contract's
+        """
+
+        if not calls:
+            return []
+
+        if not contract_address:
+            contract_address = contract.address
+
+        rpc_provider = self.rpc_provider
+        web3_contract_instance = contract.load_contract(
+            address=contract_address,
+            provider=self,
+        )
+
+        payload = []
+        output_types = []
+
+        for request_id, (contract_function_name, params) in enumerate(calls):
+            contract_function = web3_contract_instance.get_function_by_name(
+                contract_function_name
+            )(
+                *params
+            )
+
+            payload.append(
+                {
+                    'jsonrpc': '2.0',
+                    'id': request_id,
+                    'method': 'eth_call',
+                    'params': [
+                        {
+                            'to': web3_contract_instance.address,
+                            'data': web3_contract_instance.encodeABI(
+                                fn_name=contract_function_name,
+                                args=params,
+                            ),
+                        },
+                        'latest',
+                    ],
+                }
+            )
+            output_types.append(
+                [
+                    collapse_if_tuple(output)
+                    for output in contract_function.abi.get('outputs', ())
+                ]
+            )
+
+        rpc_url = self.network.rpc_url_list[self.url_number]
+        response = rpc_clients.get_session(rpc_url).post(
+            url=rpc_url,
+            json=payload,
+            timeout=DEFAULT_BATCH_REQUEST_TIMEOUT,
+        )
+        response.raise_for_status()
+        response_data = response.json()
+
+        if not isinstance(response_data, list):
+            raise ValueError(
+                f'Batch request isn\'t supported by the node: {response_data}'
+            )
+
+        if len(response_data) != len(calls):
+            raise ValueError(
+                f'Node returned {len(response_data)} results '
+                f'for {len(calls)} calls.'
+            )
+
+        results = [None] * len(calls)
+
+        for item in response_data:
+            if item.get('error'):
+                raise ValueError(item['error'])
+
+            request_id = item['id']
+            result = rpc_provider.codec.decode_abi(
+                output_types[request_id],
+                HexBytes(item['result']),
+            )
+
+            results[request_id] = result[0] if len(result) == 1 else result
+
+        return results
 
 
 class Transaction(AbstractBaseModel):
@@ -284,31 +466,27 @@ class Transaction(AbstractBaseModel):
         related_name='network_transactions',
         verbose_name='Network',
     )
-    hash = CharField(
+    hash = HexBytesField(
         unique=True,
-        max_length=255,
         verbose_name='Hash',
     )
-    block_hash = CharField(
-        max_length=ETH_LIKE_HASH_LENGTH,
+    block_hash = HexBytesField(
         verbose_name='Block hash',
         blank=True,
-        default='',
+        default=b'',
     )
     block_number = PositiveIntegerField(
         verbose_name='Block number',
         blank=True,
         default=0,
     )
-    sender = CharField(
-        max_length=255,
+    sender = HexBytesField(
         verbose_name='Sender (from)',
-        default='',
+        default=b'',
     )
-    receiver = CharField(
-        max_length=255,
+    receiver = HexBytesField(
         verbose_name='Receiver (to)',
-        default='',
+        default=b'',
     )
     gas = DecimalField(
         max_digits=MAX_WEI_DIGITS,
@@ -326,20 +504,17 @@ class Transaction(AbstractBaseModel):
         verbose_name='Nonce',
         default=0,
     )
-    sign_r = CharField(
-        max_length=ETH_LIKE_HASH_LENGTH,
+    sign_r = HexBytesField(
         verbose_name='R',
-        default='',
+        default=b'',
     )
-    sign_s = CharField(
-        max_length=ETH_LIKE_HASH_LENGTH,
+    sign_s = HexBytesField(
         verbose_name='S',
-        default='',
+        default=b'',
     )
-    sign_v = CharField(
-        max_length=ETH_LIKE_HASH_LENGTH,
+    sign_v = PositiveBigIntegerField(
         verbose_name='V',
-        default='',
+        default=0,
     )
     index = PositiveIntegerField(
         verbose_name='Index',
@@ -376,7 +551,12 @@ class Transaction(AbstractBaseModel):
 
     class Meta:
         db_table = 'transactions'
-        ordering = '-_created_at',
+        indexes = (
+            Index(
+                fields=('network', 'block_number',),
+                name='transactions_network_block_idx',
+            ),
+        )
 
     def __str__(self) -> str:
         return f'{self.hash} in {self.network.title} (id: {self.id})'
@@ -390,11 +570,7 @@ class Transaction(AbstractBaseModel):
 
         if self.block_hash is None:
             self.block_hash = ''
-        elif isinstance(self.block_hash, HexBytes):
-            self.block_hash = self.block_hash.hex()
 
-        self.sign_r = self.sign_r.lower()
-        self.sign_s = self.sign_s.lower()
         self.type = self.type.lower()
 
         return super().save(*args, **kwargs)
@@ -404,13 +580,15 @@ class Transaction(AbstractBaseModel):
 
     @classmethod
     def get_last_block_number(cls, network_id: UUID) -> int:
-        transaction = cls.objects \
+        block_number = cls.objects \
             .filter(
                 network_id=network_id,
             ) \
-            .last()
+            .order_by('-block_number') \
+            .values_list('block_number', flat=True) \
+            .first()
 
-        if not transaction:
+        if block_number is None:
             warning(
                 TRANSACTION_WARNING.format(
                     f'No transactions in the network with \"{network_id}\" id.'
@@ -419,16 +597,17 @@ class Transaction(AbstractBaseModel):
 
             return
 
-        return transaction.block_number
+        return block_number
 
     @classmethod
+    @singleflight()
     def get_transaction(cls, network_id: UUID, txn_hash: HASH_LIKE):
         if isinstance(txn_hash, HexBytes):
             txn_hash = txn_hash.hex()
 
         transaction = cls.objects.filter(
             network_id=network_id,
-            hash__iexact=txn_hash,
+            hash=txn_hash,
         ) \
             .first()
 
@@ -457,7 +636,7 @@ class Transaction(AbstractBaseModel):
         try:
             if network.title == NETWORK_NAMES.get('solana'):
                 transaction = cls.objects.create(
-                    hash=txn_hash,
+                    hash=base58_to_hex(txn_hash),
                     network=network,
                 )
             else:
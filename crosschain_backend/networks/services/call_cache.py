@@ -0,0 +1,157 @@
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Callable, Hashable
+
+from django.conf import settings
+
+CONTRACT_CALL_CACHE_SIZE = settings.CONTRACT_CALL_CACHE_SIZE
+CONTRACT_CALL_CACHE_TTLS = settings.CONTRACT_CALL_CACHE_TTLS
+
+STATE_MUTABILITY_PURE = 'pure'
+STATE_MUTABILITY_VIEW = 'view'
+
+# Cached value never expires
+NEVER_EXPIRES = None
+
+
+class LruCache:
+    """
+    Bounded LRU cache of the process which values expire by TTL
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._values = OrderedDict()
+        self._lock = Lock()
+
+    def reset_lock(self):
+        """
+        Replaces lock in forked process, because it may be held by another
+        thread of the parent process at the moment of fork
+        """
+
+        self._lock = Lock()
+
+    def get(self, key: Hashable) -> tuple:
+        """
+        Returns (is_found, value) pair of actual cached value by key
+
+        :param key: hashable key of value
+        """
+
+        with self._lock:
+            cached = self._values.get(key)
+
+            if cached is not None:
+                value, expires_at = cached
+
+                if expires_at is None or expires_at > monotonic():
+                    self._values.move_to_end(key)
+                    self.hits += 1
+
+                    return True, value
+
+                del self._values[key]
+
+            self.misses += 1
+
+        return False, None
+
+    def set(self, key: Hashable, value, ttl):
+        """
+        Caches value by key. The least recently used values are removed
+        if cache is full.
+
+        :param key: hashable key of value
+        :param value: cached value
+        :param ttl: seconds for which value is cached, None means forever
+        """
+
+        with self._lock:
+            self._values[key] = (
+                value,
+                None if ttl is NEVER_EXPIRES else monotonic() + ttl,
+            )
+            self._values.move_to_end(key)
+
+            while len(self._values) > self.max_size:
+                self._values.popitem(last=False)
+
+    def get_or_call(self, key: Hashable, ttl, call: Callable):
+        """
+        Returns cached result of call by key. If there is no actual result
+        in cache, call is made and its result is cached with TTL.
+
+        :param key: hashable key of call
+        :param ttl: seconds for which result is cached, None means forever
+        :param call: function which makes the call
+        """
+
+        is_found, value = self.get(key)
+
+        if is_found:
+            return value
+
+        value = call()
+
+        self.set(key, value, ttl)
+
+        return value
+
+    @property
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._values),
+                'max_size': self.max_size,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+class ContractCallCache(LruCache):
+    """
+    Bounded LRU cache of contract read methods results of the process.
+
+    Results of pure methods are cached forever, results of view methods
+    are cached forever for an exact block number and with TTL otherwise.
+    """
+
+    @staticmethod
+    def get_ttl(
+        contract_function_name: str,
+        state_mutability: str,
+        block_identifier='latest',
+    ):
+        """
+        Returns seconds for which result of call is cached, NEVER_EXPIRES
+        if it isn't changed, and 0 if call can't be cached
+
+        :param contract_function_name: name of contract's read method
+        :param state_mutability: stateMutability of method in contract's ABI
+        :param block_identifier: block number or tag at which method is called
+        """
+
+        if state_mutability == STATE_MUTABILITY_PURE:
+            return NEVER_EXPIRES
+
+        if state_mutability != STATE_MUTABILITY_VIEW:
+            return 0
+
+        # Negative block numbers are counted from the latest block
+        if isinstance(block_identifier, int) and block_identifier >= 0:
+            return NEVER_EXPIRES
+
+        return CONTRACT_CALL_CACHE_TTLS.get(contract_function_name, 0)
+
+
+contract_call_cache = ContractCallCache(CONTRACT_CALL_CACHE_SIZE)
@@ -0,0 +1,163 @@
+from os import register_at_fork
+from threading import Lock
+
+from django.conf import settings
+from requests import Session
+from web3 import HTTPProvider, Web3
+
+from base.support_functions.requests import get_pooled_session
+from .call_cache import NEVER_EXPIRES, LruCache
+from .functions import convert_to_checksum_address_format
+
+HTTP_POOL_SIZE = settings.HTTP_POOL_SIZE
+CONTRACT_INSTANCE_CACHE_SIZE = settings.CONTRACT_INSTANCE_CACHE_SIZE
+
+DEFAULT_RPC_REQUEST_TIMEOUT = 10
+
+
+class SharedSessionHTTPProvider(HTTPProvider):
+    """
+    HTTP provider which sends requests through the given session.
+
+    Sessions of web3 itself are kept in LRU cache of 8 urls and are closed
+    on eviction, even if another thread or greenlet is sending request
+    through the session at that moment.
+    """
+
+    def __init__(self, endpoint_uri: str, session: Session):
+        super().__init__(endpoint_uri)
+
+        self._session = session
+
+    def replace_session(self, session: Session):
+        self._session = session
+
+    def make_request(self, method, params):
+        self.logger.debug(
+            'Making request HTTP. URI: %s, Method: %s',
+            self.endpoint_uri,
+            method,
+        )
+
+        request_kwargs = dict(self.get_request_kwargs())
+        request_kwargs.setdefault('timeout', DEFAULT_RPC_REQUEST_TIMEOUT)
+
+        response = self._session.post(
+            self.endpoint_uri,
+            data=self.encode_rpc_request(method, params),
+            **request_kwargs,
+        )
+        response.raise_for_status()
+
+        return self.decode_rpc_response(response.content)
+
+
+class RpcClientRegistry:
+    """
+    Web3 clients and sessions of RPC nodes which are shared by all threads
+    and greenlets of the process, so connections to the node are reused
+    instead of opened by every task.
+    """
+
+    def __init__(self, pool_size: int):
+        self._pool_size = pool_size
+        self.reset()
+
+    def reset(self):
+        """
+        Forgets clients without closing them, so a forked process doesn't
+        use sockets of the parent process.
+        """
+
+        self._lock = Lock()
+        self._sessions = {}
+        self._clients = {}
+        self._contracts = LruCache(CONTRACT_INSTANCE_CACHE_SIZE)
+
+    def reset_sessions(self):
+        """
+        Replaces sessions of clients without closing the old ones, so a
+        forked process doesn't use sockets of the parent process. Clients
+        and contract objects built before fork are kept, so they are
+        shared with the parent process by copy-on-write.
+        """
+
+        self._lock = Lock()
+        self._sessions = {}
+        self._contracts.reset_lock()
+
+        for rpc_url, client in self._clients.items():
+            client.provider.replace_session(self.get_session(rpc_url))
+
+    def get_session(self, rpc_url: str) -> Session:
+        """
+        Returns shared session of RPC node
+
+        :param rpc_url: url of RPC node
+        """
+
+        session = self._sessions.get(rpc_url)
+
+        if session is None:
+            with self._lock:
+                session = self._sessions.get(rpc_url)
+
+                if session is None:
+                    session = get_pooled_session(self._pool_size)
+                    self._sessions[rpc_url] = session
+
+        return session
+
+    def get_web3(self, rpc_url: str) -> Web3:
+        """
+        Returns shared Web3 client of RPC node
+
+        :param rpc_url: url of RPC node
+        """
+
+        client = self._clients.get(rpc_url)
+
+        if client is None:
+            session = self.get_session(rpc_url)
+
+            with self._lock:
+                client = self._clients.get(rpc_url)
+
+                if client is None:
+                    client = Web3(SharedSessionHTTPProvider(rpc_url, session))
+                    self._clients[rpc_url] = client
+
+        return client
+
+    def get_contract(
+        self,
+        rpc_url: str,
+        address: str,
+        abi,
+        abi_hash: str,
+    ):
+        """
+        Returns shared web3 contract object. Building of its functions and
+        events is done once per RPC node, address and ABI content.
+
+        :param rpc_url: url of RPC node
+        :param address: address of contract
+        :param abi: contract's ABI
+        :param abi_hash: hash of ABI content
+        """
+
+        address = convert_to_checksum_address_format(address)
+
+        return self._contracts.get_or_call(
+            key=(rpc_url, address, abi_hash),
+            ttl=NEVER_EXPIRES,
+            call=lambda: self.get_web3(rpc_url).eth.contract(
+                address=address,
+                abi=abi,
+            ),
+        )
+
+
+rpc_clients = RpcClientRegistry(HTTP_POOL_SIZE)
+
+register_at_fork(after_in_child=rpc_clients.reset_sessions)
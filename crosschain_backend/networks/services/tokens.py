@@ -0,0 +1,160 @@
+from json import dumps, loads
+from logging import exception, info
+from typing import Optional
+
+from django.conf import settings
+from redis import RedisError
+from requests import RequestException
+from rest_framework.status import HTTP_404_NOT_FOUND
+
+from base.support_functions.base import TIMEOUT_REQUEST
+from base.support_functions.requests import session
+from contracts.services.cache import contract_cache
+from crosschain_backend.consts import CACHE_ERROR, TOKEN_ERROR, TOKEN_INFO
+from .call_cache import LruCache
+
+TOKEN_API = settings.TOKEN_API
+TOKEN_LIST_API = settings.TOKEN_LIST_API
+TOKEN_METADATA_CACHE_SIZE = settings.TOKEN_METADATA_CACHE_SIZE
+TOKEN_METADATA_CACHE_TTL = settings.TOKEN_METADATA_CACHE_TTL
+TOKEN_METADATA_NEGATIVE_CACHE_TTL = settings.TOKEN_METADATA_NEGATIVE_CACHE_TTL
+
+
+def _get_results(data) -> list:
+    if isinstance(data, dict):
+        return data.get('results', [])
+
+    return data
+
+
+class TokenMetadataService:
+    """
+    Token metadata from the main backend cached in memory of the process
+    and in Redis shared by all processes. Tokens which main backend doesn't
+    know are cached too, but for a shorter time.
+    """
+
+    def __init__(self, max_size: int):
+        self._local_cache = LruCache(max_size)
+
+    @staticmethod
+    def _get_key(network_title: str, address: str) -> str:
+        return f'token:{network_title.lower()}:{address.lower()}'
+
+    @staticmethod
+    def _get_ttl(token: Optional[dict]) -> int:
+        if token is None:
+            return TOKEN_METADATA_NEGATIVE_CACHE_TTL
+
+        return TOKEN_METADATA_CACHE_TTL
+
+    def _cache(self, tokens: dict):
+        for key, token in tokens.items():
+            self._local_cache.set(key, token, self._get_ttl(token))
+
+        try:
+            with contract_cache.client.pipeline(transaction=False) as pipeline:
+                for key, token in tokens.items():
+                    pipeline.set(key, dumps(token), ex=self._get_ttl(token))
+
+                pipeline.execute()
+        except RedisError as exception_error:
+            exception(CACHE_ERROR.format(exception_error))
+
+    @staticmethod
+    def _fetch(network_title: str, address: str) -> Optional[dict]:
+        response = session.get(
+            TOKEN_API.format(address=address, network_title=network_title),
+            timeout=TIMEOUT_REQUEST,
+        )
+
+        if response.status_code == HTTP_404_NOT_FOUND:
+            return
+
+        response.raise_for_status()
+
+        tokens = _get_results(response.json())
+
+        return tokens[0] if tokens else None
+
+    def get(self, network_title: str, address: str) -> Optional[dict]:
+        """
+        Returns metadata of token or None if main backend doesn't know it
+
+        :param network_title: name of token network in main backend
+        :param address: address of token
+        """
+
+        key = self._get_key(network_title, address)
+        is_found, token = self._local_cache.get(key)
+
+        if is_found:
+            return token
+
+        try:
+            cached_token = contract_cache.client.get(key)
+        except RedisError as exception_error:
+            exception(CACHE_ERROR.format(exception_error))
+
+            cached_token = None
+
+        if cached_token is not None:
+            token = loads(cached_token)
+
+            self._local_cache.set(key, token, self._get_ttl(token))
+
+            return token
+
+        token = self._fetch(network_title=network_title, address=address)
+
+        self._cache({key: token})
+
+        return token
+
+    def prefetch(self, network_title: str) -> int:
+        """
+        Caches metadata of all tokens of network by pages of main backend.
+        Returns count of cached tokens.
+
+        :param network_title: name of network in main backend
+        """
+
+        url = TOKEN_LIST_API.format(network_title=network_title)
+        tokens_count = 0
+
+        while url:
+            try:
+                response = session.get(url, timeout=TIMEOUT_REQUEST)
+                response.raise_for_status()
+                data = response.json()
+            except (RequestException, ValueError) as exception_error:
+                exception(TOKEN_ERROR.format(exception_error))
+
+                break
+
+            tokens = _get_results(data)
+
+            self._cache(
+                {
+                    self._get_key(network_title, token['address']): token
+                    for token in tokens
+                }
+            )
+
+            tokens_count += len(tokens)
+            url = data.get('next') if isinstance(data, dict) else None
+
+        info(
+            TOKEN_INFO.format(
+                f'Metadata of \"{tokens_count}\" tokens of the '
+                f'\"{network_title}\" network was cached.'
+            )
+        )
+
+        return tokens_count
+
+    def clear(self):
+        self._local_cache.clear()
+
+
+token_metadata = TokenMetadataService(TOKEN_METADATA_CACHE_SIZE)
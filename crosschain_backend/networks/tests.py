@@ -1,8 +1,24 @@
+from asyncio import gather, run, sleep as async_sleep
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+from time import sleep
+from unittest.mock import Mock, patch
+
+from django.db.models import Q
 from web3 import Web3
+from web3.types import HexBytes
 
+from base.support_functions.singleflight import (
+    AsyncSingleFlight,
+    SingleFlight,
+    singleflight,
+)
 from base.tests import BaseTestCase
 from contracts.models import Contract
 from .models import Network, Transaction, CustomRpcProvider
+from .services.call_cache import ContractCallCache
+from .services.clients import RpcClientRegistry
+from .services.tokens import TokenMetadataService
 
 
 class BaseNetworkTestCase(BaseTestCase):
@@ -26,6 +42,226 @@ class CustomRpcProviderTestCase(BaseNetworkTestCase):
             "get_transaction doesn't return correct web3 transaction data",
         )
 
+    def test_batch_contract_function_call(self):
+        contract = Contract.get_contract_by_blockchain_id(2)
+        custom_rpc_provider = CustomRpcProvider(contract.network)
+
+        self.assertEqual(
+            custom_rpc_provider.batch_contract_function_call(
+                contract=contract,
+                calls=(
+                    ('processedTransactions', (self.transaction_hash,)),
+                    ('numOfThisBlockchain', ()),
+                ),
+            ),
+            [
+                contract.is_processed_transaction(self.transaction_hash),
+                contract.get_blockchain_number(),
+            ],
+            "batch_contract_function_call doesn't return results of calls",
+        )
+
+
+class ContractCallCacheTestCase(BaseNetworkTestCase):
+    def test_contract_call_cache(self):
+        call_cache = ContractCallCache(max_size=2)
+        calls = []
+
+        def get_or_call(key, contract_function_name, state_mutability):
+            return call_cache.get_or_call(
+                key=key,
+                ttl=call_cache.get_ttl(
+                    contract_function_name=contract_function_name,
+                    state_mutability=state_mutability,
+                ),
+                call=lambda: calls.append(key) or key,
+            )
+
+        get_or_call('hash', 'getHashPacked', 'pure')
+        get_or_call('hash', 'getHashPacked', 'pure')
+        get_or_call('number', 'numOfThisBlockchain', 'view')
+        get_or_call('address', 'RubicAddresses', 'view')
+        get_or_call('hash', 'getHashPacked', 'pure')
+
+        self.assertEqual(
+            (
+                calls,
+                call_cache.stats,
+                call_cache.get_ttl('paused', 'view'),
+                call_cache.get_ttl('paused', 'view', block_identifier=1),
+            ),
+            (
+                ['hash', 'number', 'address', 'hash'],
+                {'hits': 1, 'misses': 4, 'size': 2, 'max_size': 2},
+                0,
+                None,
+            ),
+            "contract call cache doesn't memoize calls by state mutability",
+        )
+
+
+class SingleFlightTestCase(BaseNetworkTestCase):
+    def test_single_flight(self):
+        single_flight = SingleFlight()
+        barrier = Barrier(4)
+        calls = []
+
+        def get_block_number():
+            calls.append(1)
+            sleep(0.1)
+
+            return 100
+
+        def get_block_number_concurrently():
+            barrier.wait()
+
+            return single_flight.do('block', get_block_number)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(
+                executor.map(
+                    lambda _: get_block_number_concurrently(),
+                    range(4),
+                )
+            )
+
+        self.assertEqual(
+            (results, len(calls)),
+            ([100] * 4, 1),
+            "single flight doesn't share result of concurrent calls",
+        )
+
+    def test_single_flight_decorator_list_arguments(self):
+        barrier = Barrier(4)
+        calls = []
+
+        class RpcProvider:
+            @singleflight()
+            def batch_call(self, calls_params: list) -> list:
+                calls.append(calls_params)
+                sleep(0.1)
+
+                return [params * 2 for params in calls_params]
+
+        rpc_provider = RpcProvider()
+
+        def batch_call_concurrently():
+            barrier.wait()
+
+            return rpc_provider.batch_call([1, 2])
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(
+                executor.map(
+                    lambda _: batch_call_concurrently(),
+                    range(4),
+                )
+            )
+
+        self.assertEqual(
+            (results, len(calls)),
+            ([[2, 4]] * 4, 1),
+            "single flight doesn't coalesce calls with list arguments",
+        )
+
+    def test_async_single_flight(self):
+        single_flight = AsyncSingleFlight()
+        calls = []
+
+        async def get_block_number():
+            calls.append(1)
+            await async_sleep(0.01)
+
+            return 100
+
+        async def get_block_numbers():
+            return await gather(
+                *(
+                    single_flight.do('block', get_block_number)
+                    for _ in range(4)
+                )
+            )
+
+        self.assertEqual(
+            (run(get_block_numbers()), len(calls)),
+            ([100] * 4, 1),
+            "async single flight doesn't share result of concurrent calls",
+        )
+
+
+class RpcClientRegistryTestCase(BaseNetworkTestCase):
+    rpc_url = 'https://bsc-dataseed.binance.org/'
+
+    def test_rpc_client_registry(self):
+        rpc_clients = RpcClientRegistry(pool_size=5)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            clients = set(
+                executor.map(
+                    lambda _: rpc_clients.get_web3(self.rpc_url),
+                    range(8),
+                )
+            )
+
+        session = rpc_clients.get_session(self.rpc_url)
+
+        with patch.object(
+            session,
+            'post',
+            return_value=Mock(content=b'{"jsonrpc":"2.0","result":"0x38"}'),
+        ) as session_post:
+            chain_id = clients.pop().eth.chain_id
+
+        rpc_clients.reset()
+
+        self.assertEqual(
+            (
+                len(clients),
+                chain_id,
+                session_post.call_count,
+                session.get_adapter(self.rpc_url)._pool_maxsize,
+                rpc_clients.get_session(self.rpc_url) is session,
+            ),
+            (0, 56, 1, 5, False),
+            "rpc client isn't shared by threads or is kept after reset",
+        )
+
+
+class TokenMetadataServiceTestCase(BaseNetworkTestCase):
+    token_address = '0x8e3bcc334657560253b83f08331d85267316e08a'
+
+    def test_token_metadata_cache(self):
+        token = {'address': self.token_address, 'symbol': 'BRBC'}
+        responses = {
+            self.token_address: Mock(
+                status_code=200,
+                json=Mock(return_value={'results': [token]}),
+            ),
+            self.transaction_hash: Mock(status_code=404),
+        }
+
+        with patch(
+            'networks.services.tokens.session.get',
+            side_effect=lambda url, **kwargs: responses[
+                url.split('address=')[1].split('&')[0]
+            ],
+        ) as session_get:
+            tokens = [
+                TokenMetadataService(max_size=10).get(
+                    'binance-smart-chain',
+                    address,
+                )
+                # New services get tokens cached by previous ones in Redis
+                for address in (self.token_address, self.transaction_hash)
+                for _ in range(2)
+            ]
+
+        self.assertEqual(
+            (tokens, session_get.call_count),
+            ([token, token, None, None], 2),
+            "token metadata isn't cached or unknown token isn't cached",
+        )
+
 
 class TransactionTestCase(BaseNetworkTestCase):
     def test_add_transaction(self):
@@ -47,3 +283,68 @@ class TransactionTestCase(BaseNetworkTestCase):
             self.transaction_hash,
             "add_transaction method saves incorrect transaction"
         )
+
+    def test_get_last_block_number(self):
+        network = Network.displayed_objects.get(
+            title__iexact='binance-smart-chain',
+        )
+
+        for block_number in (2, 3, 1):
+            Transaction.objects.create(
+                network=network,
+                hash=f'{self.transaction_hash[:-1]}{block_number}',
+                block_number=block_number,
+            )
+
+        self.assertEqual(
+            Transaction.get_last_block_number(network_id=network.id),
+            3,
+            "get_last_block_number doesn't return max block number",
+        )
+        self.assertIn(
+            'transactions_network_block_idx',
+            self.get_query_plan(
+                Transaction.objects
+                .filter(network_id=network.id)
+                .order_by('-block_number')
+                .values_list('block_number', flat=True)[:1]
+            ),
+            "last block number isn't selected by the index",
+        )
+
+    def test_hex_bytes_fields(self):
+        network = Network.displayed_objects.get(
+            title__iexact='binance-smart-chain',
+        )
+
+        transaction = Transaction.objects.create(
+            network=network,
+            hash=HexBytes(self.transaction_hash),
+            sender='0x70e8C8139d1ceF162D5ba3B286380EB5913098c4',
+        )
+
+        self.assertEqual(
+            (transaction.hash, transaction.block_hash),
+            (self.transaction_hash, ''),
+            "HexBytesField doesn't convert value to hex string on save",
+        )
+        self.assertEqual(
+            Transaction.objects
+            .filter(hash__iexact=self.transaction_hash.upper()[2:])
+            .values_list('sender', flat=True)
+            .get(),
+            '0x70e8c8139d1cef162d5ba3b286380eb5913098c4',
+            "HexBytesField doesn't return value as lowercase hex string",
+        )
+        self.assertEqual(
+            list(
+                Transaction.objects
+                .filter(
+                    Q(id__iexact=transaction.id)
+                    | Q(hash__iexact=str(transaction.id))
+                )
+                .values_list('id', flat=True)
+            ),
+            [transaction.id],
+            "HexBytesField lookup fails on not hex value",
+        )
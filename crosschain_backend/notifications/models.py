@@ -31,17 +31,23 @@ class Notifier(ABC):
 
         pass
 
-    def send_telegram_message(self):
+    def send_telegram_message(self) -> bool:
         """
-        Sends API request with message body to telegram bot
+        Sends API request with message body to telegram bot.
+        Returns whether message was accepted by the bot.
         """
 
         try:
             data = self.create_message_body()
-            requests.post(TELEGRAM_BACKEND_URL, json=data)
+            response = requests.post(TELEGRAM_BACKEND_URL, json=data)
+            response.raise_for_status()
         except Exception as e:
             logging.error(str(e))
 
+            return False
+
+        return True
+
     @classmethod
     def reformat_message(cls, message):
         if isinstance(message, str):
@@ -0,0 +1,184 @@
+from hashlib import sha1
+from json import dumps, loads
+from re import compile as re_compile
+from time import time
+
+from django.conf import settings
+
+from contracts.services.cache import contract_cache
+from ..models import ErrorNotifier
+
+NOTIFICATION_BUCKET_CAPACITY = settings.NOTIFICATION_BUCKET_CAPACITY
+NOTIFICATION_BUCKET_REFILL_RATE = settings.NOTIFICATION_BUCKET_REFILL_RATE
+
+PENDING_DIGESTS_KEY = 'notifications:pending'
+DIGEST_KEY = 'notifications:digest:{fingerprint}'
+BUCKET_KEY = 'notifications:bucket'
+
+# Hashes, addresses and numbers are replaced, so errors which differ only
+# by them have the same message template
+MESSAGE_VARIABLES_PATTERN = re_compile(r'0x[0-9a-fA-F]+|\d+')
+
+# Error args which identify where error happened
+ERROR_SOURCE_ARGS = ('network', 'contract', 'process')
+
+
+def get_fingerprint(error_name: str, error_args: dict) -> str:
+    """
+    Returns fingerprint of error by its class, source and message template
+
+    :param error_name: name of exception class
+    :param error_args: args of exception
+    """
+
+    source = '|'.join(
+        str(error_args.get(error_arg, '')) for error_arg in ERROR_SOURCE_ARGS
+    )
+    message_template = MESSAGE_VARIABLES_PATTERN.sub(
+        '#',
+        str(error_args.get('message', '')),
+    )
+
+    return sha1(
+        f'{error_name}|{source}|{message_template}'.encode()
+    ).hexdigest()
+
+
+class NotificationAggregator:
+    """
+    Aggregates error notifications in Redis. Errors with the same fingerprint
+    are coalesced into one digest with count, digests are sent periodically
+    and limited by token bucket.
+    """
+
+    @property
+    def client(self):
+        return contract_cache.client
+
+    def record(self, error_name: str, error_args: dict, tx_hash: str):
+        """
+        Adds error to the digest of its fingerprint
+
+        :param error_name: name of exception class
+        :param error_args: args of exception
+        :param tx_hash: hash of transaction which processing failed
+        """
+
+        fingerprint = get_fingerprint(error_name, error_args)
+        digest_key = DIGEST_KEY.format(fingerprint=fingerprint)
+
+        with self.client.pipeline() as pipeline:
+            pipeline.hincrby(digest_key, 'count', 1)
+            pipeline.hsetnx(
+                digest_key,
+                'sample',
+                dumps(
+                    {
+                        'error_name': error_name,
+                        'error_args': error_args,
+                        'tx_hash': tx_hash,
+                    },
+                    default=str,
+                ),
+            )
+            pipeline.sadd(PENDING_DIGESTS_KEY, fingerprint)
+            pipeline.execute()
+
+    @staticmethod
+    def _take_bucket_token(pipeline) -> bool:
+        now = time()
+        bucket = pipeline.hgetall(BUCKET_KEY)
+        tokens = float(bucket.get(b'tokens', NOTIFICATION_BUCKET_CAPACITY))
+        updated_at = float(bucket.get(b'updated_at', now))
+
+        tokens = min(
+            NOTIFICATION_BUCKET_CAPACITY,
+            tokens + (now - updated_at) * NOTIFICATION_BUCKET_REFILL_RATE,
+        )
+        is_taken = tokens >= 1
+
+        pipeline.multi()
+        pipeline.hset(
+            BUCKET_KEY,
+            mapping={
+                'tokens': tokens - 1 if is_taken else tokens,
+                'updated_at': now,
+            },
+        )
+
+        return is_taken
+
+    def _take_token(self) -> bool:
+        # Bucket is watched, so concurrent flushes can't take the same token,
+        # update of changed bucket is retried
+        return self.client.transaction(
+            self._take_bucket_token,
+            BUCKET_KEY,
+            value_from_callable=True,
+        )
+
+    def _pop_digest(self, fingerprint: str) -> dict:
+        digest_key = DIGEST_KEY.format(fingerprint=fingerprint)
+
+        with self.client.pipeline() as pipeline:
+            pipeline.hgetall(digest_key)
+            pipeline.delete(digest_key)
+            pipeline.srem(PENDING_DIGESTS_KEY, fingerprint)
+            digest, _, _ = pipeline.execute()
+
+        return digest
+
+    def _restore_digest(self, fingerprint: str, digest: dict):
+        digest_key = DIGEST_KEY.format(fingerprint=fingerprint)
+
+        with self.client.pipeline() as pipeline:
+            pipeline.hincrby(digest_key, 'count', int(digest[b'count']))
+            pipeline.hsetnx(digest_key, 'sample', digest[b'sample'])
+            pipeline.sadd(PENDING_DIGESTS_KEY, fingerprint)
+            pipeline.execute()
+
+    def flush(self) -> int:
+        """
+        Sends digests of recorded errors. Digests which exceed the rate
+        limit or weren't sent are left until the next flush. Returns count
+        of sent digests.
+        """
+
+        sent_digests_count = 0
+
+        for fingerprint in self.client.smembers(PENDING_DIGESTS_KEY):
+            fingerprint = fingerprint.decode()
+
+            if not self._take_token():
+                break
+
+            digest = self._pop_digest(fingerprint)
+
+            if not digest:
+                continue
+
+            sample = loads(digest[b'sample'])
+            count = int(digest[b'count'])
+            error_args = sample['error_args']
+
+            if count > 1:
+                error_args['repeated'] = f'{count} times'
+
+            is_sent = ErrorNotifier(
+                error_name=sample['error_name'],
+                error_args=error_args,
+                tx_hash=sample['tx_hash'],
+            ).send_telegram_message()
+
+            if not is_sent:
+                # Errors recorded meanwhile are merged into restored digest
+                self._restore_digest(fingerprint, digest)
+
+                continue
+
+            sent_digests_count += 1
+
+        return sent_digests_count
+
+
+notification_aggregator = NotificationAggregator()
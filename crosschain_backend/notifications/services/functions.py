@@ -1,11 +1,13 @@
 from logging import exception
 
 from django.conf import settings
+from redis import RedisError
 from web3.types import HexBytes
 
 from ..tasks import (
     send_error_notification_task,
 )
+from .aggregator import notification_aggregator
 
 
 def send_error_notification(exception_error: Exception, tx_hash: HexBytes):
@@ -49,10 +51,18 @@ def send_error_notification(exception_error: Exception, tx_hash: HexBytes):
         if isinstance(tx_hash, (bytes, HexBytes)):
             tx_hash = tx_hash.hex()
 
-        send_error_notification_task.delay(
-            error_name=exception_error.__class__.__name__,
-            error_args=error_args,
-            tx_hash=tx_hash,
-        )
+        notification = {
+            'error_name': exception_error.__class__.__name__,
+            'error_args': error_args,
+            'tx_hash': tx_hash,
+        }
+
+        try:
+            # Identical errors are sent once per digest window
+            notification_aggregator.record(**notification)
+        except RedisError as redis_error:
+            exception(redis_error)
+
+            send_error_notification_task.delay(**notification)
     except Exception as exc_error:
         exception(exc_error.__str__())
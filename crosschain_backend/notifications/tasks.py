@@ -2,6 +2,7 @@ import logging
 
 from crosschain_backend.celery import app
 from .models import ErrorNotifier
+from .services.aggregator import notification_aggregator
 
 
 @app.task()
@@ -15,3 +16,15 @@ def send_error_notification_task(error_name, error_args, tx_hash):
         notifier.send_telegram_message()
     except Exception as error:
         logging.error(str(error))
+
+
+@app.task()
+def send_error_digests_task():
+    """
+    Sends digests of errors recorded since the previous run
+    """
+
+    try:
+        notification_aggregator.flush()
+    except Exception as error:
+        logging.error(str(error))
@@ -0,0 +1,82 @@
+from unittest.mock import patch
+
+from base.tests import BaseTestCase
+from .models import ErrorNotifier
+from .services.aggregator import notification_aggregator
+
+
+class NotificationAggregatorTestCase(BaseTestCase):
+    def test_error_digests(self):
+        for txn_hash in ('0x01', '0x02', '0x03'):
+            notification_aggregator.record(
+                error_name='ContractPaused',
+                error_args={
+                    'message': f'Transaction {txn_hash} is paused.',
+                    'contract': 'RUBIC_SWAP_CONTRACT_IN_BSC_PROD_READY',
+                },
+                tx_hash=txn_hash,
+            )
+
+        notification_aggregator.record(
+            error_name='ProviderNotConnected',
+            error_args={'message': 'RPC provider not loaded.'},
+            tx_hash='',
+        )
+
+        with patch.object(
+            ErrorNotifier,
+            'send_telegram_message',
+            autospec=True,
+            return_value=True,
+        ) as send_telegram_message:
+            sent_digests_count = notification_aggregator.flush()
+
+        repeated_counts = sorted(
+            call.args[0].error_args.get('repeated', '')
+            for call in send_telegram_message.call_args_list
+        )
+
+        self.assertEqual(
+            (sent_digests_count, repeated_counts),
+            (2, ['', '3 times']),
+            "identical errors aren't coalesced into one digest",
+        )
+
+    def test_error_digests_failed_send(self):
+        for txn_hash in ('0x01', '0x02'):
+            notification_aggregator.record(
+                error_name='ContractPaused',
+                error_args={'message': f'Transaction {txn_hash} is paused.'},
+                tx_hash=txn_hash,
+            )
+
+        with patch.object(
+            ErrorNotifier,
+            'send_telegram_message',
+            return_value=False,
+        ):
+            failed_sent_digests_count = notification_aggregator.flush()
+
+        notification_aggregator.record(
+            error_name='ContractPaused',
+            error_args={'message': 'Transaction 0x03 is paused.'},
+            tx_hash='0x03',
+        )
+
+        with patch.object(
+            ErrorNotifier,
+            'send_telegram_message',
+            autospec=True,
+            return_value=True,
+        ) as send_telegram_message:
+            sent_digests_count = notification_aggregator.flush()
+
+        self.assertEqual(
+            (
+                failed_sent_digests_count,
+                sent_digests_count,
+                send_telegram_message.call_args.args[0].error_args['repeated'],
+            ),
+            (0, 1, '3 times'),
+            "digest isn't kept after failed send",
+        )
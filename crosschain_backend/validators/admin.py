@@ -33,7 +33,7 @@ class ValidatorSwapAdmin(ModelAdmin):
     )
     search_fields = (
         '=id',
-        'transaction__hash',
+        '=transaction__hash',
         'signature',
     )
     ordering = (
@@ -0,0 +1,140 @@
+from multiprocessing import Pool
+from multiprocessing.pool import ThreadPool
+from time import perf_counter, sleep
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+
+from base.support_functions.cooperative import (
+    is_gevent_patched,
+    make_psycopg_cooperative,
+)
+
+DEFAULT_TASKS_COUNT = 1000
+DEFAULT_LATENCY = 100
+DEFAULT_PREFORK_CONCURRENCY = 4
+DEFAULT_IO_CONCURRENCY = 200
+
+POOLS = ('prefork', 'threads', 'gevent')
+
+
+def _run_task(latency: float):
+    # Waiting for RPC node or relayer response
+    sleep(latency)
+
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT 1;')
+        cursor.fetchone()
+
+    # Celery closes connections after each task
+    connection.close()
+
+
+def _get_pool(name: str, concurrency: int):
+    if name == 'prefork':
+        # Children mustn't share connections opened before fork
+        connections.close_all()
+
+        return Pool(processes=concurrency)
+
+    if name == 'threads':
+        return ThreadPool(processes=concurrency)
+
+    from gevent.pool import Pool as GeventPool
+
+    make_psycopg_cooperative()
+
+    return GeventPool(size=concurrency)
+
+
+class Command(BaseCommand):
+    help = (
+        'Measures throughput of IO-bound synthetic tasks, which wait for '
+        'the latency and query the database, by prefork, threads and gevent '
+        'pools. Gevent pool is measured only if command is started by '
+        '"python -m gevent.monkey manage.py benchmark_worker_pools", '
+        'prefork pool only if it is not.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--pools',
+            nargs='+',
+            choices=POOLS,
+            help='Measured pools, all available ones by default.',
+        )
+        parser.add_argument(
+            '--tasks',
+            type=int,
+            default=DEFAULT_TASKS_COUNT,
+            help='Count of synthetic tasks.',
+        )
+        parser.add_argument(
+            '--latency',
+            type=int,
+            default=DEFAULT_LATENCY,
+            help='Milliseconds of waiting for network by each task.',
+        )
+        parser.add_argument(
+            '--prefork-concurrency',
+            type=int,
+            default=DEFAULT_PREFORK_CONCURRENCY,
+            help='Count of processes of prefork pool.',
+        )
+        parser.add_argument(
+            '--io-concurrency',
+            type=int,
+            default=DEFAULT_IO_CONCURRENCY,
+            help='Count of threads or greenlets of IO pools.',
+        )
+
+    def _measure(self, name: str, concurrency: int, tasks: int, latency: float):
+        pool = _get_pool(name, concurrency)
+        started_at = perf_counter()
+
+        try:
+            pool.map(_run_task, [latency] * tasks)
+        finally:
+            if name != 'gevent':
+                pool.close()
+                pool.join()
+
+        duration = perf_counter() - started_at
+
+        self.stdout.write(
+            f'{name} (concurrency {concurrency}): '
+            f'{duration:.2f} s for {tasks} tasks, '
+            f'{tasks / duration:.1f} tasks per second.'
+        )
+
+    def handle(self, *args, **options):
+        gevent_patched = is_gevent_patched()
+        pools = options['pools']
+
+        if not pools:
+            pools = POOLS[1:] if gevent_patched else POOLS[:2]
+        elif 'gevent' in pools and not gevent_patched:
+            raise CommandError(
+                'Gevent pool requires the command to be started by '
+                '"python -m gevent.monkey manage.py benchmark_worker_pools".'
+            )
+        elif 'prefork' in pools and gevent_patched:
+            # Patched locks of multiprocessing pool hang forked processes
+            raise CommandError(
+                'Prefork pool can\'t be measured in the process patched by '
+                'gevent, start the command without "-m gevent.monkey".'
+            )
+
+        latency = options['latency'] / 1000
+
+        for name in pools:
+            self._measure(
+                name=name,
+                concurrency=(
+                    options['prefork_concurrency']
+                    if name == 'prefork'
+                    else options['io_concurrency']
+                ),
+                tasks=options['tasks'],
+                latency=latency,
+            )
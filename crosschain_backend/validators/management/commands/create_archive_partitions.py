@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from validators.services.archive import create_archive_partitions
+
+
+class Command(BaseCommand):
+    help = (
+        'Creates archive table of swaps and its monthly partitions from the '
+        'month of the oldest swap till the months ahead.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--months-ahead',
+            type=int,
+            default=None,
+            help='Count of future months which partitions are created.',
+        )
+
+    def handle(self, *args, **options):
+        partitions_count = create_archive_partitions(
+            months_ahead=options['months_ahead'],
+        )
+
+        self.stdout.write(f'{partitions_count} archive partitions are ready.')
@@ -0,0 +1,34 @@
+from logging import exception
+
+from django.core.management.base import BaseCommand
+
+from crosschain_backend.consts import UNEXPECTED_ERROR
+from networks.models import Transaction
+from validators.models import SwapParams
+
+
+class Command(BaseCommand):
+    help = (
+        'Creates swap params of swaps which were saved before swap params '
+        'were added, from decoded input and event data of transactions.'
+    )
+
+    def handle(self, *args, **options):
+        created_count = 0
+
+        for transaction in Transaction.objects \
+                .filter(
+                    validator_swap_transaction__isnull=False,
+                    swap_params__isnull=True,
+                ) \
+                .iterator():
+            try:
+                SwapParams.get_or_create_swap_params(transaction=transaction)
+            except Exception as exception_error:
+                exception(UNEXPECTED_ERROR.format(exception_error))
+
+                continue
+
+            created_count += 1
+
+        self.stdout.write(f'Swap params of {created_count} swaps created.')
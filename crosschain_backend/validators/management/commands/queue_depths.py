@@ -0,0 +1,38 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from crosschain_backend.celery import app as celery_app
+
+
+def get_queue_depths() -> dict:
+    """
+    Returns count of waiting messages of every Celery queue
+    """
+
+    queue_depths = {}
+
+    with celery_app.connection_for_read() as connection:
+        channel = connection.default_channel
+
+        for queue in settings.CELERY_TASK_QUEUES:
+            try:
+                queue_depths[queue.name] = channel.queue_declare(
+                    queue=queue.name,
+                    passive=True,
+                ).message_count
+            # Broker removes queue without messages
+            except connection.channel_errors:
+                queue_depths[queue.name] = 0
+
+    return queue_depths
+
+
+class Command(BaseCommand):
+    help = (
+        'Prints count of waiting tasks of every Celery queue, so it can be '
+        'checked that high priority tasks don\'t wait for the low ones.'
+    )
+
+    def handle(self, *args, **options):
+        for queue_name, depth in get_queue_depths().items():
+            self.stdout.write(f'celery_queue_depth{{queue="{queue_name}"}} {depth}')
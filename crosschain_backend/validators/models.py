@@ -1,25 +1,46 @@
 from logging import exception, info
 from django.db.models.deletion import CASCADE
-from requests import post as request_post
 from requests.exceptions import RequestException
 from uuid import UUID
 
 from django.conf import settings
+from django.db import connection
 from django.db.models import (
+    BigAutoField,
+    BooleanField,
+    Case,
     CharField,
+    DecimalField,
     ForeignKey,
+    Index,
+    JSONField,
     OneToOneField,
+    PositiveIntegerField,
     PROTECT,
+    Q,
+    TextField,
+    Value,
+    When,
 )
+from django.db.transaction import atomic
+from django.utils import timezone
+from eth_utils import add_0x_prefix
 from web3.types import HexBytes
 
 from base.models import AbstractBaseModel
-from base.support_functions.base import bytes_to_base58
+from base.support_functions.base import TIMEOUT_REQUEST, bytes_to_base58
+from base.support_functions.requests import session
 from contracts.models import Contract
+from contracts.services.records import BridgeParams
+from crosschain_backend.consts import MAX_WEI_DIGITS, NETWORK_NAMES
 from networks.models import Transaction, CustomRpcProvider
 from networks.types import HASH_LIKE
 
 
+# Key of advisory lock of PostgreSQL which orders commits of feed entries
+SIGNATURE_FEED_LOCK_ID = 2_840_129
+
+
 class ValidatorSwap(AbstractBaseModel):
     """
     ValidatorSwap model which used for creating and
@@ -36,6 +57,7 @@ class ValidatorSwap(AbstractBaseModel):
     STATUS_SIGNATURE_CREATED = 'signature created'
     STATUS_SIGNATURE_SEND = 'signature send'
     STATUS_SUCCESS = 'success'
+    STATUS_REVERTED = 'reverted'
 
     _STATUSES = (
         (STATUS_CREATED, STATUS_CREATED.upper()),
@@ -43,6 +65,11 @@ class ValidatorSwap(AbstractBaseModel):
         (STATUS_SIGNATURE_CREATED, STATUS_SIGNATURE_CREATED.upper()),
         (STATUS_SIGNATURE_SEND, STATUS_SIGNATURE_SEND.upper()),
         (STATUS_SUCCESS, STATUS_SUCCESS.upper()),
+        (STATUS_REVERTED, STATUS_REVERTED.upper()),
+    )
+    FINAL_STATUSES = (
+        STATUS_SUCCESS,
+        STATUS_REVERTED,
     )
 
     contract = ForeignKey(
@@ -72,13 +99,58 @@ class ValidatorSwap(AbstractBaseModel):
 
     class Meta:
         db_table = 'validator_swaps'
-        ordering = '-_created_at',
+        indexes = (
+            Index(
+                fields=('status',),
+                name='validator_swaps_pending_idx',
+                # STATUS_CREATED and STATUS_SIGNATURE_CREATED
+                condition=(
+                    Q(status='created') | Q(status='signature created')
+                ),
+            ),
+        )
 
     def __str__(self) -> str:
         return (
             f'Validator swap with transaction hash \"{self.transaction.hash}\"'
         )
 
+    def get_signature_payload(self) -> dict:
+        """
+        Returns signature data in format which is accepted by relayer
+        """
+
+        return {
+            'signature': self.signature,
+            'fromContractNum': self.contract.blockchain_id,
+            'fromTxHash': self.transaction.hash,
+            'eventName': self.transaction.event_data.get('event', ''),
+        }
+
+    def set_signature(self, signature: str):
+        """
+        Saves created signature and adds it to the signature feed
+
+        :param signature: hashed params signed by Validator private key
+        """
+
+        with atomic():
+            self.signature = signature
+            self.status = self.STATUS_SIGNATURE_CREATED
+            self.save(update_fields=('signature', 'status',))
+
+            SignatureFeedEntry.append(self)
+
+            # Notification is delivered to signature hubs after commit. It
+            # only wakes them up, entries are fetched by cursor of the feed,
+            # because notifications may come before commit of previous ids.
+            if connection.vendor == 'postgresql':
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        'SELECT pg_notify(%s, %s);',
+                        (settings.SIGNATURE_STREAM_CHANNEL, ''),
+                    )
+
     def send_signature_to_relayer(self):
         """
         Sends created by Validator signature.
@@ -89,17 +161,15 @@ class ValidatorSwap(AbstractBaseModel):
         }
         payload = {
             'validatorName': settings.VALIDATOR_NAME,
-            'signature': self.signature,
-            'fromContractNum': self.contract.blockchain_id,
-            'fromTxHash': self.transaction.hash,
-            'eventName': self.transaction.event_data.get('event', ''),
+            **self.get_signature_payload(),
         }
 
         try:
-            response = request_post(
+            response = session.post(
                 url=f"{settings.RELAYER_URL}/api/trades/signatures/",
                 params=params,
                 json=payload,
+                timeout=TIMEOUT_REQUEST,
             )
 
             if response.status_code != 200:
@@ -127,6 +197,72 @@ class ValidatorSwap(AbstractBaseModel):
     def get_swap_by_transaction_id(cls, transaction_id: UUID):
         return cls.objects.filter(transaction__id=transaction_id).first()
 
+    @classmethod
+    def update_swaps_status(cls, original_txn_hashes: list, status: str):
+        """
+        Sets status of the swaps found by hashes of their source transactions
+        with one query. Returns count of updated swaps.
+
+        :param original_txn_hashes: hashes of the source transactions
+        :param status: new status of the swaps
+        """
+
+        original_txn_hashes = [
+            txn_hash.hex() if isinstance(txn_hash, (bytes, HexBytes))
+            else txn_hash
+            for txn_hash in original_txn_hashes
+        ]
+
+        if not original_txn_hashes:
+            return 0
+
+        return cls.objects \
+            .filter(
+                transaction__hash__in=[
+                    add_0x_prefix(txn_hash.lower())
+                    for txn_hash in original_txn_hashes
+                ],
+            ) \
+            .exclude(status__in=cls.FINAL_STATUSES) \
+            .update(status=status, _updated_at=timezone.now())
+
+    @classmethod
+    def set_swaps_statuses(cls, swap_ids_by_status: dict):
+        """
+        Sets different statuses to several swaps with one query.
+        Returns count of updated swaps.
+
+        :param swap_ids_by_status: {'<status>': [<swap_id>, ...], ...}
+        """
+
+        swap_ids_by_status = {
+            status: swap_ids
+            for status, swap_ids in swap_ids_by_status.items()
+            if swap_ids
+        }
+
+        if not swap_ids_by_status:
+            return 0
+
+        return cls.objects \
+            .filter(
+                id__in=[
+                    swap_id
+                    for swap_ids in swap_ids_by_status.values()
+                    for swap_id in swap_ids
+                ],
+            ) \
+            .update(
+                status=Case(
+                    *(
+                        When(id__in=swap_ids, then=Value(status))
+                        for status, swap_ids in swap_ids_by_status.items()
+                    ),
+                    output_field=CharField(),
+                ),
+                _updated_at=timezone.now(),
+            )
+
     @classmethod
     def create_swap(
         cls,
@@ -134,6 +270,8 @@ class ValidatorSwap(AbstractBaseModel):
         contract: Contract,
         txn_hash: HASH_LIKE,
         event: dict,
+        source_transaction: Transaction = None,
+        event_data: dict = None,
     ):
         """
         Save ValidatorSwap instance in DataBase
@@ -142,43 +280,25 @@ class ValidatorSwap(AbstractBaseModel):
         :param contract: Contract object of source network
         :param txn_hash: hash of the found transaction
         :param event: event data of transaction
+        :param source_transaction: found transaction if it's already fetched
+        :param event_data: serialized event data if it's already converted
         """
 
         if isinstance(txn_hash, HexBytes):
             txn_hash = txn_hash.hex()
 
-        source_transaction = Transaction.get_transaction(
-            network_id=rpc_provider.network.id,
-            txn_hash=txn_hash,
-        )
-
-        info(source_transaction)
-
-        event_data = contract.get_event(event)
-        to_contract = Contract.get_contract_by_blockchain_id(
-            blockchain_id=source_transaction.data.get('params')[0],
-        )
-
-        if to_contract.network.title == 'solana':
-            transaction_params = list(source_transaction.data['params'])
-
-            transaction_params[6] = bytes_to_base58(
-                string=transaction_params[6]
+        if not source_transaction:
+            source_transaction = Transaction.get_transaction(
+                network_id=rpc_provider.network.id,
+                txn_hash=txn_hash,
             )
 
-            second_path = list(transaction_params[3])
-
-            for i in range(len(second_path)):
-                second_path[i] = bytes_to_base58(
-                    string=second_path[i],
-                )
-
-            transaction_params[3] = second_path
+        info(source_transaction)
 
-            source_transaction.data['params'] = transaction_params
+        source_transaction.event_data = event_data or contract.get_event(event)
+        source_transaction.save(update_fields=('event_data',))
 
-        source_transaction.event_data = event_data
-        source_transaction.save(update_fields=('event_data', 'data'))
+        SwapParams.get_or_create_swap_params(transaction=source_transaction)
 
         validator_swap = ValidatorSwap.get_swap_by_transaction_id(
             transaction_id=source_transaction.id
@@ -191,3 +311,228 @@ class ValidatorSwap(AbstractBaseModel):
             )
 
         return validator_swap
+
+
+class SwapParams(AbstractBaseModel):
+    """
+    SwapParams model which stores params of swap decoded from the source
+    transaction once. Raw input and event data are kept in the Transaction
+    only for audit.
+
+    - transaction - source Transaction instance of swap
+    - target_blockchain_id - number of target network contract
+    - new_address - wallet address in target network (base58 for Solana)
+    - second_path - token addresses path in target network
+    - token_out_min - min amount of token which user receives
+    - transit_token_amount_in - amount of transit token from event
+    - amount_spent - amount spent by user from event
+    - swap_to_crypto - is swap to native crypto of target network
+    - swap_exact_for - swap method flag, empty for Inch swaps
+    - contract_function - function which will be called in target network
+    """
+
+    transaction = OneToOneField(
+        to=Transaction,
+        on_delete=CASCADE,
+        related_name='swap_params',
+        verbose_name='Transaction',
+    )
+    target_blockchain_id = PositiveIntegerField(
+        db_index=True,
+        verbose_name='Target blockchain id',
+    )
+    new_address = CharField(
+        max_length=255,
+        verbose_name='New address',
+    )
+    second_path = JSONField(
+        verbose_name='Second path',
+        default=list,
+        blank=True,
+    )
+    token_out_min = DecimalField(
+        max_digits=MAX_WEI_DIGITS,
+        decimal_places=0,
+        verbose_name='Token out min',
+        default=0,
+    )
+    transit_token_amount_in = DecimalField(
+        max_digits=MAX_WEI_DIGITS,
+        decimal_places=0,
+        verbose_name='Transit token amount in',
+        default=0,
+    )
+    amount_spent = DecimalField(
+        max_digits=MAX_WEI_DIGITS,
+        decimal_places=0,
+        verbose_name='Amount spent',
+        default=0,
+    )
+    swap_to_crypto = BooleanField(
+        verbose_name='Swap to crypto',
+        default=False,
+    )
+    swap_exact_for = BooleanField(
+        verbose_name='Swap exact for',
+        null=True,
+        blank=True,
+    )
+    contract_function = TextField(
+        verbose_name='Contract function',
+        default='',
+        blank=True,
+    )
+
+    class Meta:
+        db_table = 'swap_params'
+
+    def __str__(self) -> str:
+        return (
+            f'Swap params of transaction \"{self.transaction_id}\" to the '
+            f'\"{self.target_blockchain_id}\" blockchain'
+        )
+
+    def get_trade_params(self, original_txn_hash: bytes) -> BridgeParams:
+        """
+        Returns params which will be used for trade in target network
+
+        :param original_txn_hash: hash of the source transaction from event
+        """
+
+        return BridgeParams(
+            original_txn_hash=original_txn_hash,
+            blockchain_id=self.target_blockchain_id,
+            token_out_min=int(self.token_out_min),
+            second_path=tuple(self.second_path),
+            new_address=self.new_address,
+            transit_token_amount_in=int(self.transit_token_amount_in),
+            amount_spent=int(self.amount_spent),
+            swap_to_crypto=self.swap_to_crypto,
+            swap_exact_for=self.swap_exact_for,
+            contract_function=self.contract_function,
+        )
+
+    @classmethod
+    def get_or_create_swap_params(cls, transaction: Transaction):
+        """
+        Returns swap params of transaction, creates them from decoded input
+        and event data if they don't exist
+
+        :param transaction: source Transaction instance of swap
+        """
+
+        swap_params = cls.objects.filter(transaction=transaction).first()
+
+        if swap_params:
+            return swap_params
+
+        params = transaction.data['params']
+        event_args = transaction.event_data.get('args', {})
+        target_blockchain_id = params[0]
+        new_address = params[6]
+        second_path = list(params[3])
+
+        to_contract = Contract.get_contract_by_blockchain_id(
+            blockchain_id=target_blockchain_id,
+        )
+
+        if to_contract.network.title == NETWORK_NAMES.get('solana'):
+            new_address = bytes_to_base58(string=new_address)
+            second_path = [
+                bytes_to_base58(string=address) for address in second_path
+            ]
+
+        return cls.objects.create(
+            transaction=transaction,
+            target_blockchain_id=target_blockchain_id,
+            new_address=new_address,
+            second_path=second_path,
+            token_out_min=params[5],
+            transit_token_amount_in=event_args.get('RBCAmountIn', 0),
+            amount_spent=event_args.get('amountSpent', 0),
+            swap_to_crypto=params[7],
+            swap_exact_for=params[8] if isinstance(params[8], bool) else None,
+            contract_function=params[-1],
+        )
+
+
+class SignatureFeedEntry(AbstractBaseModel):
+    """
+    SignatureFeedEntry model which is appended when signature of swap is
+    created. Used by relayer for fetching signatures by cursor.
+
+    - id - autoincremented number which is used as cursor of the feed,
+    ids are committed in order, see append
+    - validator_swap - ValidatorSwap instance which signature was created
+    """
+
+    id = BigAutoField(
+        primary_key=True,
+        editable=False,
+    )
+    validator_swap = OneToOneField(
+        to=ValidatorSwap,
+        on_delete=CASCADE,
+        related_name='signature_feed_entry',
+        verbose_name='Validator swap',
+    )
+
+    class Meta:
+        db_table = 'signature_feed_entries'
+
+    def __str__(self) -> str:
+        return f'Signature feed entry #{self.id}'
+
+    @classmethod
+    def append(cls, validator_swap: ValidatorSwap) -> 'SignatureFeedEntry':
+        """
+        Adds signature of swap to the feed. Entries are added one at a time
+        until commit of their transactions, so ids become visible in commit
+        order and the cursor never skips an entry which is committed after
+        the next one. Should be called at the end of transaction, because
+        the lock is held until its commit.
+
+        :param validator_swap: ValidatorSwap instance with signature
+        """
+
+        with atomic():
+            if connection.vendor == 'postgresql':
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        'SELECT pg_advisory_xact_lock(%s);',
+                        (SIGNATURE_FEED_LOCK_ID,),
+                    )
+
+            return cls.objects.get_or_create(validator_swap=validator_swap)[0]
+
+    @classmethod
+    def get_feed(cls, cursor: int, limit: int) -> list:
+        """
+        Returns signatures which were created after the cursor
+
+        :param cursor: id of the last received entry
+        :param limit: max count of returned entries
+        """
+
+        entries = cls.objects \
+            .filter(id__gt=cursor) \
+            .select_related(
+                'validator_swap__contract',
+                'validator_swap__transaction',
+            ) \
+            .only(
+                'id',
+                'validator_swap__signature',
+                'validator_swap__contract__blockchain_number',
+                'validator_swap__transaction__hash',
+                'validator_swap__transaction__event_data',
+            ) \
+            .order_by('id')[:limit]
+
+        return [
+            {
+                'cursor': entry.id,
+                **entry.validator_swap.get_signature_payload(),
+            }
+            for entry in entries
+        ]
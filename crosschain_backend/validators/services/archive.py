@@ -0,0 +1,254 @@
+from datetime import date, timedelta
+from logging import info
+from uuid import UUID
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Min
+from django.db.transaction import atomic
+from django.utils import timezone
+from web3.types import HexBytes
+
+from crosschain_backend.consts import TRADE_INFO
+from networks.models import Transaction
+from networks.types import HASH_LIKE
+from ..models import SignatureFeedEntry, SwapParams, ValidatorSwap
+
+ARCHIVE_SWAPS_AFTER_DAYS = settings.ARCHIVE_SWAPS_AFTER_DAYS
+ARCHIVE_BATCH_SIZE = settings.ARCHIVE_BATCH_SIZE
+ARCHIVE_PARTITION_MONTHS_AHEAD = settings.ARCHIVE_PARTITION_MONTHS_AHEAD
+
+ARCHIVE_TABLE = 'validator_swaps_archive'
+
+# Archived swaps are only read for audit, so their payloads are compressed
+# by lz4 which is available since PostgreSQL 14
+LZ4_MIN_SERVER_VERSION = 140000
+
+
+def _get_month_start(value: date, months: int = 0) -> date:
+    month_index = value.year * 12 + value.month - 1 + months
+
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+
+def _is_lz4_supported() -> bool:
+    return connection.pg_version >= LZ4_MIN_SERVER_VERSION
+
+
+def _create_archive_table(cursor):
+    payload_compression = ' COMPRESSION lz4' if _is_lz4_supported() else ''
+
+    cursor.execute(
+        f'CREATE TABLE IF NOT EXISTS "{ARCHIVE_TABLE}" ('
+        ' "id" uuid NOT NULL,'
+        ' "created_at" timestamp with time zone NOT NULL,'
+        ' "archived_at" timestamp with time zone NOT NULL DEFAULT now(),'
+        ' "network_id" uuid NOT NULL,'
+        ' "transaction_hash" bytea NOT NULL,'
+        ' "status" varchar(255) NOT NULL,'
+        f' "payload" jsonb{payload_compression} NOT NULL'
+        ') PARTITION BY RANGE ("created_at");'
+    )
+    cursor.execute(
+        f'CREATE TABLE IF NOT EXISTS "{ARCHIVE_TABLE}_default"'
+        f' PARTITION OF "{ARCHIVE_TABLE}" DEFAULT;'
+    )
+    # Scanners check if found transaction was already archived, indexes
+    # of partitions are created by attach
+    cursor.execute(
+        f'CREATE INDEX IF NOT EXISTS "{ARCHIVE_TABLE}_transaction_idx"'
+        f' ON "{ARCHIVE_TABLE}" ("network_id", "transaction_hash");'
+    )
+
+
+def create_archive_partitions(months_ahead: int = None) -> int:
+    """
+    Creates archive table and its monthly partitions from the month of the
+    oldest swap till the months ahead. Returns count of partitions.
+
+    :param months_ahead: count of future months which partitions are created
+    """
+
+    if connection.vendor != 'postgresql':
+        return 0
+
+    if months_ahead is None:
+        months_ahead = ARCHIVE_PARTITION_MONTHS_AHEAD
+
+    today = timezone.now().date()
+    oldest_created_at = ValidatorSwap.objects \
+        .aggregate(oldest_created_at=Min('_created_at')) \
+        .get('oldest_created_at')
+
+    month_start = _get_month_start(
+        oldest_created_at.date() if oldest_created_at else today
+    )
+    last_month_start = _get_month_start(today, months_ahead)
+    partitions_count = 0
+    like_options = 'INCLUDING DEFAULTS'
+
+    if _is_lz4_supported():
+        like_options += ' INCLUDING COMPRESSION'
+
+    with atomic(), connection.cursor() as cursor:
+        _create_archive_table(cursor)
+
+        while month_start <= last_month_start:
+            next_month_start = _get_month_start(month_start, 1)
+            partition = (
+                f'{ARCHIVE_TABLE}_y{month_start.year}m{month_start.month:02}'
+            )
+
+            cursor.execute(
+                'SELECT 1 FROM pg_class WHERE relname = %s;',
+                (partition,),
+            )
+
+            if not cursor.fetchone():
+                # Partition can't be attached if the default partition
+                # already has archived swaps of that month
+                cursor.execute(
+                    f'CREATE TABLE "{partition}"'
+                    f' (LIKE "{ARCHIVE_TABLE}" {like_options})'
+                    ' WITH (toast_tuple_target = 128);'
+                )
+                cursor.execute(
+                    f'WITH moved AS ('
+                    f' DELETE FROM "{ARCHIVE_TABLE}_default"'
+                    ' WHERE "created_at" >= %s AND "created_at" < %s'
+                    ' RETURNING *'
+                    f') INSERT INTO "{partition}" SELECT * FROM moved;',
+                    (month_start, next_month_start),
+                )
+                cursor.execute(
+                    f'ALTER TABLE "{ARCHIVE_TABLE}" ATTACH PARTITION'
+                    f' "{partition}" FOR VALUES FROM (%s) TO (%s);',
+                    (month_start, next_month_start),
+                )
+
+            partitions_count += 1
+            month_start = next_month_start
+
+    return partitions_count
+
+
+def is_swap_archived(network_id: UUID, txn_hash: HASH_LIKE) -> bool:
+    """
+    Checks if swap of the transaction was archived. Scanners replay old
+    blocks after restart, so archived swaps aren't created again.
+
+    :param network_id: id of network of the transaction
+    :param txn_hash: hash of the source transaction
+    """
+
+    if connection.vendor != 'postgresql':
+        return False
+
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT to_regclass(%s);', (ARCHIVE_TABLE,))
+
+        if cursor.fetchone()[0] is None:
+            return False
+
+        cursor.execute(
+            f'SELECT 1 FROM "{ARCHIVE_TABLE}"'
+            ' WHERE "network_id" = %s AND "transaction_hash" = %s'
+            ' LIMIT 1;',
+            (network_id, bytes(HexBytes(txn_hash))),
+        )
+
+        return cursor.fetchone() is not None
+
+
+def _archive_swaps_batch(archive_before) -> int:
+    with atomic():
+        swaps = list(
+            ValidatorSwap.objects
+            .select_for_update(skip_locked=True)
+            .filter(
+                status__in=ValidatorSwap.FINAL_STATUSES,
+                _created_at__lt=archive_before,
+            )
+            .values_list('id', 'transaction_id', 'transaction__network_id')
+            [:ARCHIVE_BATCH_SIZE]
+        )
+
+        if not swaps:
+            return 0
+
+        swap_ids = [swap_id for swap_id, _, _ in swaps]
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'INSERT INTO "{ARCHIVE_TABLE}"'
+                ' ("id", "created_at", "network_id", "transaction_hash",'
+                ' "status", "payload")'
+                ' SELECT swap."id", swap."_created_at", txn."network_id",'
+                ' txn."hash", swap."status", jsonb_build_object('
+                "  'validator_swap', to_jsonb(swap),"
+                "  'transaction', to_jsonb(txn),"
+                "  'swap_params', to_jsonb(params),"
+                "  'signature_feed_entry', to_jsonb(feed_entry)"
+                ' )'
+                f' FROM "{ValidatorSwap._meta.db_table}" swap'
+                f' JOIN "{Transaction._meta.db_table}" txn'
+                '  ON txn."id" = swap."transaction_id"'
+                f' LEFT JOIN "{SwapParams._meta.db_table}" params'
+                '  ON params."transaction_id" = txn."id"'
+                f' LEFT JOIN "{SignatureFeedEntry._meta.db_table}" feed_entry'
+                '  ON feed_entry."validator_swap_id" = swap."id"'
+                ' WHERE swap."id" = ANY(%s);',
+                (swap_ids,),
+            )
+
+        # The newest transaction of network is kept, because scanner
+        # resumes from its block number
+        last_transaction_ids = [
+            Transaction.objects
+            .filter(network_id=network_id)
+            .order_by('-block_number')
+            .values_list('id', flat=True)
+            .first()
+            for network_id in {network_id for _, _, network_id in swaps}
+        ]
+
+        ValidatorSwap.objects.filter(id__in=swap_ids).delete()
+        Transaction.objects \
+            .filter(id__in=[txn_id for _, txn_id, _ in swaps]) \
+            .exclude(id__in=last_transaction_ids) \
+            .delete()
+
+    return len(swaps)
+
+
+def archive_swaps() -> int:
+    """
+    Moves finished swaps older than the retention period with their
+    transactions to the archive by batches. Returns count of archived swaps.
+    """
+
+    if connection.vendor != 'postgresql':
+        return 0
+
+    # Archive table and partitions are created if they don't exist yet
+    create_archive_partitions()
+
+    archive_before = timezone.now() - timedelta(days=ARCHIVE_SWAPS_AFTER_DAYS)
+    archived_swaps_count = 0
+
+    while 1:
+        archived_batch_count = _archive_swaps_batch(archive_before)
+
+        if not archived_batch_count:
+            break
+
+        archived_swaps_count += archived_batch_count
+
+    info(
+        TRADE_INFO.format(
+            f'\"{archived_swaps_count}\" swaps finished before '
+            f'\"{archive_before}\" were archived.'
+        )
+    )
+
+    return archived_swaps_count
@@ -0,0 +1,28 @@
+from hmac import compare_digest
+
+from django.conf import settings
+
+AUTHORIZATION_SCHEME = 'Bearer'
+
+
+def is_signature_api_authorized(authorization: str) -> bool:
+    """
+    Checks private password for signature API passed by Authorization
+    header as "Bearer <password>". Password isn't taken from query
+    string, because it's written to access logs of servers. Nobody is
+    authorized if password isn't set.
+
+    :param authorization: value of Authorization header
+    """
+
+    password = settings.PRIVATE_PASSWORD_FOR_SIGNATURE_API
+
+    if not password:
+        return False
+
+    scheme, _, credentials = (authorization or '').partition(' ')
+
+    if scheme != AUTHORIZATION_SCHEME:
+        return False
+
+    return compare_digest(credentials.encode(), password.encode())
@@ -1,20 +1,31 @@
+from collections import defaultdict
 from logging import exception, info
 from django.db import transaction
 
+from django.conf import settings
 from django.db.utils import OperationalError
 
-from contracts.exceptions import (
-    ContractTransactionAlreadyProcessed,
-    ContractTransactionAlreadyReverted,
-)
 from contracts.models import Contract
-from contracts.services.functions import _check_is_processed_transaction
-from ..models import ValidatorSwap
+from crosschain_backend.consts import TRADE_ERROR, TRADE_INFO
+from networks.models import CustomRpcProvider
+from ..models import SwapParams, ValidatorSwap
+
+EXCLUDED_BLOCKCHAIN_IDS_FOR_SELECT = settings.EXCLUDED_BLOCKCHAIN_IDS_FOR_SELECT
+RECONCILIATION_CHUNK_SIZE = settings.RECONCILIATION_CHUNK_SIZE
+
+# Values of the 'processedTransactions' contract method
+PROCESSED_TRANSACTION_STATUSES = {
+    1: ValidatorSwap.STATUS_SUCCESS,
+    2: ValidatorSwap.STATUS_REVERTED,
+}
 
 
 def process_swap(swap_id):
     """
-    Process validator swap depends on it's status
+    Process validator swap depends on it's status.
+
+    Completed and reverted swaps are marked by the scanners of target
+    networks, so there is no need to check the swap in target contract here.
     """
 
     info('check swap')
@@ -31,22 +42,138 @@ def process_swap(swap_id):
 
         return
 
+    if not swap:
+        return
+
+    if swap.status != ValidatorSwap.STATUS_SIGNATURE_CREATED:
+        return
+
+    # Params of swaps created before the SwapParams table are decoded
+    # from the source transaction
     try:
-        _check_is_processed_transaction(
-            Contract.get_contract_by_blockchain_id(
-                swap.transaction.data.get('params', [1])[0]
-            ),
-            swap.transaction.hash,
-            '',
+        swap_params = SwapParams.get_or_create_swap_params(
+            transaction=swap.transaction,
+        )
+    except Exception as exception_error:
+        exception(
+            TRADE_ERROR.format(
+                f'Signature of swap \"{swap.id}\" isn\'t sent, because '
+                f'its params can\'t be decoded: {exception_error}.'
+            )
         )
-    except (
-        ContractTransactionAlreadyProcessed,
-        ContractTransactionAlreadyReverted
-    ):
-        swap.status = ValidatorSwap.STATUS_SIGNATURE_SEND
-        swap.save()
 
-    if swap.status == ValidatorSwap.STATUS_SIGNATURE_CREATED:
-        swap.send_signature_to_relayer()
+        return
+
+    to_contract = Contract.get_contract_by_blockchain_id(
+        blockchain_id=swap_params.target_blockchain_id,
+    )
+    to_contract_state = to_contract.get_state() if to_contract else None
+
+    # Signature is sent by the next update when contract will be unpaused
+    if to_contract_state and to_contract_state.is_paused:
+        info(
+            TRADE_INFO.format(
+                f'Signature of swap \"{swap.id}\" isn\'t sent, because '
+                f'the \"{to_contract.address}\" contract address is paused.'
+            )
+        )
+
+        return
+
+    swap.send_signature_to_relayer()
 
     return
+
+
+def _reconcile_swaps_chunk(
+    rpc_provider: CustomRpcProvider,
+    contract: Contract,
+    swaps: list,
+) -> int:
+    """
+    Checks swaps in target contract with one batch request and updates
+    statuses of processed and reverted ones with one query
+
+    :param rpc_provider: custom rpc provider of target network
+    :param contract: Contract object of target network
+    :param swaps: list of (swap_id, original_txn_hash) pairs
+    """
+
+    processed_statuses = rpc_provider.batch_contract_function_call(
+        contract=contract,
+        calls=[
+            ('processedTransactions', (original_txn_hash,))
+            for _, original_txn_hash in swaps
+        ],
+    )
+
+    swap_ids_by_status = defaultdict(list)
+
+    for (swap_id, _), processed_status in zip(swaps, processed_statuses):
+        status = PROCESSED_TRANSACTION_STATUSES.get(processed_status)
+
+        if status:
+            swap_ids_by_status[status].append(swap_id)
+
+    return ValidatorSwap.set_swaps_statuses(swap_ids_by_status)
+
+
+def reconcile_swaps():
+    """
+    Checks all pending swaps in target contracts by chunks
+    and marks processed and reverted ones.
+    """
+
+    swaps_by_blockchain_id = defaultdict(list)
+
+    for swap_id, original_txn_hash, blockchain_id in ValidatorSwap \
+            .displayed_objects \
+            .filter(
+                status__in=(
+                    ValidatorSwap.STATUS_CREATED,
+                    ValidatorSwap.STATUS_SIGNATURE_CREATED,
+                ),
+                transaction__swap_params__isnull=False,
+            ) \
+            .values_list(
+                'id',
+                'transaction__hash',
+                'transaction__swap_params__target_blockchain_id',
+            ):
+        swaps_by_blockchain_id[blockchain_id].append(
+            (swap_id, original_txn_hash)
+        )
+
+    for blockchain_id, swaps in swaps_by_blockchain_id.items():
+        if blockchain_id in EXCLUDED_BLOCKCHAIN_IDS_FOR_SELECT:
+            continue
+
+        contract = Contract.get_contract_by_blockchain_id(blockchain_id)
+
+        if not contract:
+            continue
+
+        rpc_provider = CustomRpcProvider(contract.network)
+        updated_swaps_count = 0
+
+        for chunk_start in range(0, len(swaps), RECONCILIATION_CHUNK_SIZE):
+            try:
+                updated_swaps_count += _reconcile_swaps_chunk(
+                    rpc_provider=rpc_provider,
+                    contract=contract,
+                    swaps=swaps[
+                        chunk_start:chunk_start + RECONCILIATION_CHUNK_SIZE
+                    ],
+                )
+            except Exception as exception_error:
+                # Other chunks of the blockchain are still reconciled
+                exception(exception_error)
+
+                continue
+
+        info(
+            TRADE_INFO.format(
+                f'\"{updated_swaps_count}\" of \"{len(swaps)}\" pending swaps'
+                f' to the \"{blockchain_id}\" blockchain were reconciled.'
+            )
+        )
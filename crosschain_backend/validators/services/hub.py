@@ -0,0 +1,198 @@
+from asyncio import AbstractEventLoop, Queue, get_running_loop
+from logging import exception, info
+from select import select
+from threading import Event, Lock, Thread
+from time import sleep
+
+from django.conf import settings
+from django.db import close_old_connections, connection
+from psycopg2 import connect as psycopg2_connect
+from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+
+from crosschain_backend.consts import TRADE_ERROR, TRADE_INFO
+from ..models import SignatureFeedEntry
+
+SIGNATURE_STREAM_CHANNEL = settings.SIGNATURE_STREAM_CHANNEL
+SIGNATURE_STREAM_QUEUE_SIZE = settings.SIGNATURE_STREAM_QUEUE_SIZE
+SIGNATURE_FEED_PAGE_SIZE = settings.SIGNATURE_FEED_PAGE_SIZE
+
+DEFAULT_LISTEN_TIMEOUT = 5
+DEFAULT_RECONNECT_TIMEOUT = 5
+
+
+class SignatureSubscriber:
+    """
+    Subscriber of the signature hub which receives signatures in the queue.
+
+    If subscriber doesn't read the queue and it is overflowed, subscriber is
+    closed by None in the queue and should resume from the last cursor.
+    """
+
+    def __init__(self, loop: AbstractEventLoop):
+        self.loop = loop
+        self.queue = Queue()
+        self.is_closed = False
+
+    def put_signatures(self, signatures: list):
+        if self.is_closed:
+            return
+
+        if self.queue.qsize() + len(signatures) > SIGNATURE_STREAM_QUEUE_SIZE:
+            self.close()
+
+            return
+
+        for signature in signatures:
+            self.queue.put_nowait(signature)
+
+    def close(self):
+        self.is_closed = True
+        self.queue.put_nowait(None)
+
+
+class SignatureHub:
+    """
+    In-process fan-out of created signatures.
+
+    One thread listens to notifications of the database and fetches new
+    signatures once, then they are sent to all subscribers of the process.
+    Cursor of the hub is moved only by the signature feed, which ids are
+    committed in order, so a signature committed later than the next one
+    isn't skipped.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._subscribers = set()
+        self._listener = None
+        self._cursor = None
+        self._is_ready = Event()
+
+    def subscribe(self) -> SignatureSubscriber:
+        subscriber = SignatureSubscriber(get_running_loop())
+
+        with self._lock:
+            self._subscribers.add(subscriber)
+
+            if self._listener is None and connection.vendor == 'postgresql':
+                self._listener = Thread(
+                    target=self._listen,
+                    name='signature-hub',
+                    daemon=True,
+                )
+                self._listener.start()
+
+        return subscriber
+
+    def wait_ready(self) -> bool:
+        """
+        Waits until hub starts to listen notifications. Signatures created
+        after that are sent by the hub, and previous ones should be fetched
+        from the signature feed.
+        """
+
+        if self._listener is None:
+            return False
+
+        return self._is_ready.wait(DEFAULT_LISTEN_TIMEOUT)
+
+    def unsubscribe(self, subscriber: SignatureSubscriber):
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+    def publish(self, signatures: list):
+        """
+        Sends signatures to all subscribers in their event loops
+
+        :param signatures: signatures in format of the signature feed
+        """
+
+        if not signatures:
+            return
+
+        with self._lock:
+            subscribers = tuple(self._subscribers)
+
+        for subscriber in subscribers:
+            try:
+                subscriber.loop.call_soon_threadsafe(
+                    subscriber.put_signatures,
+                    signatures,
+                )
+            except RuntimeError:
+                # Loop of subscriber is closed, so nobody reads its queue
+                self.unsubscribe(subscriber)
+
+    def _fetch_new_signatures(self):
+        close_old_connections()
+
+        if self._cursor is None:
+            # Entries which aren't committed yet get greater ids
+            self._cursor = SignatureFeedEntry.objects \
+                .order_by('-id') \
+                .values_list('id', flat=True) \
+                .first() or 0
+
+            self._is_ready.set()
+
+        while 1:
+            signatures = SignatureFeedEntry.get_feed(
+                cursor=self._cursor,
+                limit=SIGNATURE_FEED_PAGE_SIZE,
+            )
+
+            if not signatures:
+                break
+
+            self._cursor = signatures[-1]['cursor']
+            self.publish(signatures)
+
+    def _listen(self):
+        while 1:
+            listen_connection = None
+
+            try:
+                listen_connection = psycopg2_connect(
+                    **connection.get_connection_params()
+                )
+                listen_connection.set_isolation_level(
+                    ISOLATION_LEVEL_AUTOCOMMIT
+                )
+                listen_connection.cursor().execute(
+                    f'LISTEN {SIGNATURE_STREAM_CHANNEL};'
+                )
+
+                info(
+                    TRADE_INFO.format(
+                        'Signature hub listens to '
+                        f'\"{SIGNATURE_STREAM_CHANNEL}\" channel.'
+                    )
+                )
+
+                # Signatures created while hub wasn't listening
+                self._fetch_new_signatures()
+
+                while 1:
+                    if not select(
+                        (listen_connection,), (), (), DEFAULT_LISTEN_TIMEOUT
+                    )[0]:
+                        continue
+
+                    listen_connection.poll()
+
+                    if listen_connection.notifies:
+                        # Several notifications are served by one fetch
+                        listen_connection.notifies.clear()
+                        self._fetch_new_signatures()
+            except Exception as exception_error:
+                # Subscribers wait for the hub, so it reconnects after any
+                # error instead of stopping the thread
+                exception(TRADE_ERROR.format(exception_error))
+            finally:
+                if listen_connection is not None:
+                    listen_connection.close()
+
+            sleep(DEFAULT_RECONNECT_TIMEOUT)
+
+
+signature_hub = SignatureHub()
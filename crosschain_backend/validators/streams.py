@@ -0,0 +1,178 @@
+from asyncio import FIRST_COMPLETED, ensure_future, wait
+from json import dumps
+from urllib.parse import parse_qs
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
+from .models import SignatureFeedEntry
+from .services.auth import is_signature_api_authorized
+from .services.hub import signature_hub
+
+SIGNATURE_FEED_PAGE_SIZE = settings.SIGNATURE_FEED_PAGE_SIZE
+SIGNATURE_STREAM_KEEPALIVE_INTERVAL = (
+    settings.SIGNATURE_STREAM_KEEPALIVE_INTERVAL
+)
+
+SIGNATURE_STREAM_PATH = '/api/validators/signatures/stream/'
+
+
+async def _send_response(send, status: int, body: bytes = b''):
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': [
+            (b'content-type', b'text/plain'),
+        ],
+    })
+    await send({
+        'type': 'http.response.body',
+        'body': body,
+    })
+
+
+async def _send_event(send, signature: dict):
+    payload = dumps(signature, separators=(',', ':'))
+
+    await send({
+        'type': 'http.response.body',
+        'body': (
+            f'id: {signature["cursor"]}\n'
+            f'event: signature\n'
+            f'data: {payload}\n\n'
+        ).encode(),
+        'more_body': True,
+    })
+
+
+async def _wait_disconnect(receive):
+    while 1:
+        message = await receive()
+
+        if message['type'] == 'http.disconnect':
+            return
+
+
+def _get_cursor(scope: dict, query_params: dict) -> int:
+    """
+    Returns cursor from which stream is resumed. Last-Event-ID header is
+    set by EventSource on reconnect and has priority over query param.
+    """
+
+    headers = dict(scope.get('headers', ()))
+    cursor = headers.get(b'last-event-id', b'').decode() \
+        or query_params.get('cursor', ('0',))[0]
+
+    return max(int(cursor), 0)
+
+
+async def signature_stream_application(scope, receive, send):
+    """
+    Server-sent events stream of created signatures.
+
+    Headers:
+    - Authorization - "Bearer <private password for signature API>"
+
+    Query params:
+    - cursor - cursor of the last received signature, 0 by default
+    """
+
+    query_params = parse_qs(scope.get('query_string', b'').decode())
+    headers = dict(scope.get('headers', ()))
+
+    if not is_signature_api_authorized(
+        headers.get(b'authorization', b'').decode('latin-1')
+    ):
+        await _send_response(send, 403, b'Invalid password.')
+
+        return
+
+    try:
+        cursor = _get_cursor(scope, query_params)
+    except ValueError:
+        await _send_response(send, 400, b'Invalid cursor.')
+
+        return
+
+    # Subscribes before fetching of the feed, so signatures created
+    # meanwhile are received by the subscriber and aren't lost
+    subscriber = signature_hub.subscribe()
+
+    try:
+        await sync_to_async(
+            signature_hub.wait_ready,
+            thread_sensitive=False,
+        )()
+
+        await send({
+            'type': 'http.response.start',
+            'status': 200,
+            'headers': [
+                (b'content-type', b'text/event-stream'),
+                (b'cache-control', b'no-cache'),
+                (b'x-accel-buffering', b'no'),
+            ],
+        })
+
+        while 1:
+            signatures = await sync_to_async(SignatureFeedEntry.get_feed)(
+                cursor=cursor,
+                limit=SIGNATURE_FEED_PAGE_SIZE,
+            )
+
+            if not signatures:
+                break
+
+            for signature in signatures:
+                await _send_event(send, signature)
+
+            cursor = signatures[-1]['cursor']
+
+        disconnect = ensure_future(_wait_disconnect(receive))
+
+        while 1:
+            next_signature = ensure_future(subscriber.queue.get())
+
+            await wait(
+                (disconnect, next_signature),
+                timeout=SIGNATURE_STREAM_KEEPALIVE_INTERVAL,
+                return_when=FIRST_COMPLETED,
+            )
+
+            if disconnect.done():
+                next_signature.cancel()
+
+                return
+
+            if not next_signature.done():
+                next_signature.cancel()
+
+                await send({
+                    'type': 'http.response.body',
+                    'body': b': keepalive\n\n',
+                    'more_body': True,
+                })
+
+                continue
+
+            signature = next_signature.result()
+
+            # Subscriber is overflowed, client should reconnect with cursor
+            if signature is None:
+                break
+
+            if signature['cursor'] <= cursor:
+                continue
+
+            await _send_event(send, signature)
+
+            cursor = signature['cursor']
+
+        disconnect.cancel()
+
+        await send({
+            'type': 'http.response.body',
+            'body': b'',
+        })
+    finally:
+        signature_hub.unsubscribe(subscriber)
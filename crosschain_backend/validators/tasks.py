@@ -4,7 +4,8 @@ from django.db import transaction
 
 from crosschain_backend.celery import app as celery_app
 from .models import ValidatorSwap
-from .services.functions import process_swap
+from .services.archive import archive_swaps
+from .services.functions import process_swap, reconcile_swaps
 
 
 @celery_app.task
@@ -23,12 +24,33 @@ def update_swaps_task():
     """
 
     try:
-        for swap in ValidatorSwap.displayed_objects.exclude(
-                status__in=(
-                    ValidatorSwap.STATUS_SUCCESS,
-                    ValidatorSwap.STATUS_SIGNATURE_SEND,
-                ),
-        ):
-            process_swap_task.delay(swap.id)
+        for swap_id in ValidatorSwap.displayed_objects \
+                .filter(status=ValidatorSwap.STATUS_SIGNATURE_CREATED) \
+                .values_list('id', flat=True):
+            process_swap_task.delay(swap_id)
+    except Exception as exception_error:
+        exception(exception_error)
+
+
+@celery_app.task
+def reconcile_swaps_task():
+    """
+    Checks pending swaps in target contracts by batches
+    """
+
+    try:
+        reconcile_swaps()
+    except Exception as exception_error:
+        exception(exception_error)
+
+
+@celery_app.task
+def archive_swaps_task():
+    """
+    Moves finished swaps to the archive
+    """
+
+    try:
+        archive_swaps()
     except Exception as exception_error:
         exception(exception_error)
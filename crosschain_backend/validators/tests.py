@@ -1,7 +1,32 @@
+from datetime import timedelta
+from unittest import skipUnless
+from asyncio import new_event_loop
+from unittest.mock import MagicMock, patch
+
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from web3.datastructures import AttributeDict
+from web3.types import HexBytes
+
 from base.tests import BaseTestCase
 from contracts.models import Contract
-from networks.models import Network, CustomRpcProvider
-from .models import ValidatorSwap
+from contracts.services.scanners.handlers import (
+    complete_swaps_handler,
+    revert_swaps_handler,
+)
+from networks.models import Network, CustomRpcProvider, Transaction
+from .models import SignatureFeedEntry, SwapParams, ValidatorSwap
+from .services.archive import ARCHIVE_TABLE, archive_swaps, is_swap_archived
+from .services.functions import process_swap, reconcile_swaps
+from .services.hub import SignatureHub, SignatureSubscriber
+from .streams import signature_stream_application
+
+SIGNATURE_API_PASSWORD = 'signature-api-password'
 
 
 class ValidatorTestCase(BaseTestCase):
@@ -70,3 +95,529 @@ class ValidatorTestCase(BaseTestCase):
             ValidatorSwap.STATUS_SIGNATURE_SEND,
             "signature wasn't send",
         )
+
+    def test_update_swaps_status_by_completion_events(self):
+        contract = Contract.get_contract_by_blockchain_id(1)
+        reverted_transaction_hash = (
+            '0x6e4f5fd5c15aa33d2ee4e07aa3a1ea4f1d8d3fdc4f0bba8c6a1e3e2c8b3d0a11'
+        )
+
+        for txn_hash in (self.transaction_hash, reverted_transaction_hash):
+            ValidatorSwap.objects.create(
+                contract=contract,
+                transaction=Transaction.objects.create(
+                    network=contract.network,
+                    hash=txn_hash,
+                ),
+                status=ValidatorSwap.STATUS_SIGNATURE_SEND,
+            )
+
+        complete_swaps_handler(
+            rpc_provider=None,
+            contract=contract,
+            events=[
+                AttributeDict({
+                    'args': AttributeDict({
+                        'originalTxHash': HexBytes(self.transaction_hash),
+                    }),
+                }),
+            ],
+        )
+        revert_swaps_handler(
+            rpc_provider=None,
+            contract=contract,
+            events=[
+                AttributeDict({
+                    'args': AttributeDict({
+                        'originalTxHash': HexBytes(reverted_transaction_hash),
+                    }),
+                }),
+            ],
+        )
+
+        self.assertEqual(
+            ValidatorSwap.objects.get(
+                transaction__hash=self.transaction_hash,
+            ).status,
+            ValidatorSwap.STATUS_SUCCESS,
+            "completion event doesn't mark swap as successful",
+        )
+        self.assertEqual(
+            ValidatorSwap.objects.get(
+                transaction__hash=reverted_transaction_hash,
+            ).status,
+            ValidatorSwap.STATUS_REVERTED,
+            "refund event doesn't mark swap as reverted",
+        )
+
+    def test_set_swaps_statuses(self):
+        contract = Contract.get_contract_by_blockchain_id(1)
+        validator_swap = ValidatorSwap.objects.create(
+            contract=contract,
+            transaction=Transaction.objects.create(
+                network=contract.network,
+                hash=self.transaction_hash,
+            ),
+        )
+
+        updated_swaps_count = ValidatorSwap.set_swaps_statuses(
+            {
+                ValidatorSwap.STATUS_SUCCESS: [],
+                ValidatorSwap.STATUS_REVERTED: [validator_swap.id],
+            }
+        )
+        validator_swap.refresh_from_db()
+
+        self.assertEqual(
+            (updated_swaps_count, validator_swap.status),
+            (1, ValidatorSwap.STATUS_REVERTED),
+            "set_swaps_statuses doesn't update swaps statuses",
+        )
+
+    @override_settings(
+        PRIVATE_PASSWORD_FOR_SIGNATURE_API=SIGNATURE_API_PASSWORD,
+    )
+    def test_signature_feed(self):
+        contract = Contract.get_contract_by_blockchain_id(1)
+        validator_swap = ValidatorSwap.objects.create(
+            contract=contract,
+            transaction=Transaction.objects.create(
+                network=contract.network,
+                hash=self.transaction_hash,
+                event_data=self.event_data,
+            ),
+        )
+
+        validator_swap.set_signature(self.signature)
+
+        cursor = SignatureFeedEntry.objects.get(
+            validator_swap=validator_swap,
+        ).id
+        response = self.client.get(
+            reverse('signature-feed'),
+            {
+                'cursor': cursor - 1,
+                'timeout': 0,
+            },
+            HTTP_AUTHORIZATION=f'Bearer {SIGNATURE_API_PASSWORD}',
+        )
+
+        self.assertEqual(
+            response.json(),
+            {
+                'validatorName': settings.VALIDATOR_NAME,
+                'cursor': cursor,
+                'signatures': [
+                    {
+                        'cursor': cursor,
+                        'signature': self.signature,
+                        'fromContractNum': contract.blockchain_id,
+                        'fromTxHash': self.transaction_hash,
+                        'eventName': self.event_data['event'],
+                    },
+                ],
+            },
+            "signature feed doesn't return created signature",
+        )
+
+        response = self.client.get(
+            reverse('signature-feed'),
+            {
+                'cursor': cursor,
+                'timeout': 0,
+            },
+            HTTP_IF_NONE_MATCH=f'"{cursor}-{cursor}"',
+            HTTP_AUTHORIZATION=f'Bearer {SIGNATURE_API_PASSWORD}',
+        )
+
+        self.assertEqual(
+            response.status_code,
+            304,
+            "signature feed doesn't return not modified response",
+        )
+
+    def test_signature_feed_authorization(self):
+        def get_status_code(password: str, **headers) -> int:
+            with override_settings(
+                PRIVATE_PASSWORD_FOR_SIGNATURE_API=password,
+            ):
+                return self.client.get(
+                    reverse('signature-feed'),
+                    {
+                        'password': password,
+                        'timeout': 0,
+                    },
+                    **headers,
+                ).status_code
+
+        self.assertEqual(
+            (
+                get_status_code(SIGNATURE_API_PASSWORD),
+                get_status_code(
+                    SIGNATURE_API_PASSWORD,
+                    HTTP_AUTHORIZATION='Bearer wrong-password',
+                ),
+                get_status_code('', HTTP_AUTHORIZATION='Bearer '),
+                get_status_code(
+                    SIGNATURE_API_PASSWORD,
+                    HTTP_AUTHORIZATION=f'Bearer {SIGNATURE_API_PASSWORD}',
+                ),
+            ),
+            (403, 403, 403, 200),
+            'signature feed is authorized without password in header',
+        )
+
+    @skipUnless(
+        connection.vendor == 'postgresql',
+        'feed entries are ordered by advisory lock of PostgreSQL',
+    )
+    def test_signature_feed_commit_order(self):
+        contract = Contract.get_contract_by_blockchain_id(1)
+        validator_swap = ValidatorSwap.objects.create(
+            contract=contract,
+            transaction=Transaction.objects.create(
+                network=contract.network,
+                hash=self.transaction_hash,
+                event_data=self.event_data,
+            ),
+        )
+
+        with CaptureQueriesContext(connection) as context:
+            validator_swap.set_signature(self.signature)
+
+        queries = [query['sql'] for query in context.captured_queries]
+        lock_index = next(
+            index
+            for index, query in enumerate(queries)
+            if 'pg_advisory_xact_lock' in query
+        )
+        insert_index = next(
+            index
+            for index, query in enumerate(queries)
+            if query.startswith(
+                f'INSERT INTO "{SignatureFeedEntry._meta.db_table}"'
+            )
+        )
+
+        self.assertEqual(
+            lock_index < insert_index,
+            True,
+            "feed entry is inserted without lock, so cursor may skip it",
+        )
+
+    @override_settings(
+        PRIVATE_PASSWORD_FOR_SIGNATURE_API=SIGNATURE_API_PASSWORD,
+    )
+    def test_signature_stream(self):
+        contract = Contract.get_contract_by_blockchain_id(1)
+        validator_swap = ValidatorSwap.objects.create(
+            contract=contract,
+            transaction=Transaction.objects.create(
+                network=contract.network,
+                hash=self.transaction_hash,
+                event_data=self.event_data,
+            ),
+        )
+
+        validator_swap.set_signature(self.signature)
+
+        cursor = SignatureFeedEntry.objects.get(
+            validator_swap=validator_swap,
+        ).id
+        messages = []
+
+        async def receive():
+            return {'type': 'http.disconnect'}
+
+        async def send(message):
+            messages.append(message)
+
+        async_to_sync(signature_stream_application)(
+            {
+                'type': 'http',
+                'path': '/api/validators/signatures/stream/',
+                'query_string': b'',
+                'headers': [
+                    (b'last-event-id', str(cursor - 1).encode()),
+                    (
+                        b'authorization',
+                        f'Bearer {SIGNATURE_API_PASSWORD}'.encode(),
+                    ),
+                ],
+            },
+            receive,
+            send,
+        )
+
+        unauthorized_messages = []
+
+        async def send_unauthorized(message):
+            unauthorized_messages.append(message)
+
+        # Password of query string isn't accepted
+        async_to_sync(signature_stream_application)(
+            {
+                'type': 'http',
+                'path': '/api/validators/signatures/stream/',
+                'query_string': f'password={SIGNATURE_API_PASSWORD}'.encode(),
+                'headers': [],
+            },
+            receive,
+            send_unauthorized,
+        )
+
+        self.assertEqual(
+            (
+                messages[0]['status'],
+                messages[1]['body'].split(b'\n')[0],
+                unauthorized_messages[0]['status'],
+            ),
+            (200, f'id: {cursor}'.encode(), 403),
+            "signature stream doesn't resume from the cursor or is "
+            "authorized without password in header",
+        )
+
+    def test_signature_hub_errors(self):
+        class Stop(BaseException):
+            pass
+
+        signature_hub = SignatureHub()
+        closed_loop = new_event_loop()
+        closed_loop.close()
+        closed_subscriber = SignatureSubscriber(closed_loop)
+        subscriber = SignatureSubscriber(MagicMock())
+        signature_hub._subscribers.update((closed_subscriber, subscriber))
+
+        # Subscriber of closed loop doesn't break publishing to others
+        signature_hub.publish([{'cursor': 1}])
+
+        listen_connection = MagicMock()
+
+        with patch(
+            'validators.services.hub.psycopg2_connect',
+            return_value=listen_connection,
+        ), patch.object(
+            signature_hub,
+            '_fetch_new_signatures',
+            side_effect=ValueError('Unexpected error.'),
+        ), patch(
+            'validators.services.hub.sleep',
+            side_effect=Stop,
+        ), self.assertRaises(Stop):
+            signature_hub._listen()
+
+        self.assertEqual(
+            (
+                signature_hub._subscribers,
+                subscriber.loop.call_soon_threadsafe.call_count,
+                listen_connection.close.call_count,
+            ),
+            ({subscriber}, 1, 1),
+            'signature hub is stopped by error or keeps connection open',
+        )
+
+    def test_signature_hub_cursor(self):
+        contract = Contract.get_contract_by_blockchain_id(1)
+
+        for transaction_hash in (self.transaction_hash, '0x' + 'ab' * 32):
+            ValidatorSwap.objects.create(
+                contract=contract,
+                transaction=Transaction.objects.create(
+                    network=contract.network,
+                    hash=transaction_hash,
+                    event_data=self.event_data,
+                ),
+            ).set_signature(self.signature)
+
+        cursors = list(
+            SignatureFeedEntry.objects
+            .order_by('id')
+            .values_list('id', flat=True)
+        )
+        signature_hub = SignatureHub()
+        signature_hub._cursor = cursors[0] - 1
+
+        with patch.object(signature_hub, 'publish') as publish:
+            signature_hub._fetch_new_signatures()
+
+        self.assertEqual(
+            (
+                [
+                    signature['cursor']
+                    for call in publish.call_args_list
+                    for signature in call.args[0]
+                ],
+                signature_hub._cursor,
+            ),
+            (cursors, cursors[-1]),
+            "signature hub doesn't move its cursor by the feed",
+        )
+
+    def test_pending_swaps_query_plan(self):
+        self.assertIn(
+            'validator_swaps_pending_idx',
+            self.get_query_plan(
+                ValidatorSwap.displayed_objects
+                .filter(status=ValidatorSwap.STATUS_SIGNATURE_CREATED)
+                .values_list('id', flat=True)
+            ),
+            "pending swaps aren't selected by the partial index",
+        )
+
+    def test_get_or_create_swap_params(self):
+        contract = Contract.get_contract_by_blockchain_id(1)
+        new_address = '0x' + '00' * 12 + '70e8c8139d1cef162d5ba3b286380eb5913098c4'
+        transaction = Transaction.objects.create(
+            network=contract.network,
+            hash=self.transaction_hash,
+            data={
+                'params': [
+                    2,
+                    100,
+                    '0x70e8C8139d1ceF162D5ba3B286380EB5913098c4',
+                    [new_address],
+                    1,
+                    5,
+                    new_address,
+                    True,
+                    False,
+                    'swapExactTokensForTokens',
+                ],
+            },
+            event_data=self.event_data,
+        )
+
+        swap_params = SwapParams.get_or_create_swap_params(
+            transaction=transaction,
+        )
+
+        self.assertEqual(
+            (
+                SwapParams.objects
+                .filter(target_blockchain_id=2)
+                .values_list('id', flat=True)
+                .get(),
+                swap_params.transit_token_amount_in,
+                swap_params.swap_exact_for,
+                swap_params.contract_function,
+            ),
+            (
+                swap_params.id,
+                self.event_data['args']['RBCAmountIn'],
+                False,
+                'swapExactTokensForTokens',
+            ),
+            "get_or_create_swap_params doesn't save typed params of swap",
+        )
+
+    def test_reconcile_swaps_failed_chunk(self):
+        contract = Contract.get_contract_by_blockchain_id(1)
+
+        for i in range(2):
+            SwapParams.objects.create(
+                transaction=ValidatorSwap.objects.create(
+                    contract=contract,
+                    transaction=Transaction.objects.create(
+                        network=contract.network,
+                        hash=f'0x{i:064x}',
+                    ),
+                ).transaction,
+                target_blockchain_id=2,
+                new_address=self.event_data['address'],
+                second_path=[],
+                token_out_min=0,
+                transit_token_amount_in=0,
+                amount_spent=0,
+                swap_to_crypto=False,
+                contract_function='swapExactTokensForTokens',
+            )
+
+        with patch(
+            'validators.services.functions.RECONCILIATION_CHUNK_SIZE',
+            1,
+        ), patch(
+            'validators.services.functions._reconcile_swaps_chunk',
+            side_effect=[ValueError('Node is unavailable.'), 1],
+        ) as reconcile_swaps_chunk:
+            reconcile_swaps()
+
+        self.assertEqual(
+            reconcile_swaps_chunk.call_count,
+            2,
+            'failed chunk stops reconciliation of other chunks',
+        )
+
+    def test_process_swap_without_swap_params(self):
+        contract = Contract.get_contract_by_blockchain_id(1)
+        validator_swap = ValidatorSwap.objects.create(
+            contract=contract,
+            transaction=Transaction.objects.create(
+                network=contract.network,
+                hash=self.transaction_hash,
+            ),
+            status=ValidatorSwap.STATUS_SIGNATURE_CREATED,
+        )
+
+        with patch.object(
+            ValidatorSwap,
+            'send_signature_to_relayer',
+        ) as send_signature_to_relayer:
+            process_swap(validator_swap.id)
+
+        self.assertEqual(
+            (send_signature_to_relayer.called, SwapParams.objects.count()),
+            (False, 0),
+            'process_swap sent signature of swap which params are unknown',
+        )
+
+    @skipUnless(
+        connection.vendor == 'postgresql',
+        'archive is partitioned table of PostgreSQL',
+    )
+    def test_archive_swaps(self):
+        contract = Contract.get_contract_by_blockchain_id(1)
+        archived_swap, pending_swap = (
+            ValidatorSwap.objects.create(
+                contract=contract,
+                transaction=Transaction.objects.create(
+                    network=contract.network,
+                    hash=f'{self.transaction_hash[:-1]}{block_number}',
+                    block_number=block_number,
+                ),
+                status=status,
+            )
+            for block_number, status in (
+                (1, ValidatorSwap.STATUS_SUCCESS),
+                (2, ValidatorSwap.STATUS_SIGNATURE_CREATED),
+            )
+        )
+
+        ValidatorSwap.objects.update(
+            _created_at=timezone.now() - timedelta(days=365),
+        )
+        archive_swaps()
+
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT "id" FROM "{ARCHIVE_TABLE}";')
+            archived_swap_ids = [swap_id for swap_id, in cursor.fetchall()]
+
+        self.assertEqual(
+            (
+                archived_swap_ids,
+                list(ValidatorSwap.objects.values_list('id', flat=True)),
+                Transaction.objects.filter(
+                    id=archived_swap.transaction_id,
+                ).exists(),
+                is_swap_archived(
+                    network_id=contract.network_id,
+                    txn_hash=archived_swap.transaction.hash,
+                ),
+                is_swap_archived(
+                    network_id=contract.network_id,
+                    txn_hash=pending_swap.transaction.hash,
+                ),
+            ),
+            ([archived_swap.id], [pending_swap.id], False, True, False),
+            "archive_swaps doesn't move finished swaps to the archive or "
+            "they can be created again",
+        )
@@ -0,0 +1,8 @@
+from django.urls import path
+
+from .views import signature_feed_view
+
+
+urlpatterns = [
+    path('signatures/', signature_feed_view, name='signature-feed'),
+]
@@ -0,0 +1,94 @@
+from asyncio import sleep
+from time import monotonic
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import (
+    HttpResponseNotAllowed,
+    HttpResponseNotModified,
+    JsonResponse,
+)
+
+from base.support_functions.singleflight import AsyncSingleFlight
+
+from .models import SignatureFeedEntry
+from .services.auth import is_signature_api_authorized
+
+SIGNATURE_FEED_PAGE_SIZE = settings.SIGNATURE_FEED_PAGE_SIZE
+SIGNATURE_FEED_LONG_POLL_TIMEOUT = settings.SIGNATURE_FEED_LONG_POLL_TIMEOUT
+SIGNATURE_FEED_POLL_INTERVAL = settings.SIGNATURE_FEED_POLL_INTERVAL
+
+# Relayers poll with the same cursor, so they share one query of the feed
+signature_feed_flight = AsyncSingleFlight()
+
+
+async def signature_feed_view(request):
+    """
+    Returns signatures created after the cursor. If there are no new
+    signatures, waits for them until the timeout.
+
+    Headers:
+    - Authorization - "Bearer <private password for signature API>"
+
+    Query params:
+    - cursor - cursor of the last received signature, 0 by default
+    - limit - max count of returned signatures
+    - timeout - max seconds of waiting for new signatures
+    """
+
+    # require_GET decorator isn't async-aware in current Django version
+    if request.method != 'GET':
+        return HttpResponseNotAllowed(('GET',))
+
+    if not is_signature_api_authorized(request.headers.get('Authorization')):
+        return JsonResponse({'detail': 'Invalid password.'}, status=403)
+
+    try:
+        cursor = max(int(request.GET.get('cursor', 0)), 0)
+        limit = min(
+            int(request.GET.get('limit', SIGNATURE_FEED_PAGE_SIZE)),
+            SIGNATURE_FEED_PAGE_SIZE,
+        )
+        timeout = min(
+            float(request.GET.get('timeout', SIGNATURE_FEED_LONG_POLL_TIMEOUT)),
+            SIGNATURE_FEED_LONG_POLL_TIMEOUT,
+        )
+    except ValueError:
+        return JsonResponse({'detail': 'Invalid query params.'}, status=400)
+
+    deadline = monotonic() + timeout
+
+    while 1:
+        signatures = await signature_feed_flight.do(
+            (cursor, max(limit, 1)),
+            sync_to_async(SignatureFeedEntry.get_feed),
+            cursor=cursor,
+            limit=max(limit, 1),
+        )
+
+        if signatures or monotonic() >= deadline:
+            break
+
+        await sleep(SIGNATURE_FEED_POLL_INTERVAL)
+
+    next_cursor = signatures[-1]['cursor'] if signatures else cursor
+
+    # Feed entries are never changed, so the page is identified by it's bounds
+    etag = f'"{cursor}-{next_cursor}"'
+
+    if request.headers.get('If-None-Match') == etag:
+        response = HttpResponseNotModified()
+    else:
+        response = JsonResponse(
+            {
+                'validatorName': settings.VALIDATOR_NAME,
+                'cursor': next_cursor,
+                'signatures': signatures,
+            },
+            json_dumps_params={'separators': (',', ':')},
+        )
+
+    response['ETag'] = etag
+    response['Cache-Control'] = 'no-cache'
+
+    return response
@@ -2,8 +2,27 @@
 
 python manage.py makemigrations --no-input
 
+# Converts data of columns which types can't be casted by migration
+python manage.py convert_hex_columns
+
+# Copies ABIs of contracts before their column is dropped by migration
+python manage.py move_contract_abis
+
 python manage.py migrate --no-input
 
+# Links contracts to ABIs stored once per content
+python manage.py move_contract_abis
+
+python manage.py fill_swap_params
+
+python manage.py create_archive_partitions
+
+# Scanners of contracts are started by their rows
+python manage.py create_contract_scanners
+
+# Compiled ABIs are shared by scanners and workers through the code volume
+python manage.py compile_abis
+
 python manage.py collectstatic --force
 
 # RUN WSGI
@@ -1,3 +1,18 @@
 #! /bin/bash
 
-exec celery --app crosschain_backend worker --loglevel=DEBUG -E --logfile=celery.log
+# Worker doesn't serve HTTP requests, so web applications aren't loaded
+export DJANGO_SETTINGS_MODULE="${DJANGO_SETTINGS_MODULE:-crosschain_backend.settings.pipeline}"
+
+# Tasks mostly wait for RPC nodes, relayer and database, so in gevent mode
+# they are run by greenlets of one process instead of forked processes
+if [ "${GEVENT_SUPPORT:-0}" = "1" ]; then
+    POOL_OPTIONS="-P gevent -c ${CELERY_IO_CONCURRENCY:-30}"
+else
+    POOL_OPTIONS="-P prefork -c ${CELERY_CONCURRENCY:-4}"
+fi
+
+exec celery --app crosschain_backend worker --loglevel=DEBUG -E \
+    -Q "${CELERY_WORKER_QUEUES:-high,middle,low}" \
+    -n "${CELERY_WORKER_NAME:-celery@%h}" \
+    ${POOL_OPTIONS} \
+    --logfile="${CELERY_LOGFILE:-celery.log}"